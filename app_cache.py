@@ -0,0 +1,66 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """프로세스 전체(모든 세션)가 공유하는 크기 제한 LRU 캐시"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        # Streamlit은 세션마다 스레드를 따로 쓰므로 잠금이 필요함
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """값을 찾으면 가장 최근 사용으로 옮기고 반환, 없으면 default 반환"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """값을 저장하고, 최대 개수를 넘으면 가장 오래 쓰지 않은 항목을 제거"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        """캐시에 없을 때만 factory()를 호출하여 값을 만들고 저장"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def stats(self):
+        """적중/실패 횟수와 현재 크기를 딕셔너리로 반환"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_MISSING = object()
@@ -0,0 +1,98 @@
+import numpy as np
+
+# 분모가 이 값(분모 크기 대비 비율)보다 작으면 근으로 인정
+ROOT_TOLERANCE = 1e-9
+
+_GOLDEN = (np.sqrt(5) - 1) / 2
+
+
+def _evaluate(f, x_vals):
+    with np.errstate(all='ignore'):
+        return np.asarray(f(x_vals), dtype=float)
+
+
+def bisect_roots(f, lo, hi, max_iter=100):
+    """부호가 바뀌는 모든 구간 [lo, hi]를 한꺼번에 이분법으로 좁혀 근을 기계 정밀도까지 구함"""
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    f_lo = _evaluate(f, lo)
+    for _ in range(max_iter):
+        mid = (lo + hi) / 2
+        # 더 이상 나눌 수 없으면(부동소수점 한계) 종료
+        if not np.any((mid != lo) & (mid != hi)):
+            break
+        f_mid = _evaluate(f, mid)
+        left = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(left, mid, lo)
+        f_lo = np.where(left, f_mid, f_lo)
+        hi = np.where(left, hi, mid)
+    return (lo + hi) / 2
+
+
+def minimize_abs(f, lo, hi, max_iter=100):
+    """|f|의 극소점을 여러 구간에서 한꺼번에 황금분할 탐색으로 구함 (부호가 바뀌지 않는 중근용)"""
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    for _ in range(max_iter):
+        a = hi - _GOLDEN * (hi - lo)
+        b = lo + _GOLDEN * (hi - lo)
+        left = np.abs(_evaluate(f, a)) < np.abs(_evaluate(f, b))
+        hi = np.where(left, b, hi)
+        lo = np.where(left, lo, a)
+    return (lo + hi) / 2
+
+
+def _is_removable(numerator, denominator, roots, scale):
+    """근에서 |f|가 발산하지 않으면(가까이 갈수록 커지지 않으면) 제거 가능한 불연속점(구멍)"""
+    h = 1e-4 * scale
+    f = lambda x_vals: _evaluate(numerator, x_vals) / _evaluate(denominator, x_vals)
+    near = np.maximum(np.abs(f(roots - h)), np.abs(f(roots + h)))
+    nearer = np.maximum(np.abs(f(roots - h / 10)), np.abs(f(roots + h / 10)))
+    return np.isfinite(nearer) & (nearer < 5 * near + 1e-12)
+
+
+def find_vertical_asymptotes(numerator, denominator, x_min, x_max, num_samples=2000):
+    """분모 Q(x)=0 인 점을 모두 찾아 수직 점근선(극)과 구멍으로 나누어 반환
+
+    numerator, denominator는 x 배열을 받는 NumPy 함수이며 np.sin 등 임의의 식이어도 됩니다.
+    반환값: {"poles": 수직 점근선 x 배열, "holes": 구멍 x 배열}
+    """
+    x_vals = np.linspace(x_min, x_max, num_samples)
+    q_vals = _evaluate(denominator, x_vals)
+    finite = np.isfinite(q_vals)
+    q_scale = np.max(np.abs(q_vals[finite]), initial=1.0)
+
+    # (1) 격자점에서 정확히 0인 곳
+    exact = x_vals[q_vals == 0]
+
+    # (2) 부호가 바뀌는 구간 -> 이분법으로 정밀화
+    signs = np.sign(q_vals)
+    crossing = np.flatnonzero((signs[:-1] * signs[1:] < 0) & finite[:-1] & finite[1:])
+    crossed = bisect_roots(denominator, x_vals[crossing], x_vals[crossing + 1])
+
+    # (3) 부호는 그대로지만 |Q|가 극소인 곳 (x^2 같은 중근) -> 황금분할 탐색
+    abs_q = np.abs(q_vals)
+    interior = np.arange(1, num_samples - 1)
+    local_min = interior[
+        (abs_q[1:-1] <= abs_q[:-2]) & (abs_q[1:-1] <= abs_q[2:]) & (abs_q[1:-1] > 0)
+        & (signs[:-2] == signs[1:-1]) & (signs[1:-1] == signs[2:])
+    ]
+    touched = minimize_abs(denominator, x_vals[local_min - 1], x_vals[local_min + 1])
+
+    roots = np.concatenate([exact, crossed, touched])
+    if roots.size == 0:
+        return {"poles": roots, "holes": roots}
+
+    # 분모가 실제로 0에 가까운 것만 근으로 인정 (tan(x)처럼 발산하며 부호가 바뀌는 경우 제외)
+    roots = roots[np.abs(_evaluate(denominator, roots)) <= ROOT_TOLERANCE * q_scale]
+    roots = np.unique(roots)
+    if roots.size > 1:
+        # 서로 다른 구간에서 같은 근으로 수렴한 경우 하나로 합침
+        keep = np.concatenate([[True], np.diff(roots) > 1e-9 * max(1.0, x_max - x_min)])
+        roots = roots[keep]
+
+    # 0 근처로 수렴한 아주 작은 값(1e-33 등)은 0으로 맞춤
+    roots = np.where(np.abs(roots) < 1e-12 * max(1.0, x_max - x_min), 0.0, roots)
+
+    removable = _is_removable(numerator, denominator, roots, max(1.0, x_max - x_min))
+    return {"poles": roots[~removable], "holes": roots[removable]}
@@ -0,0 +1,538 @@
+"""페이지별 핵심 경로 벤치마크 (Streamlit 서버 없이 실행)
+
+고정된 시드와 입력으로 로또 생성/비교, 유리식 파서, 그래프 샘플링/렌더링, 06 페이지 분석,
+퀴즈 문제 생성, 채점을 재고, Streamlit AppTest로 페이지 전체 재실행 시간도 잽니다.
+결과는 JSON으로 저장하고 기준 결과(data/benchmark_baseline.json)와 비교해 느려진 항목을 표시합니다.
+기계마다(같은 기계라도 때마다) 속도가 다르므로 절대 시간이 아니라, 항목마다 바로 앞뒤에서 잰 고정 기준 작업
+(reference_workload) 시간에 대한 비율을 비교합니다. 각 항목과 기준 작업은 여러 번 잰 값 중 최솟값을 씁니다.
+
+    python benchmark.py                      # 전체 실행, 기준과 비교 (느려진 항목이 있으면 종료 코드 1)
+    python benchmark.py --only lotto parser  # 일부 그룹만
+    python benchmark.py --save-baseline      # 이번 결과를 새 기준으로 저장 (벤치마크를 추가하면 함께 갱신)
+    python benchmark.py --tolerance 1.0      # 기준 작업 대비 2배 이상 느려진 항목만 표시
+"""
+import argparse
+import ast
+import functools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent
+BASELINE_PATH = ROOT / "data" / "benchmark_baseline.json"
+RESULTS_PATH = ROOT / "benchmark_results.json"
+
+SEED = 0
+DEFAULT_REPEATS = 5
+# 전체 벤치마크를 몇 바퀴 돌며 잴지 (항목별 측정 횟수 = 바퀴 수 x 반복 횟수)
+DEFAULT_ROUNDS = 3
+# 기준 작업 대비 시간이 기준 결과보다 이 비율 이상 늘고, 차이가 MIN_DIFFERENCE초 이상이면 "느려짐"으로 표시
+# (같은 기계에서 같은 코드를 다시 재도 항목에 따라 30% 안팎 차이가 나므로 넉넉하게 잡음)
+DEFAULT_TOLERANCE = 0.5
+MIN_DIFFERENCE = 2e-3
+# 1ms보다 짧은 작업은 이 횟수만큼 반복해 한 번의 측정으로 삼음 (측정 잡음을 줄임)
+INNER_LOOPS = 50
+
+WINNING_NUMBERS = [3, 11, 19, 27, 35, 43]
+# 교과서 예제와 학생이 자주 입력하는 형태를 섞은 고정 입력
+RATIONAL_INPUTS = [
+    "(2*x + 1)/(x - 3)",
+    "1/x",
+    "(x^2 - 1)/(x - 1)",
+    "(3x+2)/(2x-4)",
+    "(x^2 + 1)/(x^2 - 4)",
+    "(x^3 - 2x)/(x^2 - 1)",
+    "2 - 3/(x+1)",
+    "(x+1)(x-1)/(x(x-2))",
+]
+PAGE_04_INPUTS = [("3", "x-2"), ("x^2-1", "x-1"), ("2x+1", "x^2-4")]
+
+BENCHMARKS = []
+
+
+def benchmark(group, repeats=None):
+    """BENCHMARKS에 (그룹, 이름, 함수, 반복 횟수)를 등록하는 데코레이터 (이름 = 함수 이름)"""
+    def register(fn):
+        BENCHMARKS.append((group, fn.__name__, fn, repeats))
+        return fn
+    return register
+
+
+def _rng():
+    return np.random.default_rng(SEED)
+
+
+def _clear_caches():
+    """캐시를 비워 캐시 실패(첫 방문자) 경로를 잼"""
+    from rational_analysis import ANALYSIS_CACHE
+    from rational_parser import PARSE_CACHE
+
+    PARSE_CACHE.clear()
+    ANALYSIS_CACHE.clear()
+
+
+# --- 1. 로또 ---
+@benchmark("lotto")
+def lotto_generate_1m():
+    from lotto_engine import generate_tickets
+
+    generate_tickets(1_000_000, _rng())
+
+
+@benchmark("lotto")
+def lotto_compare_1m():
+    from lotto_engine import count_matches, generate_tickets, match_histogram
+
+    match_histogram(count_matches(generate_tickets(1_000_000, _rng()), WINNING_NUMBERS))
+
+
+@benchmark("lotto")
+def lotto_simulate_10m():
+    from lotto_engine import simulate_match_histogram
+
+    simulate_match_histogram(10_000_000, WINNING_NUMBERS, _rng())
+
+
+@benchmark("lotto")
+def lotto_rank_1k_x_1195():
+    # 저장소에는 회차가 몇 개 없으므로 역대 회차 수만큼 임의의 당첨 번호(보너스 포함)를 만들어 비교
+    from lotto_engine import NUMBER_BITS, generate_ticket_masks, rank_counts, rank_matrix
+
+    rng = _rng()
+    draws = np.argsort(rng.random((1195, 45)), axis=1)[:, :7] + 1
+    winning_masks = np.bitwise_or.reduce(NUMBER_BITS[draws[:, :6]], axis=1)
+    rank_counts(rank_matrix(generate_ticket_masks(1_000, rng), winning_masks, NUMBER_BITS[draws[:, 6]]))
+
+
+# --- 2. 유리식 파서 ---
+@benchmark("parser")
+def parse_inputs_uncached():
+    from rational_parser import parse_rational
+
+    for _ in range(INNER_LOOPS):
+        _clear_caches()
+        for text in RATIONAL_INPUTS:
+            parse_rational(text)
+
+
+# --- 3. 그래프 (04 페이지, 교과서 04 페이지) ---
+def _page_04_chart(numerator, denominator):
+    """pages/04의 plot_rational_function과 같은 계산 (st 출력 제외)"""
+    from asymptotes import find_vertical_asymptotes
+    from chart_backend import add_line, add_vline, new_chart
+    from plot_sampling import adaptive_sample
+    from polynomial import numpy_rational_evaluator
+    from rational_parser import parse_rational
+
+    P = numpy_rational_evaluator(*parse_rational(numerator))
+    Q = numpy_rational_evaluator(*parse_rational(denominator))
+    x, y = adaptive_sample(lambda x_val: P(x_val) / Q(x_val), -10, 10, -10, 10, max_points=400)
+    chart = new_chart("y", y_range=(-10, 10))
+    add_line(chart, x, y, label="y")
+    for x_a in find_vertical_asymptotes(P, Q, -10, 10)["poles"]:
+        add_vline(chart, x_a, color='r')
+    return chart
+
+
+def _textbook_chart(func_str):
+    """교과서 04 페이지의 plot_rational_function과 같은 계산 (st 출력 제외)"""
+    from chart_backend import add_hline, add_line, add_vline, new_chart
+    from plot_sampling import adaptive_sample
+    from rational_analysis import analyze_rational_function
+
+    analysis = analyze_rational_function(func_str)
+    x, y = adaptive_sample(analysis["f_np"], -10, 10, -10, 10, max_points=500)
+    chart = new_chart(analysis["latex"], x_range=(-10, 10), y_range=(-10, 10))
+    add_line(chart, x, y, label="f")
+    for va in analysis["vertical_asymptotes"]:
+        add_vline(chart, va["value"])
+    if analysis["horizontal_asymptote"] is not None:
+        add_hline(chart, float(analysis["horizontal_asymptote"]))
+    return chart
+
+
+@benchmark("plot")
+def plot_lod_pan_zoom():
+    # 06 페이지에서 축을 옮기고 확대/축소하는 순서 (첫 범위만 타일을 모두 계산)
+    from plot_sampling import TILE_CACHE, lod_sample
+    from rational_analysis import analyze_rational_function
+
+    analysis = analyze_rational_function(RATIONAL_INPUTS[0])
+    TILE_CACHE.clear()
+    for x_min, x_max in [(-20, 20), (-15, 25), (-10, 30), (-20, 60), (-40, 40), (-10, 10), (-20, 20)]:
+        lod_sample(analysis["f_np"], analysis["latex"], x_min, x_max, -50, 50)
+
+
+@benchmark("plot")
+def plot_page_04_vega():
+    from chart_backend import to_vega_lite
+
+    _clear_caches()
+    for numerator, denominator in PAGE_04_INPUTS:
+        to_vega_lite(_page_04_chart(numerator, denominator))
+
+
+@benchmark("plot")
+def plot_page_04_png():
+    from chart_backend import render_png
+
+    _clear_caches()
+    for numerator, denominator in PAGE_04_INPUTS:
+        render_png(_page_04_chart(numerator, denominator))
+
+
+@benchmark("plot")
+def plot_textbook_vega():
+    from chart_backend import to_vega_lite
+
+    _clear_caches()
+    for func_str in RATIONAL_INPUTS:
+        to_vega_lite(_textbook_chart(func_str))
+
+
+@benchmark("plot")
+def plot_textbook_png():
+    from chart_backend import render_png
+
+    _clear_caches()
+    for func_str in RATIONAL_INPUTS[:3]:
+        render_png(_textbook_chart(func_str))
+
+
+# --- 4. 06 페이지 분석 ---
+@benchmark("analysis")
+def analysis_uncached():
+    from rational_analysis import analyze_rational_function
+
+    _clear_caches()
+    for func_str in RATIONAL_INPUTS:
+        analyze_rational_function(func_str)
+
+
+@benchmark("analysis")
+def analysis_cached():
+    from rational_analysis import analyze_rational_function
+
+    for _ in range(100):
+        for func_str in RATIONAL_INPUTS:
+            analyze_rational_function(func_str)
+
+
+# --- 5. 퀴즈 문제 생성 ---
+@benchmark("quiz")
+def quiz_generate_30():
+    from problem_bank import sample_problem_params
+
+    rng = _rng()
+    for _ in range(INNER_LOOPS):
+        for difficulty in ("쉬움", "보통", "어려움"):
+            sample_problem_params(30, rng, difficulty)
+
+
+@benchmark("quiz")
+def quiz_generate_100k():
+    from problem_bank import closed_form_answers, generate_problem_params
+
+    closed_form_answers(generate_problem_params(100_000, "어려움", _rng()))
+
+
+@benchmark("quiz")
+def quiz_explanations_30():
+    from problem_bank import PROBLEM_CACHE, problem_info, sample_problem_params
+
+    problems = sample_problem_params(30, _rng())
+    for _ in range(INNER_LOOPS):
+        PROBLEM_CACHE.clear()
+        for params in problems:
+            problem_info(params)
+
+
+# --- 6. 채점 ---
+@benchmark("grading")
+def grade_textbook_quiz():
+    from fractions import Fraction
+
+    from grading import is_equivalent
+    from rational_parser import parse_rational
+
+    for _ in range(INNER_LOOPS):
+        _clear_caches()
+        for text, answer in [("1/2", Fraction(1, 2)), ("0.5", Fraction(1, 2)), ("-3", Fraction(-3)), ("2/3", Fraction(3, 2))]:
+            is_equivalent(parse_rational(text), answer)
+
+
+@benchmark("grading")
+def grade_practice():
+    """유리식.py 채점: 문제 풀이(캐시 실패) + 학생 답안 파싱 + 교차곱 비교"""
+    from grading import is_equivalent
+    from polynomial import latex
+    from rational_parser import parse_rational
+    from rational_practice import PRACTICE_CACHE, draw_problem, solve_problem
+
+    _clear_caches()
+    PRACTICE_CACHE.clear()
+    rng = random.Random(SEED)
+    for _ in range(20):
+        num, den = solve_problem(draw_problem(rng))["solution"]
+        answer = f"({latex(num)})/({latex(den)})".replace("{", "(").replace("}", ")")
+        is_equivalent(parse_rational(answer), (num, den))
+
+
+# --- 7. 페이지 전체 재실행 (AppTest) ---
+def _app(path):
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+
+    # 측정 결과 사이에 위젯 경고 로그가 섞이지 않게 함
+    set_log_level("error")
+
+    random.seed(SEED)
+    return AppTest.from_file(str(ROOT / path), default_timeout=120)
+
+
+def _button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+@functools.lru_cache(maxsize=None)
+def _page_quiz_data(path):
+    """페이지 파일의 QUIZ_DATA 목록 (페이지를 실행하지 않고 할당문의 값만 계산)"""
+    tree = ast.parse((ROOT / path).read_text(encoding="utf-8"))
+    node = next(
+        node for node in tree.body
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == "QUIZ_DATA" for target in node.targets)
+    )
+    return eval(compile(ast.Expression(node.value), path, "eval"), {"set": set})
+
+
+# main.py는 pages/ 폴더 전체를 불러오는 진입점이라 페이지별로만 잼
+PAGES = {
+    "lotto_01": "pages/01_로또 번호 추첨기.py",
+    "lotto_02": "pages/02_로또 번호 추첨기.py",
+    "quadratic_03": "pages/03_이차함수 기본형 그래프.py",
+    "rational_04": "pages/04_유리함수 그래프.py",
+    "lotto_05": "pages/05_로또 번호 추첨기 again.py",
+    "analyzer_06": "pages/06_유리함수 그래프 최종.py",
+    "textbook_04": "유리함수 교과서/04_유리함수 그래프.py",
+    "textbook_practice": "유리함수 교과서/유리식.py",
+}
+
+
+# 재실행 벤치마크가 이어서 쓰는 AppTest 세션 (페이지 경로 -> AppTest)
+_SESSIONS = {}
+
+
+def _page_benchmarks():
+    """페이지마다 첫 실행과 같은 세션의 재실행 벤치마크를 만들어 등록"""
+    for name, path in PAGES.items():
+        def first_run(path=path):
+            _app(path).run()
+
+        def rerun(path=path):
+            # 같은 세션의 재실행(위젯 조작 없이 다시 그리기)만 잼
+            if path not in _SESSIONS:
+                _SESSIONS[path] = _app(path).run()
+            _SESSIONS[path].run()
+
+        first_run.__name__ = f"page_{name}_first_run"
+        rerun.__name__ = f"page_{name}_rerun"
+        benchmark("pages", repeats=3)(first_run)
+        # 재실행은 10ms 안팎으로 짧아 잡음이 크므로 더 여러 번 재서 최솟값을 씀
+        benchmark("pages", repeats=10)(rerun)
+
+
+_page_benchmarks()
+
+
+@benchmark("pages", repeats=3)
+def page_rational_04_check_answer():
+    """04 페이지: 그래프 폼에 새 식을 제출한 뒤 현재 퀴즈 문제의 정답을 입력하고 확인 (check_answer 콜백 포함)"""
+    at = _app(PAGES["rational_04"]).run()
+    at.text_input[0].set_value("x^2-1")
+    _button(at, "Graph Plot").click().run()
+    # 문제는 무작위로 고르므로 문제 형식(글 입력/여러 개 선택)에 맞는 위젯에 정답을 넣음
+    question = _page_quiz_data(PAGES["rational_04"])[at.session_state["current_quiz_index"]]
+    if question["type"] == "multiselect":
+        at.multiselect(key="current_user_input").set_value(sorted(question["answer"]))
+    else:
+        at.text_input(key="current_user_input").set_value(question["answer"])
+    _button(at, "정답 확인").click().run()
+    assert at.session_state["is_last_attempt_correct"], "04 페이지 퀴즈 정답이 채점되지 않았습니다"
+
+
+@benchmark("pages", repeats=3)
+def page_analyzer_06_new_input():
+    at = _app(PAGES["analyzer_06"]).run()
+    for func_str in RATIONAL_INPUTS[:4]:
+        at.sidebar.text_input[0].set_value(func_str).run()
+
+
+@benchmark("pages", repeats=3)
+def page_textbook_04_submit():
+    from problem_bank import problem_info
+
+    at = _app(PAGES["textbook_04"]).run()
+    problem = problem_info(at.session_state["problems"][at.session_state["current_index"]])
+    at.text_input(key="input_va_quiz").set_value(f"x={problem['va']}")
+    at.text_input(key="input_ha_quiz").set_value(f"y={problem['ha']}")
+    at.button(key="submit_btn").click().run()
+
+
+@benchmark("pages", repeats=3)
+def page_textbook_practice_submit():
+    at = _app(PAGES["textbook_practice"]).run()
+    at.text_input(key="answer_input").set_value("(x+1)/(x+2)")
+    _button(at, "정답 확인").click().run()
+    _button(at, "새 문제 생성").click().run()
+
+
+# --- 8. 실행, 저장, 비교 ---
+def reference_workload():
+    """기계 속도를 재는 고정 작업: 벤치마크 대상처럼 파이썬 객체 연산(Fraction)과 NumPy 배열 연산을 섞음"""
+    from fractions import Fraction
+
+    total = Fraction(0)
+    for i in range(1, 2000):
+        total += Fraction(1, i)
+    np.sort(_rng().random(500_000))
+
+
+def _time(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_benchmarks(groups=None, repeats=DEFAULT_REPEATS, rounds=DEFAULT_ROUNDS, log=print):
+    """선택한 벤치마크를 rounds번 돌아가며 재서 항목별로 모든 측정값을 합쳐 요약
+
+    이 기계는 몇 초씩 2~4배 느려지는 때가 있어서, 한 항목을 연달아 재기보다 전체를 여러 번 돌며
+    시간을 나눠 재야 최솟값이 안정됩니다. 기준 작업도 항목을 잴 때마다 바로 앞뒤에서 잽니다.
+    """
+    if groups is None or "pages" in groups:
+        # 예열 스레드가 측정 중에 CPU를 나눠 쓰지 않도록 먼저 끝까지 실행
+        from warmup import start_warm_up
+
+        start_warm_up().join()
+
+    selected = [entry for entry in BENCHMARKS if groups is None or entry[0] in groups]
+    times = {name: [] for _, name, _, _ in selected}
+    references = {name: [] for _, name, _, _ in selected}
+    reference_workload()
+    for round_index in range(rounds):
+        for group, name, fn, fixed_repeats in selected:
+            if round_index == 0:
+                # 첫 바퀴에서만 미리 한 번 실행 (import, 캐시 예열 등)
+                fn()
+            references[name] += _time(reference_workload, repeats)
+            times[name] += _time(fn, fixed_repeats or repeats)
+            references[name] += _time(reference_workload, repeats)
+        log(f"{round_index + 1}/{rounds}바퀴 완료")
+
+    results = {}
+    for group, name, _, _ in selected:
+        result = {
+            "group": group,
+            "median": statistics.median(times[name]),
+            "min": min(times[name]),
+            "repeats": len(times[name]),
+            "reference": min(references[name]),
+        }
+        results[name] = result
+        log(f"{group:9s} {name:40s} {result['min'] * 1000:10.2f} ms  (기준 작업 {result['reference'] * 1000:.2f} ms)")
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+
+
+def save_results(report, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """기준 결과와 최솟값을 비교한 행 목록 (status: '느려짐', '빨라짐', '' 또는 '새 항목')
+
+    기준 결과의 시간은 두 실행에서 그 항목과 함께 잰 기준 작업 시간의 비율로 환산한 뒤 비교하므로(baseline 열),
+    ratio는 기계 속도 차이를 뺀 변화입니다.
+    """
+    rows = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append({"name": name, "baseline": None, "current": result["min"], "ratio": None, "status": "새 항목"})
+            continue
+        # 기준 작업 시간이 없는 예전 기준 파일은 절대 시간으로 비교
+        speed = result["reference"] / base["reference"] if "reference" in base else 1.0
+        expected = base["min"] * speed
+        ratio = result["min"] / expected
+        difference = result["min"] - expected
+        status = ""
+        if ratio > 1 + tolerance and difference > MIN_DIFFERENCE:
+            status = "느려짐"
+        elif ratio < 1 / (1 + tolerance) and -difference > MIN_DIFFERENCE:
+            status = "빨라짐"
+        rows.append({"name": name, "baseline": expected, "current": result["min"], "ratio": ratio, "status": status})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지별 핵심 경로 벤치마크")
+    groups = sorted({group for group, *_ in BENCHMARKS})
+    parser.add_argument("--only", nargs="+", choices=groups, help="실행할 그룹")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="한 바퀴에서 항목마다 재는 횟수")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="전체 벤치마크를 돌아가며 잴 바퀴 수")
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 파일로 저장")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="느려짐으로 판단할 비율 (0.5 = 50%%)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.only, args.repeats, args.rounds)
+    save_results(report, args.out)
+    print(f"\n결과를 {args.out}에 저장했습니다.")
+
+    if args.save_baseline:
+        save_results(report, args.baseline)
+        print(f"기준 결과를 {args.baseline}에 저장했습니다.")
+        return 0
+    if not args.baseline.exists():
+        print("기준 결과가 없습니다. --save-baseline으로 먼저 만드세요.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    rows = compare(report, baseline, args.tolerance)
+    print(f"\n기준: {args.baseline} ({baseline['created']}), 기준 작업 시간으로 환산한 최솟값 비교")
+    for row in rows:
+        if row["ratio"] is None:
+            print(f"  {row['name']:40s} {'':>10s} {row['current'] * 1000:10.2f} ms  {row['status']}")
+        else:
+            print(f"  {row['name']:40s} {row['baseline'] * 1000:10.2f} -> {row['current'] * 1000:10.2f} ms "
+                  f"(x{row['ratio']:.2f})  {row['status']}")
+    regressions = [row for row in rows if row["status"] == "느려짐"]
+    if regressions:
+        print(f"\n느려진 항목 {len(regressions)}개: {', '.join(row['name'] for row in regressions)}")
+        return 1
+    print("\n느려진 항목이 없습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+"""그래프 출력 백엔드
+
+페이지의 그래프 함수는 그릴 내용(선, 점근선, 축 범위 등)을 딕셔너리로 만들고,
+draw_chart()가 이를 브라우저에서 그리는 Vega-Lite 차트 또는 Matplotlib 이미지로 출력합니다.
+"""
+import io
+import json
+import re
+from contextlib import contextmanager
+
+import numpy as np
+import streamlit as st
+
+from app_cache import LRUCache
+from figure_pool import FIGURE_POOL
+from metrics import record_hit, span
+
+BACKEND_VEGA = "브라우저 (Vega-Lite)"
+BACKEND_MATPLOTLIB = "Matplotlib (이미지)"
+BACKENDS = [BACKEND_VEGA, BACKEND_MATPLOTLIB]
+
+# 렌더링 결과(Vega-Lite 명세 또는 PNG) 캐시 (모든 세션 공유)
+RENDER_CACHE = LRUCache(max_entries=512)
+
+# 브라우저로 보내는 선 하나당 최대 점 개수
+MAX_CHART_POINTS = 600
+
+# 화면 해상도 (Figure 크기(인치) -> 화면에 그려지는 폭(픽셀) 환산)
+SCREEN_DPI = 96
+
+_COLOR_NAMES = {
+    "r": "red",
+    "g": "green",
+    "b": "blue",
+    None: "#1f77b4",  # Matplotlib 기본 색(C0)
+}
+
+
+# --- 1. 그릴 내용 만들기 ---
+def new_chart(title, x_range=None, y_range=None, x_label='x', y_label='y', figsize=(8, 6),
+              grid_style=':', zero_line_style='-', show_zero_lines=True, aspect_equal=False):
+    """그릴 내용을 담는 빈 차트 딕셔너리 (x_range가 None이면 데이터 범위를 사용)"""
+    return {
+        "title": title,
+        "x_range": x_range,
+        "y_range": y_range,
+        "x_label": x_label,
+        "y_label": y_label,
+        "figsize": figsize,
+        "grid_style": grid_style,
+        "zero_line_style": zero_line_style,
+        "show_zero_lines": show_zero_lines,
+        "aspect_equal": aspect_equal,
+        "lines": [],
+        "vlines": [],
+        "hlines": [],
+    }
+
+
+def pixel_width(chart):
+    """차트가 화면에 그려지는 대략적인 폭(픽셀), 샘플링 점 개수를 정할 때 사용"""
+    return int(chart["figsize"][0] * SCREEN_DPI)
+
+
+def add_line(chart, x_vals, y_vals, label, color=None, width=1.5):
+    chart["lines"].append({"x": x_vals, "y": y_vals, "label": label, "color": color, "width": width})
+
+
+def add_vline(chart, x_val, label=None, color='red'):
+    """점근선 등 세로 점선"""
+    chart["vlines"].append({"value": x_val, "label": label, "color": color})
+
+
+def add_hline(chart, y_val, label=None, color='green'):
+    """점근선 등 가로 점선"""
+    chart["hlines"].append({"value": y_val, "label": label, "color": color})
+
+
+# --- 2. 백엔드 선택 및 출력 ---
+def backend_selector():
+    """사이드바에 그래프 출력 방식 선택 위젯을 표시 (모든 페이지가 같은 세션 값을 공유)"""
+    st.sidebar.radio(
+        "그래프 출력 방식",
+        BACKENDS,
+        key="plot_backend",
+        help="브라우저 렌더링은 서버 부담과 전송량이 적습니다. 문제가 있으면 Matplotlib 이미지로 바꿔 보세요."
+    )
+
+
+def draw_chart(chart, backend=None):
+    """선택된 백엔드로 차트를 출력 (Vega-Lite 변환에 실패하면 Matplotlib으로 대체)"""
+    backend = backend or st.session_state.get("plot_backend", BACKEND_VEGA)
+    # 렌더링(명세/PNG 만들기)과 Streamlit 출력을 따로 재기 위해 PNG는 직접 만들어 st.image로 보냄
+    with span("render", detail=chart["title"]):
+        kind, payload = render_chart(chart, backend)
+    _emit(kind, payload, chart["title"])
+
+
+def render_chart(chart, backend):
+    """차트를 출력 가능한 결과물로 변환: ("vega", 명세) 또는 ("png", 이미지 바이트)"""
+    if backend == BACKEND_VEGA:
+        try:
+            return "vega", to_vega_lite(chart)
+        except Exception:
+            pass
+    return "png", render_png(chart)
+
+
+def draw_cached_chart(cache_key, build_chart, backend=None):
+    """렌더링 결과를 cache_key별로 모든 세션이 공유 (캐시에 있으면 build_chart()도 호출하지 않음)"""
+    backend = backend or st.session_state.get("plot_backend", BACKEND_VEGA)
+    rendered = RENDER_CACHE.get((cache_key, backend))
+    if rendered is not None:
+        # 캐시 적중은 횟수만 셈 (시간은 실제로 렌더링할 때만 잼)
+        record_hit("render")
+    else:
+        with span("render", detail=cache_key):
+            rendered = render_chart(build_chart(), backend)
+        RENDER_CACHE.put((cache_key, backend), rendered)
+    _emit(*rendered, cache_key)
+
+
+def _emit(kind, payload, detail):
+    with span("emit", detail=detail):
+        if kind == "vega":
+            st.vega_lite_chart(spec=payload)
+        else:
+            st.image(payload)
+
+
+# --- 3. Matplotlib 백엔드 ---
+def _pool_key(chart):
+    """Figure를 재사용할 수 있는 조건 (처음 만들 때만 설정하는 값들)"""
+    return (
+        tuple(chart["figsize"]),
+        chart["grid_style"],
+        chart["zero_line_style"] if chart["show_zero_lines"] else None,
+        chart["aspect_equal"],
+        chart["x_range"] is None,
+        chart["y_range"] is None,
+    )
+
+
+def _setup_axes(chart):
+    """Figure를 새로 만들 때 한 번만 그리는 격자, 0 기준선, 축 비율"""
+    def setup(fig, ax):
+        if chart["grid_style"] == ':':
+            ax.grid(True, linestyle=':', alpha=0.6)
+        else:
+            ax.grid(True)
+        if chart["show_zero_lines"]:
+            ax.axhline(0, color='gray', linestyle=chart["zero_line_style"], linewidth=0.5)
+            ax.axvline(0, color='gray', linestyle=chart["zero_line_style"], linewidth=0.5)
+        if chart["aspect_equal"]:
+            ax.set_aspect('equal', adjustable='box')
+    return setup
+
+
+def _sync_artists(artists, items, create, update):
+    """이미 그려진 선은 데이터만 바꾸고, 모자라면 새로 그리고, 남으면 지움"""
+    while len(artists) > len(items):
+        artists.pop().remove()
+    for i, item in enumerate(items):
+        if i < len(artists):
+            update(artists[i], item)
+        else:
+            artists.append(create(item))
+
+
+def update_figure(fig, chart):
+    """재사용하는 Figure의 선 데이터, 점근선, 제목, 범위, 범례를 차트 내용으로 바꿈 (축/격자는 그대로)"""
+    ax = fig.axes[0]
+    state = fig.pool_state
+
+    def update_line(artist, line):
+        artist.set_data(line["x"], line["y"])
+        artist.set_label(line["label"])
+        artist.set_color(line["color"] or 'C0')
+        artist.set_linewidth(line["width"])
+
+    def update_vline(artist, rule):
+        artist.set_xdata([rule["value"], rule["value"]])
+        artist.set_label(rule["label"])
+        artist.set_color(rule["color"])
+
+    def update_hline(artist, rule):
+        artist.set_ydata([rule["value"], rule["value"]])
+        artist.set_label(rule["label"])
+        artist.set_color(rule["color"])
+
+    _sync_artists(
+        state["lines"], chart["lines"],
+        lambda line: ax.plot(line["x"], line["y"], label=line["label"], color=line["color"], linewidth=line["width"])[0],
+        update_line,
+    )
+    _sync_artists(
+        state["vlines"], chart["vlines"],
+        lambda rule: ax.axvline(x=rule["value"], color=rule["color"], linestyle='--', label=rule["label"]),
+        update_vline,
+    )
+    _sync_artists(
+        state["hlines"], chart["hlines"],
+        lambda rule: ax.axhline(y=rule["value"], color=rule["color"], linestyle='--', label=rule["label"]),
+        update_hline,
+    )
+
+    ax.set_title(chart["title"])
+    ax.set_xlabel(chart["x_label"])
+    ax.set_ylabel(chart["y_label"])
+    if chart["x_range"] is None or chart["y_range"] is None:
+        ax.relim()
+        ax.autoscale_view(scalex=chart["x_range"] is None, scaley=chart["y_range"] is None)
+    if chart["x_range"] is not None:
+        ax.set_xlim(*chart["x_range"])
+    if chart["y_range"] is not None:
+        ax.set_ylim(*chart["y_range"])
+
+    # 범례는 레이블/색이 바뀔 때만 다시 만듦
+    legend_key = tuple(
+        (artist.get_label(), artist.get_color())
+        for artist in state["lines"] + state["vlines"] + state["hlines"]
+    )
+    if legend_key != state["legend"]:
+        ax.legend()
+        state["legend"] = legend_key
+
+
+def render_png(chart):
+    """차트를 PNG 바이트로 렌더링 (st.pyplot과 같은 저장 옵션)"""
+    buffer = io.BytesIO()
+    with matplotlib_figure(chart) as fig:
+        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=200)
+    return buffer.getvalue()
+
+
+@contextmanager
+def matplotlib_figure(chart):
+    """풀에서 Figure를 꺼내 차트 내용으로 갱신해 주고, 블록이 끝나면 반드시 풀에 돌려줌"""
+    with FIGURE_POOL.figure(_pool_key(chart), _setup_axes(chart)) as fig:
+        update_figure(fig, chart)
+        yield fig
+
+
+# --- 4. Vega-Lite 백엔드 ---
+def plain_label(text):
+    """Matplotlib 수식 레이블($...$)을 브라우저 차트용 일반 문자열로 변환"""
+    if text is None:
+        return None
+    text = text.replace('$', '')
+    # \frac{a}{b} -> (a)/(b)
+    while '\\frac' in text:
+        new_text = re.sub(r'\\frac\{([^{}]*)\}\{([^{}]*)\}', r'(\1)/(\2)', text)
+        if new_text == text:
+            break
+        text = new_text
+    text = text.replace('\\left', '').replace('\\right', '').replace('\\,', ' ')
+    text = re.sub(r'\\mathbf\{([^{}]*)\}', r'\1', text)
+    return text.replace('{', '').replace('}', '').replace('\\', '')
+
+
+def decimate(x_vals, y_vals, max_points=MAX_CHART_POINTS):
+    """점이 많으면 구간마다 최솟값/최댓값만 남겨 줄임 (모양과 끊김(NaN)은 유지)"""
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = np.asarray(y_vals, dtype=float)
+    if x_vals.size <= max_points:
+        return x_vals, y_vals
+
+    bucket = int(np.ceil(x_vals.size / (max_points / 2)))
+    n_buckets = int(np.ceil(x_vals.size / bucket))
+    pad = n_buckets * bucket - x_vals.size
+    y_pad = np.concatenate([y_vals, np.full(pad, np.nan)]).reshape(n_buckets, bucket)
+    starts = np.arange(n_buckets) * bucket
+
+    with np.errstate(all='ignore'):
+        y_fill_hi = np.where(np.isnan(y_pad), -np.inf, y_pad)
+        y_fill_lo = np.where(np.isnan(y_pad), np.inf, y_pad)
+    i_max = starts + np.argmax(y_fill_hi, axis=1)
+    i_min = starts + np.argmin(y_fill_lo, axis=1)
+    # 끊김(NaN)이 있는 구간은 그 점도 남겨서 선이 이어지지 않게 함
+    has_nan = np.isnan(y_pad).any(axis=1)
+    has_nan[-1] = has_nan[-1] and np.isnan(y_vals[starts[-1]:]).any()
+    i_nan = starts[has_nan] + np.argmax(np.isnan(y_pad[has_nan]), axis=1)
+
+    keep = np.unique(np.concatenate([[0, x_vals.size - 1], i_min, i_max, i_nan]))
+    keep = keep[keep < x_vals.size]
+    return x_vals[keep], y_vals[keep]
+
+
+def _color(color):
+    return _COLOR_NAMES.get(color, color)
+
+
+def _line_rows(x_vals, y_vals):
+    """NaN으로 끊긴 부분마다 다른 segment 번호(s)를 붙여 각각 따로 그리게 함 (전송량을 줄이려고 짧은 키 사용)"""
+    x_vals, y_vals = decimate(x_vals, y_vals)
+    gaps = ~np.isfinite(y_vals)
+    segment = np.cumsum(gaps)[~gaps].tolist()
+    x_out = np.round(x_vals[~gaps], 4).tolist()
+    y_out = np.round(y_vals[~gaps], 4).tolist()
+    return [{"x": xv, "y": yv, "s": sv} for xv, yv, sv in zip(x_out, y_out, segment)]
+
+
+def to_vega_lite(chart):
+    """차트 딕셔너리를 Vega-Lite 명세로 변환 (선 데이터는 줄여서 전송)"""
+    labels, colors = [], []
+
+    def register(label, color):
+        if label is not None and label not in labels:
+            labels.append(label)
+            colors.append(_color(color))
+
+    x_lo = x_hi = None
+    line_data = []
+    for line in chart["lines"]:
+        label = plain_label(line["label"])
+        register(label, line["color"])
+        line_data.append((label, line["width"], _line_rows(line["x"], line["y"])))
+        finite_x = np.asarray(line["x"], dtype=float)
+        if finite_x.size:
+            x_lo = float(np.nanmin(finite_x)) if x_lo is None else min(x_lo, float(np.nanmin(finite_x)))
+            x_hi = float(np.nanmax(finite_x)) if x_hi is None else max(x_hi, float(np.nanmax(finite_x)))
+
+    rule_rows = {"x": [], "y": []}
+    for axis, key in (("x", "vlines"), ("y", "hlines")):
+        for rule in chart[key]:
+            label = plain_label(rule["label"])
+            register(label, rule["color"])
+            rule_rows[axis].append({axis: float(rule["value"]), "series": label, "color": _color(rule["color"])})
+
+    x_range = chart["x_range"] or ((x_lo, x_hi) if x_lo is not None else None)
+    y_range = chart["y_range"]
+    x_scale = {"domain": list(x_range)} if x_range else {"zero": False}
+    y_scale = {"domain": list(y_range)} if y_range else {"zero": False}
+    color_scale = {"domain": labels, "range": colors}
+    x_enc = {"field": "x", "type": "quantitative", "scale": x_scale, "title": plain_label(chart["x_label"])}
+    y_enc = {"field": "y", "type": "quantitative", "scale": y_scale, "title": plain_label(chart["y_label"])}
+
+    layers = []
+    if chart["show_zero_lines"]:
+        dash = [4, 4] if chart["zero_line_style"] == '--' else []
+        layers.append({
+            "data": {"values": [{"x": 0}]},
+            "mark": {"type": "rule", "color": "gray", "strokeWidth": 0.5, "strokeDash": dash, "clip": True},
+            "encoding": {"x": x_enc},
+        })
+        layers.append({
+            "data": {"values": [{"y": 0}]},
+            "mark": {"type": "rule", "color": "gray", "strokeWidth": 0.5, "strokeDash": dash, "clip": True},
+            "encoding": {"y": y_enc},
+        })
+    for label, width, rows in line_data:
+        layers.append({
+            "data": {"values": rows},
+            # 레이블은 점마다 보내지 않고 브라우저에서 붙임
+            "transform": [{"calculate": json.dumps(label), "as": "series"}],
+            "mark": {"type": "line", "clip": True, "strokeWidth": width},
+            "encoding": {
+                "x": x_enc,
+                "y": y_enc,
+                "detail": {"field": "s", "type": "nominal"},
+                "color": {"field": "series", "type": "nominal", "scale": color_scale, "title": None},
+                "order": {"field": "x", "type": "quantitative"},
+            },
+        })
+    for axis in ("x", "y"):
+        rows = rule_rows[axis]
+        labeled = [row for row in rows if row["series"] is not None]
+        if labeled:
+            layers.append({
+                "data": {"values": labeled},
+                "mark": {"type": "rule", "strokeDash": [6, 4], "clip": True},
+                "encoding": {
+                    axis: x_enc if axis == "x" else y_enc,
+                    "color": {"field": "series", "type": "nominal", "scale": color_scale, "title": None},
+                },
+            })
+        # 레이블이 없는 점근선은 범례 없이 색만 지정
+        for row in rows:
+            if row["series"] is None:
+                layers.append({
+                    "data": {"values": [row]},
+                    "mark": {"type": "rule", "strokeDash": [6, 4], "clip": True, "color": row["color"]},
+                    "encoding": {axis: x_enc if axis == "x" else y_enc},
+                })
+
+    spec = {
+        "title": plain_label(chart["title"]),
+        "layer": layers,
+        "config": {"axis": {"grid": True, "gridDash": [2, 2] if chart["grid_style"] == ':' else []}},
+    }
+    # 폭은 페이지 폭에 맞추고 높이는 Matplotlib Figure와 같은 가로세로 비율로 정함
+    # (aspect_equal로 높이를 축 범위에 맞추면 y 범위가 넓은 그래프가 화면보다 길어져 슬라이더가 가려짐)
+    fig_width, fig_height = chart["figsize"]
+    spec["width"] = "container"
+    spec["height"] = int(pixel_width(chart) * fig_height / fig_width)
+    return spec
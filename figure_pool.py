@@ -0,0 +1,95 @@
+import threading
+import weakref
+from contextlib import contextmanager
+
+
+class FigurePool:
+    """Matplotlib Figure/Axes를 재사용하는 풀
+
+    pyplot(plt.subplots)을 쓰지 않고 Figure를 직접 만들기 때문에 pyplot 전역 관리자에 등록되지 않으며,
+    사용이 끝난 Figure는 풀로 돌아가거나(최대 max_idle개) 그대로 버려져 메모리에서 해제됩니다.
+    """
+
+    def __init__(self, max_idle=4):
+        self.max_idle = max_idle
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self._idle = {}
+        self._live = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def acquire(self, key, setup):
+        """key(축 설정)가 같은 Figure를 풀에서 꺼내고, 없으면 새로 만든 뒤 setup(fig, ax)를 한 번 호출"""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                fig = idle.pop()
+                self.reused += 1
+                self.in_use += 1
+                return fig
+            self.created += 1
+            self.in_use += 1
+
+        # Matplotlib은 실제로 그림을 그릴 때 처음 import (브라우저 렌더링만 쓰면 로드하지 않음)
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=key[0])
+        ax = fig.add_subplot()
+        # Figure마다 재사용할 선(artist) 목록을 보관
+        fig.pool_state = {"lines": [], "vlines": [], "hlines": [], "legend": None}
+        setup(fig, ax)
+        with self._lock:
+            self._live.add(fig)
+        return fig
+
+    def release(self, key, fig):
+        """Figure를 풀에 돌려줌 (풀이 가득 차면 버려서 해제)"""
+        with self._lock:
+            self.in_use -= 1
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(fig)
+                return
+            self._live.discard(fig)
+        fig.clear()
+
+    @contextmanager
+    def figure(self, key, setup):
+        """with 블록이 끝나면 (예외가 나도) 반드시 Figure를 돌려줌"""
+        fig = self.acquire(key, setup)
+        try:
+            yield fig
+        finally:
+            self.release(key, fig)
+
+    def live_figure_count(self):
+        """풀이 만든 Figure 중 아직 메모리에 있는 개수 (사용 중 + 대기 중)"""
+        with self._lock:
+            return len(self._live)
+
+    def stats(self):
+        with self._lock:
+            idle = sum(len(figs) for figs in self._idle.values())
+            live = len(self._live)
+        return {
+            "live": live,
+            "idle": idle,
+            "in_use": self.in_use,
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+
+# 모든 세션이 공유하는 Figure 풀
+FIGURE_POOL = FigurePool()
+
+
+def live_figure_count():
+    """현재 살아 있는 Figure 수 (풀의 Figure + pyplot에 등록된 Figure)"""
+    import sys
+
+    count = FIGURE_POOL.live_figure_count()
+    if "matplotlib.pyplot" in sys.modules:
+        count += len(sys.modules["matplotlib.pyplot"].get_fignums())
+    return count
@@ -0,0 +1,33 @@
+"""학생 답안 채점 (두 식이 수학적으로 같은지 판정)
+
+답안과 모범 답안을 모두 rational_parser의 (분자, 분모) 계수 쌍으로 바꾼 뒤
+교차곱(a/b == c/d <=> ad == cb)으로 확률 없이 정확히 판정합니다.
+문자열도 eval/sympify 없이 같은 전용 파서로만 읽으므로, 학생 입력이 파이썬 코드로 실행될 일이 없습니다.
+"""
+from fractions import Fraction
+
+import polynomial as poly
+from rational_parser import parse_rational
+
+
+def to_parsed(expr):
+    """계수 쌍, 정수/Fraction, 유리식 문자열을 (분자, 분모) 계수 쌍으로 변환
+
+    문자열이 유리식이 아니면 rational_parser.ParseError가 발생합니다.
+    """
+    if isinstance(expr, tuple):
+        return expr
+    if isinstance(expr, (int, Fraction)):
+        return poly.constant(expr), poly.ONE
+    if isinstance(expr, str):
+        return parse_rational(expr)
+    raise TypeError(f"채점할 수 없는 답안 형식입니다: {type(expr).__name__}")
+
+
+def is_equivalent(user_expr, answer_expr):
+    """두 식이 (분모가 0이 되는 점을 제외하고) 같은 식인지 판정
+
+    user_expr, answer_expr는 rational_parser의 계수 쌍, 정수/Fraction, 또는 유리식 문자열입니다.
+    """
+    (a, b), (c, d) = to_parsed(user_expr), to_parsed(answer_expr)
+    return poly.mul(a, d) == poly.mul(c, b)
@@ -0,0 +1,218 @@
+"""동시 접속 부하 테스트 (수업 시간에 학생 여러 명이 한꺼번에 쓰는 상황 재현)
+
+Streamlit 서버처럼 한 프로세스 안에서 세션마다 스레드를 하나씩 두고, 각 세션이 정해진 위젯 조작
+(03 슬라이더 움직이기, 06 식 바꾸기, 교과서 퀴즈 제출 등)을 반복하게 합니다.
+AppTest는 한 프로세스에서 한 번에 하나의 스크립트만 실행할 수 있어 재실행은 잠금으로 차례대로 실행합니다.
+실제 서버에서도 페이지 계산은 대부분 파이썬 코드라 GIL 때문에 사실상 하나씩 실행되므로,
+잠금을 기다린 시간까지 포함한 지연 시간은 서버 한 프로세스가 받는 부하와 비슷하게 나타납니다.
+동시 세션 수를 늘려 가며 재실행 지연 시간(p50/p95/p99), 처리량, 세션당 메모리를 재고,
+지연 시간이 급격히 늘거나 처리량이 더 이상 늘지 않는 지점(무릎)을 알려 줍니다.
+세션당 메모리는 프로세스 RSS 변화가 아니라 각 세션의 session_state를 memory_report.deep_sizeof로 직접 잰 값이고,
+시나리오마다 첫 단계 전에 시간을 재지 않는 세션을 한 번 실행해 페이지의 첫 import 비용을 빼고 잽니다.
+
+    python load_test.py                                   # 모든 시나리오, 세션 1/5/10/20/40개
+    python load_test.py --scenario analyzer_06 --sessions 10 20 40 80 --steps 20
+    python load_test.py --out load_report.json
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from benchmark import PAGE_04_INPUTS, PAGES, RATIONAL_INPUTS, ROOT
+from memory_report import deep_sizeof
+from problem_bank import problem_info
+
+DEFAULT_SESSIONS = [1, 5, 10, 20, 40]
+DEFAULT_STEPS = 10
+# 조작 사이 평균 대기 시간(초): 학생이 결과를 보고 다음 조작을 하기까지의 시간
+DEFAULT_THINK_TIME = 1.0
+# 첫 단계보다 p95가 이 배수 이상이면 무릎으로 판단
+KNEE_LATENCY_FACTOR = 2.0
+# 세션을 늘렸는데 처리량이 이 비율보다 적게 늘면 무릎으로 판단
+KNEE_THROUGHPUT_GAIN = 0.1
+
+# AppTest 실행은 전역 Runtime을 만들고 지우므로 동시에 하나만 실행
+_run_lock = threading.Lock()
+
+
+# --- 1. 시나리오 (세션 하나가 반복하는 위젯 조작) ---
+def _button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+def _slider_sweep(at, step, rng):
+    # a 값을 -5.0 ~ 5.0 사이에서 0.1씩 움직임
+    at.slider[0].set_value(round(-5.0 + (step * 7 % 101) * 0.1, 1))
+
+
+def _formula_edit(at, step, rng):
+    at.sidebar.text_input[0].set_value(RATIONAL_INPUTS[step % len(RATIONAL_INPUTS)])
+
+
+def _page_04_edit(at, step, rng):
+    numerator, denominator = PAGE_04_INPUTS[step % len(PAGE_04_INPUTS)]
+    at.text_input[0].set_value(numerator)
+    at.text_input[1].set_value(denominator)
+
+
+def _quiz_submit(at, step, rng):
+    # 세 번에 한 번은 다음 문제로, 나머지는 절반 확률로 정답/오답 제출
+    if step % 3 == 2:
+        at.button(key="next_btn").click()
+        return
+    problem = problem_info(at.session_state["problems"][at.session_state["current_index"]])
+    ha = problem["ha"] if rng.random() < 0.5 else problem["ha"] + 1
+    at.text_input(key="input_va_quiz").set_value(f"x={problem['va']}")
+    at.text_input(key="input_ha_quiz").set_value(f"y={ha}")
+    at.button(key="submit_btn").click()
+
+
+def _practice_submit(at, step, rng):
+    if step % 3 == 2:
+        _button(at, "새 문제 생성").click()
+        return
+    at.text_input(key="answer_input").set_value(rng.choice(["(x+1)/(x+2)", "1", "(2x+3)/(x^2+3x+2)"]))
+    _button(at, "정답 확인").click()
+
+
+def _lotto_draw(at, step, rng):
+    at.slider[0].set_value(rng.randint(1, 10))
+    _button(at, "✨ 로또 번호 생성").click()
+
+
+# 시나리오 이름 -> (PAGES의 페이지 이름, 조작 함수)
+SCENARIOS = {
+    "quadratic_03": ("quadratic_03", _slider_sweep),
+    "rational_04": ("rational_04", _page_04_edit),
+    "lotto_05": ("lotto_05", _lotto_draw),
+    "analyzer_06": ("analyzer_06", _formula_edit),
+    "textbook_quiz": ("textbook_04", _quiz_submit),
+    "textbook_practice": ("textbook_practice", _practice_submit),
+}
+
+
+# --- 2. 세션 실행 ---
+def _timed_run(at):
+    """재실행 한 번의 지연 시간 (다른 세션의 실행을 기다린 시간 포함)"""
+    start = time.perf_counter()
+    with _run_lock:
+        at.run()
+    return time.perf_counter() - start
+
+
+def run_session(scenario, steps, think_time, seed):
+    """세션 하나를 열어 첫 실행 후 steps번 조작/재실행하고, 재실행별 지연 시간(초)과 세션 상태 크기(바이트)를 반환"""
+    from streamlit.testing.v1 import AppTest
+
+    page, interact = SCENARIOS[scenario]
+    rng = random.Random(seed)
+    at = AppTest.from_file(str(ROOT / PAGES[page]), default_timeout=300)
+    # 학생들이 한꺼번에 같은 순간에 접속하지는 않으므로 접속 시각을 조금씩 흩뜨림
+    if think_time:
+        time.sleep(rng.uniform(0, 2 * think_time))
+    first_run = _timed_run(at)
+
+    latencies = []
+    errors = len(at.exception)
+    for step in range(steps):
+        interact(at, step, rng)
+        latencies.append(_timed_run(at))
+        errors += len(at.exception)
+        if think_time:
+            time.sleep(rng.uniform(0, 2 * think_time))
+    state_bytes = deep_sizeof(at.session_state.to_dict())
+    return {"first_run": first_run, "latencies": latencies, "errors": errors, "state_bytes": state_bytes}
+
+
+def run_level(scenario, sessions, steps=DEFAULT_STEPS, think_time=DEFAULT_THINK_TIME):
+    """세션 sessions개를 동시에 실행하고 지연 시간 분위수, 처리량, 세션당 메모리를 요약"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="load-session") as pool:
+        results = list(pool.map(lambda i: run_session(scenario, steps, think_time, seed=i), range(sessions)))
+    wall_time = time.perf_counter() - start
+
+    latencies = np.array([latency for r in results for latency in r["latencies"]])
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies.size else (0.0, 0.0, 0.0)
+    return {
+        "scenario": scenario,
+        "sessions": sessions,
+        "reruns": int(latencies.size),
+        "p50_ms": float(p50) * 1000,
+        "p95_ms": float(p95) * 1000,
+        "p99_ms": float(p99) * 1000,
+        "first_run_p95_ms": float(np.percentile([r["first_run"] for r in results], 95)) * 1000,
+        # 초당 처리한 재실행 수 (첫 실행과 대기 시간을 포함한 전체 시간 기준)
+        "throughput": latencies.size / wall_time,
+        # 마지막 재실행 뒤 세션마다 session_state가 들고 있는 바이트 수의 평균
+        "memory_per_session_kb": float(np.mean([r["state_bytes"] for r in results])) / 1024,
+        "errors": sum(r["errors"] for r in results),
+    }
+
+
+def find_knee(rows):
+    """지연 시간이 급격히 늘거나 처리량이 더 늘지 않기 시작한 첫 단계의 세션 수 (없으면 None)"""
+    if not rows:
+        return None
+    base_p95 = rows[0]["p95_ms"]
+    for previous, row in zip(rows, rows[1:]):
+        if row["p95_ms"] > KNEE_LATENCY_FACTOR * base_p95:
+            return row["sessions"]
+        if row["throughput"] < previous["throughput"] * (1 + KNEE_THROUGHPUT_GAIN):
+            return row["sessions"]
+    return None
+
+
+def load_test(scenario, session_levels=DEFAULT_SESSIONS, steps=DEFAULT_STEPS, think_time=DEFAULT_THINK_TIME, log=print):
+    """세션 수를 늘려 가며 run_level을 반복하고 결과 행 목록과 무릎 지점을 반환"""
+    # 페이지 모듈 import, 캐시 채우기 같은 첫 실행 비용이 첫 단계에 섞이지 않도록 시간을 재지 않는 세션을 한 번 실행
+    run_session(scenario, steps=1, think_time=0, seed=-1)
+    rows = []
+    for sessions in session_levels:
+        row = run_level(scenario, sessions, steps, think_time)
+        rows.append(row)
+        log(f"  {row['sessions']:4d}  {row['reruns']:6d}  {row['p50_ms']:9.1f}  {row['p95_ms']:9.1f}  "
+            f"{row['p99_ms']:9.1f}  {row['throughput']:9.1f}  {row['memory_per_session_kb']:9.1f}  {row['errors']:4d}")
+    return {"scenario": scenario, "levels": rows, "knee": find_knee(rows)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 접속 부하 테스트")
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--sessions", nargs="+", type=int, default=DEFAULT_SESSIONS, help="동시 세션 수 단계")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help="세션마다 반복할 조작 횟수")
+    parser.add_argument("--think", type=float, default=DEFAULT_THINK_TIME, help="조작 사이 평균 대기 시간(초), 0이면 쉬지 않고 조작")
+    parser.add_argument("--out", type=Path, help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    # 예열이 끝난 뒤(서버가 이미 떠 있는 수업 시간 상황)부터 잼
+    from streamlit.logger import set_log_level
+
+    from warmup import start_warm_up
+
+    start_warm_up().join()
+    set_log_level("error")
+
+    reports = []
+    for scenario in args.scenario:
+        print(f"\n[{scenario}]")
+        print(f"  {'세션':>4s}  {'재실행':>6s}  {'p50 ms':>9s}  {'p95 ms':>9s}  {'p99 ms':>9s}  {'회/초':>9s}  {'KB/세션':>9s}  {'오류':>4s}")
+        report = load_test(scenario, args.sessions, args.steps, args.think)
+        reports.append(report)
+        if report["knee"] is None:
+            print("  무릎 없음 (측정한 범위에서 지연 시간과 처리량이 안정적)")
+        else:
+            print(f"  무릎: 동시 세션 {report['knee']}개부터 지연 시간이 급증하거나 처리량이 늘지 않음")
+
+    if args.out:
+        args.out.write_text(json.dumps(reports, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과를 {args.out}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import numpy as np
+
+LOTTO_MAX = 45
+PICK_COUNT = 6
+
+# 한 번에 처리할 최대 티켓 수 (메모리 사용량 제한)
+CHUNK_SIZE = 1_000_000
+
+
+# 1. 티켓 생성
+def _has_duplicate(columns):
+    """(6, n) 열 배열에서 같은 번호가 두 번 이상 나온 티켓(열)을 찾음"""
+    duplicate = np.zeros(columns.shape[1], dtype=bool)
+    for i in range(PICK_COUNT):
+        for j in range(i + 1, PICK_COUNT):
+            duplicate |= columns[i] == columns[j]
+    return duplicate
+
+
+def draw_columns(n, rng=None):
+    """n장의 티켓을 (6, n) 배열로 생성 (i번째 행 = 모든 티켓의 i번째 번호, 정렬되지 않음)
+
+    번호 위치별로 연속된 메모리를 쓰므로 대량 비교에 가장 빠른 형태입니다.
+    """
+    rng = rng or np.random.default_rng()
+    columns = rng.integers(1, LOTTO_MAX + 1, size=(PICK_COUNT, n), dtype=np.uint8)
+
+    # 6개를 한꺼번에 뽑은 뒤 중복이 있는 티켓만 다시 뽑음 (한 번에 약 70%가 통과)
+    redo = np.flatnonzero(_has_duplicate(columns))
+    while redo.size:
+        draw = rng.integers(1, LOTTO_MAX + 1, size=(PICK_COUNT, redo.size), dtype=np.uint8)
+        columns[:, redo] = draw
+        redo = redo[_has_duplicate(draw)]
+    return columns
+
+
+def generate_tickets(n, rng=None):
+    """n장의 로또 티켓을 (n, 6) 정수 배열로 한 번에 생성 (각 행은 오름차순, 중복 없음)"""
+    return np.sort(draw_columns(n, rng).T, axis=1)
+
+
+# 2. 당첨 번호와 비교
+def winning_mask(winning_numbers):
+    """당첨 번호를 길이 46의 배열로 변환 (번호 -> 당첨이면 1, 아니면 0)"""
+    mask = np.zeros(LOTTO_MAX + 1, dtype=np.uint8)
+    mask[list(winning_numbers)] = 1
+    return mask
+
+
+def count_matches(tickets, winning_numbers):
+    """(n, 6) 티켓 배열의 각 행이 당첨 번호와 몇 개 일치하는지 (n,) 배열로 반환"""
+    return winning_mask(winning_numbers)[tickets].sum(axis=1, dtype=np.uint8)
+
+
+def count_matches_columns(columns, winning_numbers):
+    """draw_columns()가 만든 (6, n) 배열용 count_matches"""
+    mask = winning_mask(winning_numbers)
+    counts = mask[columns[0]]
+    for row in columns[1:]:
+        counts += mask[row]
+    return counts
+
+
+# 3. 비트마스크 티켓 (티켓 1장 = uint64 1개, 번호 k -> k-1번째 비트)
+# 번호 -> 비트 변환표 (0번 칸은 사용하지 않음)
+NUMBER_BITS = np.concatenate([[0], np.left_shift(np.uint64(1), np.arange(LOTTO_MAX, dtype=np.uint64))]).astype(np.uint64)
+
+
+def popcount(values):
+    """uint64 배열의 각 원소에서 1인 비트 수"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    # NumPy 2.0 미만: SWAR 방식으로 비트 수 계산
+    values = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    values = (values & np.uint64(0x3333333333333333)) + ((values >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    values = (values + (values >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((values * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.uint8)
+
+
+def numbers_to_mask(numbers):
+    """번호 묶음(당첨 번호 등) 하나를 비트마스크 정수 하나로 변환"""
+    return np.uint64(np.bitwise_or.reduce(NUMBER_BITS[list(numbers)]))
+
+
+def tickets_to_masks(tickets):
+    """(n, 6) 티켓 배열을 (n,) uint64 비트마스크 배열로 변환"""
+    return columns_to_masks(np.asarray(tickets).T)
+
+
+def columns_to_masks(columns):
+    """draw_columns()가 만든 (6, n) 배열을 (n,) uint64 비트마스크 배열로 변환"""
+    masks = NUMBER_BITS[columns[0]]
+    for row in columns[1:]:
+        masks |= NUMBER_BITS[row]
+    return masks
+
+
+def masks_to_tickets(masks):
+    """(n,) 비트마스크 배열을 화면 표시용 (n, 6) 티켓 배열로 되돌림 (각 행은 오름차순)"""
+    masks = np.asarray(masks, dtype=np.uint64)
+    bits = (masks[:, None] & NUMBER_BITS[1:]) != 0
+    _, numbers = np.nonzero(bits)
+    return (numbers + 1).astype(np.uint8).reshape(len(masks), PICK_COUNT)
+
+
+def format_ticket(mask):
+    """비트마스크 하나를 '3, 15, 27, 33, 34, 36' 형태의 문자열로 변환"""
+    return ", ".join(map(str, masks_to_tickets([mask])[0]))
+
+
+def generate_ticket_masks(n, rng=None):
+    """n장의 티켓을 곧바로 (n,) uint64 비트마스크 배열로 생성 (티켓당 8바이트)"""
+    rng = rng or np.random.default_rng()
+    masks = columns_to_masks(rng.integers(1, LOTTO_MAX + 1, size=(PICK_COUNT, n), dtype=np.uint8))
+
+    # 중복 번호가 있으면 켜진 비트가 6개보다 적으므로 그 티켓만 다시 뽑음
+    redo = np.flatnonzero(popcount(masks) != PICK_COUNT)
+    while redo.size:
+        draw = columns_to_masks(rng.integers(1, LOTTO_MAX + 1, size=(PICK_COUNT, redo.size), dtype=np.uint8))
+        masks[redo] = draw
+        redo = redo[popcount(draw) != PICK_COUNT]
+    return masks
+
+
+def count_matches_masks(masks, winning_numbers):
+    """비트마스크 티켓 배열과 당첨 번호의 일치 개수 = popcount(티켓 & 당첨)"""
+    return popcount(masks & numbers_to_mask(winning_numbers))
+
+
+def match_histogram(match_counts):
+    """일치 개수(0~6)별 티켓 수"""
+    return np.bincount(match_counts, minlength=PICK_COUNT + 1)
+
+
+# 4. 대량 시뮬레이션
+def simulate_match_histogram(n, winning_numbers, rng=None, chunk_size=CHUNK_SIZE):
+    """n장의 티켓을 묶음 단위로 생성/비교하여 일치 개수별 티켓 수만 누적 (티켓 자체는 보관하지 않음)"""
+    rng = rng or np.random.default_rng()
+    histogram = np.zeros(PICK_COUNT + 1, dtype=np.int64)
+    done = 0
+    while done < n:
+        size = min(chunk_size, n - done)
+        histogram += match_histogram(count_matches_masks(generate_ticket_masks(size, rng), winning_numbers))
+        done += size
+    return histogram
+
+
+def summary_table(histogram):
+    """일치 개수별 세트 수 표 (페이지의 summary_table과 같은 형식)"""
+    return {
+        "일치 개수": [i for i in range(PICK_COUNT + 1)],
+        "세트 수": [int(histogram[i]) for i in range(PICK_COUNT + 1)],
+    }
+
+
+# 5. 등수 계산 (티켓 여러 장 x 회차 여러 개를 한 번에)
+# 일치 개수 -> 등수 (0 = 낙첨), 5개 일치 + 보너스 번호는 2등으로 따로 처리
+RANK_BY_MATCHES = np.array([0, 0, 0, 5, 4, 3, 1], dtype=np.uint8)
+RANKS = [1, 2, 3, 4, 5]
+
+
+def rank_matrix(ticket_masks, winning_masks, bonus_bits):
+    """(n,) 티켓 비트마스크와 (d,) 회차별 당첨 번호 마스크/보너스 비트로 (n, d) 등수 행렬을 계산
+
+    보너스 비트가 0인 회차(보너스 번호를 모르는 회차)는 2등이 나오지 않습니다.
+    """
+    ticket_masks = np.asarray(ticket_masks, dtype=np.uint64)
+    bonus_bits = np.asarray(bonus_bits, dtype=np.uint64)
+    matches = popcount(ticket_masks[:, None] & np.asarray(winning_masks, dtype=np.uint64)[None, :])
+    ranks = RANK_BY_MATCHES[matches]
+    # 5개 일치는 드물기 때문에 그 칸만 골라 보너스 번호를 확인
+    tickets, draws = np.nonzero(matches == 5)
+    second = (ticket_masks[tickets] & bonus_bits[draws]) != 0
+    ranks[tickets[second], draws[second]] = 2
+    return ranks
+
+
+def rank_counts(ranks):
+    """등수 배열(모양 상관없음)에서 등수(1~5)별 개수, 0번 칸은 낙첨 수"""
+    return np.bincount(np.asarray(ranks).ravel(), minlength=len(RANKS) + 1)
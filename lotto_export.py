@@ -0,0 +1,68 @@
+"""대량 티켓 생성 후 CSV/Parquet 파일로 내보내기
+
+티켓을 CHUNK_SIZE장씩 (묶음, 6) uint8 배열로 만들어 파일에 바로 이어 쓰고 버리므로
+티켓 수와 관계없이 메모리 사용량은 묶음 하나 크기(약 0.6 MB)로 일정합니다.
+파일 쓰기는 Streamlit과 함께 설치되는 pyarrow를 사용합니다.
+
+    with open("tickets.parquet", "wb") as f:
+        export_tickets(f, 1_000_000, "parquet", seed=0)
+"""
+import time
+
+import numpy as np
+
+from lotto_engine import PICK_COUNT, generate_tickets
+
+# 한 번에 만들어 파일에 쓰는 티켓 수
+CHUNK_SIZE = 100_000
+
+# 형식 이름 -> (파일 확장자, MIME 형식)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+COLUMN_NAMES = [f"번호{i}" for i in range(1, PICK_COUNT + 1)]
+
+
+def _chunk_table(tickets):
+    """(묶음, 6) 배열 -> 번호 열 6개짜리 Arrow 표 (열마다 uint8 배열을 그대로 사용)"""
+    import pyarrow as pa
+
+    return pa.table({name: tickets[:, i] for i, name in enumerate(COLUMN_NAMES)})
+
+
+def _open_writer(file, fmt, schema):
+    if fmt == "CSV":
+        import pyarrow.csv as pa_csv
+
+        # 엑셀에서 한글 열 이름이 깨지지 않도록 UTF-8 BOM을 먼저 씀
+        file.write("\ufeff".encode("utf-8"))
+        return pa_csv.CSVWriter(file, schema)
+    import pyarrow.parquet as pq
+
+    return pq.ParquetWriter(file, schema, compression="zstd")
+
+
+def export_tickets(file, n, fmt="CSV", seed=None, chunk_size=CHUNK_SIZE, on_progress=None):
+    """n장의 티켓을 묶음 단위로 만들어 file(바이너리 파일 객체)에 fmt 형식으로 씀
+
+    on_progress(완료한 장 수, 경과 시간 초)는 묶음 하나를 쓸 때마다 호출됩니다. 반환값은 쓴 장 수입니다.
+    """
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    writer = None
+    done = 0
+    try:
+        while done < n:
+            table = _chunk_table(generate_tickets(min(chunk_size, n - done), rng))
+            if writer is None:
+                writer = _open_writer(file, fmt, table.schema)
+            writer.write_table(table)
+            done += table.num_rows
+            if on_progress:
+                on_progress(done, time.perf_counter() - start)
+    finally:
+        if writer is not None:
+            writer.close()
+    return done
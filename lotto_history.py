@@ -0,0 +1,117 @@
+"""역대 로또 당첨 번호 저장소 (오프라인 가져오기 + 불러오기)
+
+당첨 번호는 data/lotto_history.npy 에 (마지막 회차, 7) uint8 배열로 저장합니다.
+i번째 행 = (i+1)회차의 번호 6개(오름차순)와 보너스 번호, 모두 0인 행은 아직 넣지 않은 회차이고
+보너스 번호가 0이면 보너스 번호를 모르는 회차입니다. (1,200회 분량이 약 8 KB)
+
+저장소 파일은 리포지토리에 포함되어 있지 않습니다. 동행복권에서 내려받은 당첨 번호를
+'회차, 번호1~6, 보너스' 열이 있는 CSV로 저장한 뒤 아래 명령으로 만듭니다. (기존 파일이 있으면 합쳐 넣고,
+같은 회차는 CSV 값으로 바꿈) 파일이 생기면 로또 페이지에 회차 선택과 역대 회차 비교 표가 나타납니다.
+    python lotto_history.py draws.csv
+"""
+import argparse
+import csv
+import functools
+from pathlib import Path
+
+import numpy as np
+
+from lotto_engine import LOTTO_MAX, NUMBER_BITS, PICK_COUNT, rank_matrix
+
+HISTORY_PATH = Path(__file__).resolve().parent / "data" / "lotto_history.npy"
+
+
+# --- 1. 저장소 만들기 (오프라인) ---
+def _check_draw(round_no, numbers, bonus):
+    if round_no < 1:
+        raise ValueError(f"회차는 1 이상이어야 합니다: {round_no}")
+    if len(set(numbers)) != PICK_COUNT or not all(1 <= n <= LOTTO_MAX for n in numbers):
+        raise ValueError(f"{round_no}회: 1~{LOTTO_MAX} 사이의 서로 다른 번호 {PICK_COUNT}개가 아닙니다: {numbers}")
+    if bonus and (bonus in numbers or not 1 <= bonus <= LOTTO_MAX):
+        raise ValueError(f"{round_no}회: 보너스 번호가 잘못되었습니다: {bonus}")
+
+
+def build_history(draws, history=None):
+    """(회차, 번호 6개, 보너스 번호) 목록으로 저장소 배열을 만듦 (history가 있으면 그 위에 덮어씀)"""
+    draws = list(draws)
+    last_round = max([round_no for round_no, _, _ in draws] + [len(history) if history is not None else 0])
+    table = np.zeros((last_round, PICK_COUNT + 1), dtype=np.uint8)
+    if history is not None:
+        table[:len(history)] = history
+    for round_no, numbers, bonus in draws:
+        _check_draw(round_no, numbers, bonus)
+        table[round_no - 1] = sorted(numbers) + [bonus or 0]
+    return table
+
+
+def read_draws_csv(path):
+    """'회차, 번호1~6, 보너스' 열이 있는 CSV에서 (회차, 번호 6개, 보너스 번호) 목록을 읽음"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        return [
+            (int(row["회차"]), [int(row[f"번호{i}"]) for i in range(1, PICK_COUNT + 1)], int(row.get("보너스") or 0))
+            for row in reader
+        ]
+
+
+def save_history(history, path=HISTORY_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, history)
+
+
+# --- 2. 불러오기 (앱 실행 시, 프로세스당 한 번) ---
+@functools.lru_cache(maxsize=None)
+def load_history(path=HISTORY_PATH):
+    """저장소 파일을 읽어 들어 있는 회차만 모은 딕셔너리로 반환 (모든 세션 공유)
+
+    파일이 없으면 FileNotFoundError가 발생합니다.
+    rounds: 회차 번호 (오름차순), numbers: (d, 6) 번호, bonus: (d,) 보너스 번호 (0 = 모름)
+    winning_masks / bonus_bits: 등수 계산용 비트마스크
+    """
+    table = np.load(path)
+    present = np.flatnonzero(table[:, 0])
+    numbers = table[present, :PICK_COUNT]
+    bonus = table[present, PICK_COUNT]
+    return {
+        "rounds": present + 1,
+        "numbers": numbers,
+        "bonus": bonus,
+        "winning_masks": np.bitwise_or.reduce(NUMBER_BITS[numbers], axis=1),
+        "bonus_bits": np.where(bonus > 0, NUMBER_BITS[bonus], np.uint64(0)),
+    }
+
+
+def available_rounds(path=HISTORY_PATH):
+    """저장소에 있는 회차 번호 목록 (최근 회차부터)"""
+    return load_history(path)["rounds"][::-1].tolist()
+
+
+def get_draw(round_no, path=HISTORY_PATH):
+    """회차 하나의 (번호 6개 리스트, 보너스 번호 또는 None)"""
+    history = load_history(path)
+    index = np.searchsorted(history["rounds"], round_no)
+    if index == len(history["rounds"]) or history["rounds"][index] != round_no:
+        raise KeyError(f"{round_no}회 당첨 번호가 저장소에 없습니다.")
+    bonus = int(history["bonus"][index])
+    return history["numbers"][index].tolist(), bonus or None
+
+
+# --- 3. 역대 회차와 비교 ---
+def score_against_history(ticket_masks, path=HISTORY_PATH):
+    """티켓 비트마스크 배열을 저장소의 모든 회차와 한 번에 비교한 (티켓 수, 회차 수) 등수 행렬"""
+    history = load_history(path)
+    return rank_matrix(ticket_masks, history["winning_masks"], history["bonus_bits"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="역대 로또 당첨 번호 저장소 만들기")
+    parser.add_argument("csv", type=Path, help="'회차, 번호1~6, 보너스' 열이 있는 CSV 파일")
+    parser.add_argument("--out", type=Path, default=HISTORY_PATH)
+    parser.add_argument("--replace", action="store_true", help="기존 저장소와 합치지 않고 CSV 내용만 저장")
+    args = parser.parse_args()
+
+    existing = None if args.replace or not args.out.exists() else np.load(args.out)
+    history = build_history(read_draws_csv(args.csv), existing)
+    save_history(history, args.out)
+    print(f"{int(np.count_nonzero(history[:, 0]))}개 회차를 {args.out}에 저장했습니다. ({history.nbytes / 1024:.1f} KB)")
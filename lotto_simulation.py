@@ -0,0 +1,102 @@
+"""여러 프로세스로 나눠 돌리는 대량 로또 시뮬레이션 (최대 수십억 장)
+
+전체 티켓을 TASK_SIZE장씩 작업으로 나누고, 작업 i는 SeedSequence(seed, spawn_key=(i,))로 만든 난수열을 씁니다.
+작업이 끝나는 순서나 작업자 수와 관계없이 같은 시드면 같은 결과가 나옵니다.
+iter_simulation은 작업이 끝날 때마다 누적 히스토그램을 내보내므로 페이지에서 표를 바로바로 갱신할 수 있고,
+제너레이터를 닫으면(사용자가 페이지를 떠나거나 다른 버튼을 눌러 스크립트가 멈추면) 남은 작업을 취소합니다.
+
+    for done, histogram in iter_simulation(1_000_000_000, {3, 15, 27, 33, 34, 36}, seed=0):
+        ...
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from math import comb
+
+import numpy as np
+
+from lotto_engine import LOTTO_MAX, PICK_COUNT, simulate_match_histogram
+
+# 작업 하나의 티켓 수 (작업자 한 명이 약 1초에 처리하는 양, 표는 작업 하나가 끝날 때마다 갱신)
+TASK_SIZE = 10_000_000
+# 동시에 큐에 넣어 두는 작업 수 = 작업자 수 x 이 값 (취소했을 때 버려지는 계산량 제한)
+TASKS_PER_WORKER = 2
+
+# 프로세스당 하나의 작업자 풀 (모든 세션 공유, 처음 쓸 때 만듦)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def worker_count():
+    return os.cpu_count() or 1
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Streamlit 서버는 스레드를 여러 개 쓰므로 fork 대신 spawn으로 작업자를 만듦
+            _pool = ProcessPoolExecutor(max_workers=worker_count(), mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+# --- 1. 이론값 (초기하분포) ---
+def exact_match_probabilities():
+    """티켓 한 장이 당첨 번호와 k개(0~6) 일치할 정확한 확률 = C(6,k) C(39,6-k) / C(45,6)"""
+    total = comb(LOTTO_MAX, PICK_COUNT)
+    return np.array([
+        comb(PICK_COUNT, k) * comb(LOTTO_MAX - PICK_COUNT, PICK_COUNT - k) / total
+        for k in range(PICK_COUNT + 1)
+    ])
+
+
+# --- 2. 작업 나누기 ---
+def _run_task(seed, task_index, size, winning_numbers):
+    """작업자 프로세스에서 실행: 작업 번호로 정해지는 독립 난수열로 size장을 시뮬레이션"""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(task_index,)))
+    return simulate_match_histogram(size, winning_numbers, rng)
+
+
+def _task_sizes(n, task_size):
+    full, rest = divmod(n, task_size)
+    return [task_size] * full + ([rest] if rest else [])
+
+
+def iter_simulation(n, winning_numbers, seed=0, task_size=TASK_SIZE):
+    """n장을 작업자 풀에서 나눠 시뮬레이션하며, 작업이 하나 끝날 때마다 (완료한 장 수, 누적 히스토그램)을 내보냄
+
+    제너레이터가 닫히거나 버려지면 아직 시작하지 않은 작업은 취소합니다.
+    """
+    pool = _get_pool()
+    winning_numbers = sorted(winning_numbers)
+    pending_tasks = list(enumerate(_task_sizes(n, task_size)))[::-1]
+    max_in_flight = worker_count() * TASKS_PER_WORKER
+    in_flight = {}
+    histogram = np.zeros(PICK_COUNT + 1, dtype=np.int64)
+    done = 0
+    try:
+        while pending_tasks or in_flight:
+            while pending_tasks and len(in_flight) < max_in_flight:
+                task_index, size = pending_tasks.pop()
+                in_flight[pool.submit(_run_task, seed, task_index, size, winning_numbers)] = size
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done += in_flight.pop(future)
+                histogram += future.result()
+            yield done, histogram.copy()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+# --- 3. 화면 표 ---
+def simulation_table(histogram, done):
+    """일치 개수별 세트 수, 시뮬레이션 비율, 이론 확률(초기하분포) 표"""
+    exact = exact_match_probabilities()
+    return {
+        "일치 개수": list(range(PICK_COUNT + 1)),
+        "세트 수": [int(count) for count in histogram],
+        "비율": [f"{count / done:.7%}" if done else "-" for count in histogram],
+        "이론 확률": [f"{p:.7%}" for p in exact],
+    }
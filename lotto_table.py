@@ -0,0 +1,60 @@
+"""로또 결과를 표 하나(st.dataframe)로 보여 주기 위한 DataFrame 만들기
+
+세트마다 st.markdown/st.info를 따로 보내면 세트 수만큼 delta가 생기므로,
+번호/일치 개수/등수/이모지를 열 단위 NumPy 배열로 만든 DataFrame 하나로 보냅니다.
+번호 열은 숫자 그대로 두어 정렬이 숫자 순서로 되고, 당첨 번호 강조는 pandas Styler로 칸 전체를 한 번에 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from lotto_engine import LOTTO_MAX, PICK_COUNT
+
+NUMBER_COLUMNS = [f"번호{i}" for i in range(1, PICK_COUNT + 1)]
+
+# 등수/이모지 열은 범주형(Categorical)으로 만들어 Arrow 사전(dictionary) 열로 보냄
+# (칸마다 문자열 대신 1바이트 코드만 보내므로 세트 수가 늘어도 전송량이 숫자 열과 비슷하게 늘어남)
+# 일치 개수(0~6) -> 이모지 (3개 이상 🎉, 1개 이상 😊, 0개 🧐)
+MATCH_EMOJI = np.array([0, 1, 1, 2, 2, 2, 2], dtype=np.int8)
+MATCH_EMOJI_TEXT = ["🧐", "😊", "🎉"]
+# 등수(0~5) -> 표시 문자열 (0 = 낙첨)
+RANK_LABELS = ["", "1등", "2등", "3등", "4등", "5등"]
+# 당첨 번호 칸의 CSS
+WINNING_STYLE = "background-color: #ffe08a; font-weight: bold"
+# Styler는 칸마다 CSS와 표시 문자열을 따로 보내 1,000세트에 약 0.1초, 10,000세트에 약 1.2초가 걸리므로
+# 이보다 세트가 많으면 강조 없이 숫자 표만 보냄
+HIGHLIGHT_MAX_ROWS = 1_000
+
+
+def tickets_frame(tickets, label="세트"):
+    """(n, 6) 티켓 배열 -> 번호 열 6개짜리 DataFrame (첫 열은 1부터 시작하는 세트 번호)"""
+    tickets = np.asarray(tickets)
+    frame = pd.DataFrame(tickets, columns=NUMBER_COLUMNS)
+    frame.insert(0, label, np.arange(1, len(tickets) + 1))
+    return frame
+
+
+def results_frame(tickets, match_counts, ranks):
+    """티켓, 일치 개수, 등수 배열 -> 결과 DataFrame (세트, 번호1~6, 일치, 등수, 결과)"""
+    frame = tickets_frame(tickets)
+    frame["일치"] = np.asarray(match_counts)
+    frame["등수"] = pd.Categorical.from_codes(np.asarray(ranks, dtype=np.int8), categories=RANK_LABELS)
+    frame["결과"] = pd.Categorical.from_codes(MATCH_EMOJI[np.asarray(match_counts)], categories=MATCH_EMOJI_TEXT)
+    return frame
+
+
+def _winning_cells(numbers, winning_numbers):
+    """번호 열 전체 -> 같은 모양의 CSS 표 (번호 -> 당첨 여부 변환표로 한 번에 계산)"""
+    is_winning = np.zeros(LOTTO_MAX + 1, dtype=bool)
+    is_winning[list(winning_numbers)] = True
+    styles = np.where(is_winning[numbers.to_numpy()], WINNING_STYLE, "")
+    return pd.DataFrame(styles, index=numbers.index, columns=numbers.columns)
+
+
+def highlight_winning(frame, winning_numbers):
+    """번호 열의 당첨 번호 칸을 강조한 Styler (값은 숫자 그대로)
+
+    frame이 HIGHLIGHT_MAX_ROWS행보다 길면 강조하지 않고 frame을 그대로 반환합니다.
+    """
+    if len(frame) > HIGHLIGHT_MAX_ROWS:
+        return frame
+    return frame.style.apply(_winning_cells, axis=None, subset=NUMBER_COLUMNS, winning_numbers=winning_numbers)
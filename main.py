@@ -1,4 +1,9 @@
 import streamlit as st
 
+from warmup import start_warm_up
+
+# 서버 예열: 무거운 모듈 import와 기본 입력 캐시를 백그라운드에서 미리 준비
+start_warm_up()
+
 st.title('나의 첫 streamlit 프로젝트')
 st.write('hello streamlit!')
@@ -0,0 +1,137 @@
+"""퀴즈 세션 상태 메모리 보고서 (세션 하나가 session_state에 들고 있는 바이트 수)
+
+교과서 퀴즈(유리함수 교과서/04)의 세션 상태를 두 가지 표현으로 만들어 크기를 비교합니다.
+    이전: 문제마다 SymPy 식/정확한 값과 식, 정답, 풀이 문자열을 담은 딕셔너리 30개
+    현재: 문제마다 계수 튜플 (a, b, c, d) 30개 (정답/식/풀이는 problem_bank.PROBLEM_CACHE에서 공유)
+같은 계수로 두 표현을 만들기 때문에 차이는 저장 방식에서만 생깁니다.
+
+    python memory_report.py
+    python memory_report.py --sessions 500
+"""
+import argparse
+import sys
+from collections import deque
+
+from problem_bank import PROBLEM_CACHE, problem_info, sample_problem_params
+
+DEFAULT_PROBLEMS = 30
+DEFAULT_SESSIONS = 300
+
+
+# --- 1. 객체 크기 재기 ---
+def deep_sizeof(obj):
+    """obj와 obj가 참조하는 모든 객체의 크기 합(바이트), 여러 번 참조된 객체는 한 번만 셈
+
+    컨테이너(dict, list, tuple, set)와 __dict__/__slots__ 속성을 따라갑니다. 모듈, 클래스, 함수는 세지 않습니다.
+    """
+    seen = set()
+    total = 0
+    stack = deque([obj])
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, (type, type(sys), type(deep_sizeof))):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        if hasattr(item, "__dict__"):
+            stack.append(vars(item))
+        for slot in getattr(type(item), "__slots__", ()):
+            if hasattr(item, slot):
+                stack.append(getattr(item, slot))
+    return total
+
+
+# --- 2. 세션 상태 만들기 ---
+def _legacy_problem(params, problem_id):
+    """예전 퀴즈가 세션 상태에 저장하던 것과 같은 필드의 문제 딕셔너리 (SymPy 객체 포함)"""
+    import sympy as sp
+
+    a, b, c, d = params
+    x = sp.Symbol('x')
+    numer, denom = a * x + b, c * x + d
+    va, ha = sp.Rational(-d, c), sp.Rational(a, c)
+    info = problem_info(params)
+    return {
+        'id': problem_id,
+        'function': sp.simplify(numer / denom),
+        'function_str': f"({sp.latex(numer)})/({sp.latex(denom)})",
+        'va_ans': info['va_ans'],
+        'ha_ans': info['ha_ans'],
+        # 문자열은 세션마다 새로 만들어졌으므로 공유 캐시의 문자열과 다른 객체로 복사
+        'explanation': "".join(list(info['explanation'])),
+        'va_val': float(va),
+        'ha_val': float(ha),
+        'va_exact': va,
+        'ha_exact': ha,
+    }
+
+
+def _session_state(problems):
+    num_problems = len(problems)
+    return {
+        'problems': problems,
+        'problems_difficulty': "보통",
+        'current_index': 0,
+        'attempts': [0] * num_problems,
+        'show_solution': [False] * num_problems,
+        'feedback_message': "",
+    }
+
+
+def legacy_session_state(params_list):
+    return _session_state([_legacy_problem(params, i + 1) for i, params in enumerate(params_list)])
+
+
+def compact_session_state(params_list):
+    return _session_state(list(params_list))
+
+
+def memory_report(num_problems=DEFAULT_PROBLEMS, sessions=DEFAULT_SESSIONS, rng=None):
+    """세션 하나의 바이트 수(이전/현재)와 공유 캐시 크기, 세션 sessions개일 때의 합계를 계산"""
+    import numpy as np
+
+    params_list = sample_problem_params(num_problems, rng or np.random.default_rng(0))
+    legacy = deep_sizeof(legacy_session_state(params_list))
+    compact = deep_sizeof(compact_session_state(params_list))
+
+    # 이 문제들의 정답/식/풀이를 공유 캐시에 채운 뒤 캐시 전체 크기를 잼 (프로세스당 한 번만 듦)
+    PROBLEM_CACHE.clear()
+    for params in params_list:
+        problem_info(params)
+    shared = deep_sizeof(PROBLEM_CACHE._data)
+    return {
+        "problems": num_problems,
+        "legacy_bytes": legacy,
+        "compact_bytes": compact,
+        "shared_cache_bytes": shared,
+        "sessions": sessions,
+        "legacy_total_mb": legacy * sessions / 2**20,
+        # 모든 세션이 같은 문제 은행에서 뽑으므로 캐시는 최대 크기(PROBLEM_CACHE.max_entries)를 넘지 않음
+        "compact_total_mb": (compact * sessions + shared / num_problems * PROBLEM_CACHE.max_entries) / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="퀴즈 세션 상태 메모리 보고서")
+    parser.add_argument("--problems", type=int, default=DEFAULT_PROBLEMS, help="세션 하나의 문제 수")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help="합계를 계산할 동시 세션 수")
+    args = parser.parse_args()
+
+    report = memory_report(args.problems, args.sessions)
+    print(f"퀴즈 세션 상태 (문제 {report['problems']}개)")
+    print(f"  이전 (SymPy 딕셔너리): {report['legacy_bytes']:>9,d} 바이트/세션")
+    print(f"  현재 (계수 튜플)     : {report['compact_bytes']:>9,d} 바이트/세션  "
+          f"({report['legacy_bytes'] / report['compact_bytes']:.0f}배 작음)")
+    print(f"  공유 캐시            : {report['shared_cache_bytes']:>9,d} 바이트 (문제 {report['problems']}개분, 프로세스당 한 번)")
+    print(f"\n동시 세션 {report['sessions']}개일 때")
+    print(f"  이전: {report['legacy_total_mb']:8.1f} MB")
+    print(f"  현재: {report['compact_total_mb']:8.1f} MB (가득 찬 공유 캐시 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""페이지별 단계 시간 측정 (재실행 시간이 어디에 쓰이는지 보기 위한 가벼운 타이밍 구간)
+
+    set_page(__file__)                       # 페이지 맨 위에서 한 번 (이 스레드의 페이지 이름)
+    with span("parse", detail=func_str):     # 단계 하나를 감쌈
+        ...
+
+측정값은 (페이지, 단계)마다 최근 WINDOW개만 보관하는 순환 버퍼와 가장 느렸던 입력 몇 개로 모아 두고,
+pages/07 관리자 페이지에서 분위수와 히스토그램으로 보여 줍니다.
+구간 하나의 비용은 perf_counter 두 번과 deque 추가 정도(수 마이크로초)라 운영 중에도 켜 둘 수 있습니다.
+캐시를 쓰는 단계(파싱, 분석, 렌더링)는 실제로 계산하는 캐시 실패만 시간을 재고, 캐시 적중은 record_hit으로
+횟수만 세어 관리자 페이지에서 실패 지연 시간 옆에 적중/실패 비율을 함께 보여 줍니다.
+
+    if result is not None:
+        record_hit("parse")
+"""
+import heapq
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+# 단계 이름 (페이지에서 쓰는 값)
+PHASES = {
+    "parse": "입력 파싱",
+    "analysis": "분석 (점근선, 정의역/치역 등)",
+    "sympy": "SymPy 계산",
+    "evaluate": "NumPy 계산 (샘플링, 로또 생성/비교)",
+    "grade": "채점",
+    "render": "그래프 렌더링 (Vega-Lite 명세 / Matplotlib PNG)",
+    "emit": "Streamlit 출력 (delta 전송)",
+}
+
+# (페이지, 단계)마다 보관할 최근 측정값 수와 느린 입력 예시 수
+WINDOW = 1000
+SLOWEST = 5
+
+BACKGROUND_PAGE = "(백그라운드)"
+
+ROOT = Path(__file__).resolve().parent
+
+
+class PhaseStats:
+    """한 (페이지, 단계)의 측정값: 최근 WINDOW개 순환 버퍼 + 전체 횟수/합계 + 가장 느린 입력 + 캐시 적중 횟수"""
+
+    def __init__(self, window=WINDOW, slowest=SLOWEST):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max_slowest = slowest
+        # (초, 입력 설명) 최소 힙: 가장 빠른 것이 맨 앞이라 새 값과 바로 비교 가능
+        self.slowest = []
+        # 시간을 재지 않은 캐시 적중 횟수
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds, detail=None):
+        with self._lock:
+            self.samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            if detail is None:
+                return
+            if len(self.slowest) < self.max_slowest:
+                heapq.heappush(self.slowest, (seconds, str(detail)))
+            elif seconds > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, (seconds, str(detail)))
+
+    def summary(self):
+        """최근 측정값의 분위수(ms)와 전체 횟수/평균, 캐시 적중 횟수/비율"""
+        import numpy as np
+
+        with self._lock:
+            samples = np.array(self.samples)
+            count, total, hits = self.count, self.total, self.hits
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1000 if samples.size else (0.0, 0.0, 0.0)
+        return {
+            "count": count,
+            "mean_ms": total / count * 1000 if count else 0.0,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(samples.max()) * 1000 if samples.size else 0.0,
+            "hits": hits,
+            "hit_rate": hits / (hits + count) if hits + count else 0.0,
+        }
+
+    def histogram(self, bins=20):
+        """최근 측정값의 로그 간격 히스토그램 -> (구간 경계 ms 배열, 개수 배열)"""
+        import numpy as np
+
+        with self._lock:
+            samples = np.array(self.samples) * 1000
+        if not samples.size:
+            return np.array([]), np.array([])
+        low, high = max(samples.min(), 1e-3), max(samples.max(), 1e-3)
+        edges = np.geomspace(low, high * 1.0001, bins + 1) if high > low else np.array([low, low * 1.0001])
+        counts, edges = np.histogram(np.clip(samples, low, None), bins=edges)
+        return edges, counts
+
+    def slowest_inputs(self):
+        """가장 느렸던 입력 [(ms, 입력 설명)] (느린 것부터)"""
+        with self._lock:
+            return [(seconds * 1000, detail) for seconds, detail in sorted(self.slowest, reverse=True)]
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+# Streamlit은 세션의 스크립트를 스레드에서 실행하므로 현재 페이지는 스레드마다 따로 기억
+_local = threading.local()
+
+
+# --- 1. 기록 ---
+def set_page(page):
+    """이 스레드(= 지금 실행 중인 세션 스크립트)의 페이지 이름 설정
+
+    파일 경로를 넣으면 저장소 기준 경로에서 .py를 뗀 이름을 씁니다. (pages/04와 교과서 04를 구분)
+    """
+    if page.endswith(".py"):
+        path = Path(page).resolve()
+        page = str(path.relative_to(ROOT).with_suffix("")) if path.is_relative_to(ROOT) else path.stem
+    _local.page = page
+
+
+def current_page():
+    return getattr(_local, "page", BACKGROUND_PAGE)
+
+
+def phase_stats(page, phase):
+    key = (page, phase)
+    stats = _stats.get(key)
+    if stats is None:
+        with _stats_lock:
+            stats = _stats.setdefault(key, PhaseStats())
+    return stats
+
+
+def record(phase, seconds, detail=None, page=None):
+    phase_stats(page or current_page(), phase).record(seconds, detail)
+
+
+def record_hit(phase, page=None):
+    """캐시 적중 한 번을 현재 페이지의 단계에 기록 (시간은 재지 않음)
+
+    캐시 적중 경로마다 불리므로 함수 호출을 줄여 직접 찾음 (약 0.7us)
+    """
+    key = (page or getattr(_local, "page", BACKGROUND_PAGE), phase)
+    stats = _stats.get(key) or phase_stats(*key)
+    with stats._lock:
+        stats.hits += 1
+
+
+class span:
+    """with span("render", detail=제목): ... 블록의 실행 시간을 현재 페이지의 단계에 기록
+
+    예외가 나도 기록합니다. contextmanager 데코레이터보다 가벼운 클래스로 구현했습니다.
+    """
+
+    __slots__ = ("phase", "detail", "start")
+
+    def __init__(self, phase, detail=None):
+        self.phase = phase
+        self.detail = detail
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.phase, time.perf_counter() - self.start, self.detail)
+        return False
+
+
+# --- 2. 조회 (관리자 페이지) ---
+def snapshot():
+    """(페이지, 단계)별 요약 행 목록 (페이지, 단계 순으로 정렬)"""
+    with _stats_lock:
+        items = sorted(_stats.items())
+    return [{"page": page, "phase": phase, **stats.summary()} for (page, phase), stats in items]
+
+
+def keys():
+    with _stats_lock:
+        return sorted(_stats)
+
+
+def reset():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,112 @@
+import ast
+
+import numpy as np
+
+from app_cache import LRUCache
+
+# 식 -> NumPy 벡터 함수 캐시 (같은 식이면 파싱/컴파일 없이 바로 재사용)
+EVALUATOR_CACHE = LRUCache(max_entries=256)
+
+# 입력 식에서 허용하는 함수와 상수 (np.sin(x)처럼 써도 되고 sin(x)처럼 써도 됨)
+ALLOWED_FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "log": np.log,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+}
+ALLOWED_CONSTANTS = {
+    "pi": np.pi,
+    "e": np.e,
+}
+_ALLOWED_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+_ALLOWED_UNARYOPS = (ast.UAdd, ast.USub)
+
+
+class ExpressionError(ValueError):
+    """허용되지 않는 식 (임의의 파이썬 코드 등)"""
+
+
+def _check_node(node):
+    """숫자, x, 사칙연산/거듭제곱, 허용된 함수 호출만 남아 있는지 확인"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return
+    if isinstance(node, ast.Name) and (node.id == "x" or node.id in ALLOWED_CONSTANTS):
+        return
+    if isinstance(node, ast.BinOp) and isinstance(node.op, _ALLOWED_BINOPS):
+        _check_node(node.left)
+        _check_node(node.right)
+        return
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, _ALLOWED_UNARYOPS):
+        _check_node(node.operand)
+        return
+    if isinstance(node, ast.Call) and len(node.args) == 1 and not node.keywords:
+        func = node.func
+        # sin(x) 또는 np.sin(x) 형태만 허용
+        if isinstance(func, ast.Name) and func.id in ALLOWED_FUNCTIONS:
+            _check_node(node.args[0])
+            return
+        if (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+                and func.value.id == "np" and func.attr in ALLOWED_FUNCTIONS):
+            _check_node(node.args[0])
+            return
+    position = getattr(node, "col_offset", None)
+    where = f" (위치 {position + 1})" if position is not None else ""
+    raise ExpressionError(f"허용되지 않는 표현이 포함되어 있습니다{where}: {ast.unparse(node)}")
+
+
+class _FloatConstants(ast.NodeTransformer):
+    """정수 상수를 실수로 바꿈 (9**9**9 같은 상수 식이 파이썬 정수 거듭제곱으로 서버를 멈추지 않도록)"""
+
+    def visit_Constant(self, node):
+        return ast.copy_location(ast.Constant(float(node.value)), node)
+
+
+def _vectorized(func):
+    """상수 식도 입력 x와 같은 모양의 배열을 반환하도록 감쌈"""
+    def wrapper(x_vals):
+        result = func(x_vals)
+        if np.ndim(result) == 0:
+            return np.full(np.shape(x_vals), result, dtype=float)
+        return result
+    return wrapper
+
+
+def compile_expression(expression):
+    """x에 대한 식 문자열을 한 번 파싱/검사하여 NumPy 벡터 함수로 컴파일"""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+        _check_node(tree.body)
+        body = _FloatConstants().visit(tree.body)
+    except SyntaxError as e:
+        raise ExpressionError(f"식의 형식이 올바르지 않습니다 (위치 {e.offset}): {expression}") from e
+    except RecursionError as e:
+        raise ExpressionError(f"괄호가 너무 깊게 겹쳐 있습니다: {expression[:20]}...") from e
+    except OverflowError as e:
+        raise ExpressionError(f"숫자가 너무 큽니다: {expression[:20]}...") from e
+
+    # lambda x: <식> 형태로 감싸서 한 번만 컴파일
+    lambda_node = ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg="x")], kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=body,
+    )
+    code = compile(ast.fix_missing_locations(ast.Expression(body=lambda_node)), "<expression>", "eval")
+    namespace = {"__builtins__": {}, "np": np, **ALLOWED_FUNCTIONS, **ALLOWED_CONSTANTS}
+    return _vectorized(eval(code, namespace))
+
+
+def get_evaluator(expression):
+    """식(문자열 또는 SymPy 식)에 해당하는 NumPy 벡터 함수를 캐시에서 가져오거나 새로 만듦"""
+    if isinstance(expression, str):
+        key = ("str", expression.replace(" ", ""))
+        return EVALUATOR_CACHE.get_or_create(key, lambda: compile_expression(expression))
+
+    # SymPy 식은 lambdify로 컴파일 (sympy는 이 경우에만 필요)
+    import sympy as sp
+
+    key = ("sympy", sp.srepr(expression))
+    return EVALUATOR_CACHE.get_or_create(
+        key, lambda: _vectorized(sp.lambdify(sp.Symbol('x'), expression, 'numpy'))
+    )
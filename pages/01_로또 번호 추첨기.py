@@ -1,6 +1,21 @@
+from contextlib import closing
+
 import streamlit as st
-import random
-from collections import Counter
+
+from lotto_engine import (
+    NUMBER_BITS, RANKS, count_matches_masks, generate_ticket_masks, masks_to_tickets, match_histogram,
+    numbers_to_mask, rank_counts, rank_matrix, summary_table
+)
+from lotto_history import HISTORY_PATH, available_rounds, get_draw, score_against_history
+from lotto_simulation import iter_simulation, simulation_table, worker_count
+from lotto_table import HIGHLIGHT_MAX_ROWS, highlight_winning, results_frame
+from metrics import set_page, span
+from warmup import start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+# 단계별 시간 측정에 쓸 페이지 이름 (pages/07 관리자 페이지에서 확인)
+set_page(__file__)
 
 # 1. 앱 기본 설정
 st.set_page_config(
@@ -9,36 +24,29 @@ st.set_page_config(
 )
 
 st.title("🍀 로또 번호 추천기 (1-45, 6개)")
-st.caption("원하는 세트 수만큼 로또 번호를 추천받고 최근 당첨 번호와 비교해 보세요!")
-
-# 2. 최근 1등 당첨 번호 (검색 결과 기준, 1195회)
-# 검색 결과: 1195회 로또 당첨번호 '3, 15, 27, 33, 34, 36'
-RECENT_WINNING_NUMBERS = {3, 15, 27, 33, 34, 36}
-
-# 3. 로또 번호 생성 함수
-def generate_lotto_numbers():
-    """1부터 45 사이의 겹치지 않는 6개의 숫자를 오름차순으로 생성"""
-    # random.sample: 주어진 범위(range(1, 46))에서 지정된 개수(6)만큼 중복 없이 무작위로 추출
-    numbers = random.sample(range(1, 46), 6)
-    numbers.sort()
-    return numbers
-
-# 4. 번호 비교 함수
-def compare_with_winning(generated_numbers, winning_numbers):
-    """생성된 번호와 당첨 번호를 비교하여 일치하는 개수를 반환"""
-    # 두 집합(set)의 교집합(intersection)을 구하고 그 크기(len)를 계산
-    match_count = len(set(generated_numbers) & winning_numbers)
-    return match_count
+st.caption("원하는 세트 수만큼 로또 번호를 추천받고 역대 당첨 번호와 비교해 보세요!")
 
+# 2. 비교할 회차 (역대 당첨 번호 저장소가 있으면 회차를 고르고, 기본값은 가장 최근 회차)
+# 저장소가 없으면 검색 결과 기준 1195회 로또 당첨번호 '3, 15, 27, 33, 34, 36' (보너스 번호 모름)
+HAS_HISTORY = HISTORY_PATH.exists()
+if HAS_HISTORY:
+    selected_round = st.selectbox("비교할 회차:", available_rounds(), format_func=lambda round_no: f"{round_no}회")
+    winning_numbers, bonus_number = get_draw(selected_round)
+else:
+    selected_round, winning_numbers, bonus_number = 1195, [3, 15, 27, 33, 34, 36], None
+RECENT_WINNING_NUMBERS = set(winning_numbers)
+
+# 3~4. 로또 번호 생성 및 비교는 lotto_engine 모듈 사용
+# (티켓 1장을 45비트 마스크로 저장하고, 일치 개수는 popcount(티켓 & 당첨 번호)로 계산)
 # 5. 사용자 입력 (몇 세트 생성할지)
 st.subheader("몇 세트를 생성하시겠어요?")
 num_sets = st.number_input(
     "로또 번호 세트 수:",
     min_value=1,
-    max_value=10,
+    max_value=10_000,
     value=1,
     step=1,
-    help="1세트부터 최대 10세트까지 선택 가능합니다."
+    help="1세트부터 최대 10,000세트까지 선택 가능합니다. (결과는 표 하나로 표시)"
 )
 
 # 6. 생성 버튼
@@ -46,43 +54,34 @@ if st.button("✨ 번호 생성하기", type="primary"):
     st.divider()
     st.subheader(f"🔮 로또 번호 추천 결과 ({num_sets} 세트)")
     
-    results = []
-    
-    # 입력된 세트 수만큼 번호 생성 및 비교
-    for i in range(1, num_sets + 1):
-        lotto_set = generate_lotto_numbers()
-        match_count = compare_with_winning(lotto_set, RECENT_WINNING_NUMBERS)
-        
-        # 결과를 저장 (비교를 위해 set 형태로도 저장)
-        results.append({
-            "set_num": i,
-            "numbers": lotto_set,
-            "match_count": match_count
-        })
-        
-        # 결과 출력 포맷 설정
-        numbers_str = ", ".join(map(str, lotto_set))
-        comparison_emoji = "🎉" if match_count >= 3 else ("😊" if match_count > 0 else "🧐")
-        
-        st.markdown(
-            f"**✅ 세트 {i}:** **`{numbers_str}`**"
-        )
-        st.info(f"{comparison_emoji} 최근 당첨 번호와 **{match_count}개** 일치합니다.")
+    # 입력된 세트 수만큼 번호를 한 번에 생성하고 비교
+    with span("evaluate", detail=f"{num_sets}세트"):
+        ticket_masks = generate_ticket_masks(num_sets)
+        match_counts = count_matches_masks(ticket_masks, RECENT_WINNING_NUMBERS)
+        tickets = masks_to_tickets(ticket_masks)
+        # 선택한 회차의 등수 (5개 일치 + 보너스 번호 = 2등, 보너스 번호를 모르면 2등 없음)
+        ranks = rank_matrix(ticket_masks, [numbers_to_mask(winning_numbers)], [NUMBER_BITS[bonus_number or 0]])[:, 0]
+
+    # 결과 전체를 표 하나로 출력 (당첨 번호 칸은 강조)
+    results = results_frame(tickets, match_counts, ranks)
+    st.dataframe(highlight_winning(results, RECENT_WINNING_NUMBERS), hide_index=True)
+    if num_sets > HIGHLIGHT_MAX_ROWS:
+        st.caption(f"세트가 {HIGHLIGHT_MAX_ROWS:,}개보다 많으면 당첨 번호 칸을 강조하지 않습니다. (일치 열로 정렬해 보세요)")
 
     st.divider()
 
     # 7. 최근 당첨 번호 정보 표시 및 비교 요약
     st.subheader("📊 최근 당첨 번호 비교 정보")
 
-    # 최근 당첨 번호 표시
+    # 선택한 회차의 당첨 번호 표시
     winning_str = ", ".join(map(str, sorted(list(RECENT_WINNING_NUMBERS))))
+    bonus_str = f" + 보너스 `{bonus_number}`" if bonus_number else " (보너스 번호 정보 없음)"
     st.markdown(
-        f"**🏆 최근 1등 당첨 번호 (1195회 기준):** **`{winning_str}`**"
+        f"**🏆 1등 당첨 번호 ({selected_round}회 기준):** **`{winning_str}`**{bonus_str}"
     )
 
     # 일치 개수 요약
-    all_match_counts = [res['match_count'] for res in results]
-    count_summary = Counter(all_match_counts)
+    all_match_counts = match_counts.tolist()
 
     st.markdown("### 일치 개수 요약")
     
@@ -99,13 +98,48 @@ if st.button("✨ 번호 생성하기", type="primary"):
             st.warning("다음 기회를 노려보세요!")
 
         # 일치 개수별 세트 수 표시
-        summary_table = {
-            "일치 개수": [i for i in range(7)],
-            "세트 수": [count_summary.get(i, 0) for i in range(7)]
-        }
-        
-        st.table(summary_table)
+        st.table(summary_table(match_histogram(match_counts)))
 
         st.caption("참고: 실제 로또 1등은 6개 숫자 모두 일치해야 합니다.")
+
+        # 이번에 뽑은 번호를 저장소의 모든 회차와 한 번에 비교 ((세트 수, 회차 수) 등수 행렬)
+        if HAS_HISTORY:
+            st.markdown("### 역대 모든 회차에 샀다면?")
+            with span("evaluate", detail=f"{num_sets}세트 x 역대 회차"):
+                history_counts = rank_counts(score_against_history(ticket_masks))
+            num_rounds = len(available_rounds())
+            st.table({
+                "등수": [f"{rank}등" for rank in RANKS] + ["낙첨"],
+                "횟수": [int(history_counts[rank]) for rank in RANKS] + [int(history_counts[0])],
+            })
+            st.caption(f"뽑은 {num_sets}세트를 저장된 {num_rounds}개 회차에 모두 샀을 때의 결과입니다. (총 {num_sets * num_rounds:,}장)")
     else:
         st.info("먼저 '번호 생성하기' 버튼을 눌러주세요.")
+
+# 8. 대량 시뮬레이션 (여러 프로세스로 나눠 최대 10억 장, 작업이 끝날 때마다 표를 갱신)
+st.divider()
+st.subheader("🧪 대량 시뮬레이션")
+num_tickets = st.number_input(
+    "시뮬레이션할 티켓 수:",
+    min_value=1_000,
+    max_value=1_000_000_000,
+    value=10_000_000,
+    step=10_000_000,
+    help=f"번호를 화면에 표시하지 않고 일치 개수 분포만 계산합니다. (최대 10억 장, 작업자 {worker_count()}개)"
+)
+seed = st.number_input("시드 (같은 시드면 같은 결과):", min_value=0, value=0, step=1)
+
+col_run, col_stop = st.columns(2)
+run_simulation = col_run.button("🚀 시뮬레이션 실행")
+# 다른 버튼을 누르거나 페이지를 떠나면 스크립트가 멈추면서 남은 작업이 취소됨
+col_stop.button("⏹ 중지")
+
+if run_simulation:
+    progress = st.progress(0.0)
+    table_slot = st.empty()
+    stream = iter_simulation(num_tickets, RECENT_WINNING_NUMBERS, seed=seed)
+    with closing(stream), span("evaluate", detail=f"시뮬레이션 {num_tickets:,}장"):
+        for done, histogram in stream:
+            progress.progress(done / num_tickets, text=f"{done:,} / {num_tickets:,}장")
+            table_slot.table(simulation_table(histogram, done))
+    st.caption("이론 확률: 45개 중 6개를 뽑을 때 당첨 번호와 k개가 일치할 확률 C(6,k)·C(39,6-k)/C(45,6)")
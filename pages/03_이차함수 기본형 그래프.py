@@ -1,6 +1,16 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
+
+from chart_backend import backend_selector
+from metrics import set_page
+from quadratic_family import draw_quadratic
+from warmup import start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+# 단계별 시간 측정에 쓸 페이지 이름 (pages/07 관리자 페이지에서 확인)
+set_page(__file__)
+
+backend_selector()
 
 # 페이지 제목 설정
 st.title('이차함수 그래프 기본형($y=ax^2$) 분석하기 📈')
@@ -21,30 +31,10 @@ st.markdown("---")
 
 st.header('2. 그래프 시각화')
 
-# x 범위 설정 및 y 값 계산
-x = np.linspace(-5, 5, 400) # -5부터 5까지 400개의 x값 생성
-y = a * x**2
-
-# Matplotlib을 이용한 그래프 그리기
-fig, ax = plt.subplots()
-
-# 그래프 그리기
-ax.plot(x, y, label=f'$y = {a}x^2$', color='blue')
-
-# 축 및 제목 설정
-ax.axhline(0, color='gray', linestyle='--', linewidth=0.5) # x축
-ax.axvline(0, color='gray', linestyle='--', linewidth=0.5) # y축
-ax.set_xlim(-5, 5)
-ax.set_ylim(-15, 15)
-ax.set_xlabel('$x$')
-ax.set_ylabel('$y$')
-ax.set_title('이차함수 $y=ax^2$ 그래프')
-ax.grid(True, linestyle=':', alpha=0.6)
-ax.legend()
-ax.set_aspect('equal', adjustable='box') # x, y 축 스케일 동일하게 설정
-
-# Streamlit에 Matplotlib 그래프 표시
-st.pyplot(fig)
+# 그래프 그리기 (브라우저 렌더링 또는 Matplotlib 이미지)
+# 101개 a 값의 곡선은 프로세스당 한 번 (101, 400) 배열로 미리 계산되고,
+# 렌더링 결과도 a 값별로 모든 세션이 공유하므로 슬라이더 조작은 캐시 조회만 하게 됨
+draw_quadratic(a)
 
 st.markdown("---")
 
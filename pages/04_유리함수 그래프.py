@@ -1,56 +1,72 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import re
 import random
 
-# --- 1. 전처리 및 그래프 함수 (유지) ---
+from asymptotes import find_vertical_asymptotes
+from chart_backend import add_line, add_vline, backend_selector, draw_chart, new_chart
+from metrics import set_page, span
+from numeric_eval import ALLOWED_FUNCTIONS, ExpressionError, get_evaluator
+from plot_sampling import adaptive_sample
+from polynomial import numpy_rational_evaluator
+from rational_parser import ParseError, parse_rational
+from warmup import start_warm_up
 
-def preprocess_expression(expression):
-    expression = expression.replace(' ', '')
-    expression = re.sub(r'(\d)([a-zA-Z])', r'\1*\2', expression)
-    expression = re.sub(r'(\))([a-zA-Z])', r'\1*\2', expression)
-    expression = expression.replace('^', '**')
-    return expression
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+# 단계별 시간 측정에 쓸 페이지 이름 (pages/07 관리자 페이지에서 확인)
+set_page(__file__)
+
+# --- 1. 입력 파싱 및 그래프 함수 ---
+
+def parse_input(label, expression):
+    """입력 식을 NumPy 함수로 변환 (잘못된 입력이면 위치를 표시하고 None 반환)
+
+    다항식/유리식은 전용 파서로 읽고, sin(x), exp(x) 같은 식은 허용된 함수만 쓰는 numeric_eval로 계산합니다.
+    """
+    try:
+        return numpy_rational_evaluator(*parse_rational(expression))
+    except ParseError as e:
+        parse_error = e
+    try:
+        return get_evaluator(expression)
+    except ExpressionError as e:
+        if any(name in expression for name in ALLOWED_FUNCTIONS):
+            st.error(f"❌ {label} 식을 읽을 수 없습니다 ({e})")
+        else:
+            # 유리식을 쓰려던 입력이면 위치를 알려 주는 전용 파서의 오류를 보여 줌
+            st.error(f"❌ {label} 식을 읽을 수 없습니다 ({parse_error})")
+            st.code(parse_error.pointer(), language=None)
+        return None
 
 def plot_rational_function(numerator_str, denominator_str):
-    preprocessed_numerator = preprocess_expression(numerator_str)
-    preprocessed_denominator = preprocess_expression(denominator_str)
+    # 2x, x^2, (x+1)(x-1) 같은 표기를 파서가 바로 분자/분모 계수로 읽음 (같은 식이면 캐시에서 재사용)
+    P = parse_input("분자", numerator_str)
+    Q = parse_input("분모", denominator_str)
+    if P is None or Q is None:
+        return
     
     try:
-        x = np.linspace(-10, 10, 400)
-        P = lambda x_val: eval(preprocessed_numerator, {"x": x_val, "np": np})
-        Q = lambda x_val: eval(preprocessed_denominator, {"x": x_val, "np": np})
-        y = P(x) / Q(x)
-        
-        asymptotes_x = []
-        x_check = np.linspace(-10, 10, 2000)
-        Q_check = Q(x_check)
+        # 곡률이 크거나 극이 있는 곳에 점을 집중 (최대 400번 평가, 불연속점에서는 선을 끊음)
+        x, y = adaptive_sample(lambda x_val: P(x_val) / Q(x_val), -10, 10, -10, 10, max_points=400)
         
-        for i in range(len(Q_check) - 1):
-            if np.sign(Q_check[i]) != np.sign(Q_check[i+1]) and np.abs(Q_check[i]) < 0.1:
-                asymptotes_x.append(x_check[i])
+        # 분모의 부호가 바뀌는 구간을 한꺼번에 찾아 근을 정밀화하고, 분자도 0이 되는 구멍은 따로 분리
+        with span("analysis", detail=f"({numerator_str})/({denominator_str})"):
+            discontinuities = find_vertical_asymptotes(P, Q, -10, 10)
+        asymptotes_x = [float(f"{x_a:.6g}") for x_a in discontinuities["poles"]]
+        holes_x = [float(f"{x_h:.6g}") for x_h in discontinuities["holes"]]
         
-        asymptotes_x = sorted(list(set(np.round(asymptotes_x, 2))))
-        
-        fig, ax = plt.subplots(figsize=(8, 6))
-        y[np.abs(y) > 50] = np.nan 
-
-        ax.plot(x, y, label=f'$y = \\frac{{{numerator_str}}}{{{denominator_str}}}$')
+        chart = new_chart(f'유리함수 그래프: $y = \\frac{{{numerator_str}}}{{{denominator_str}}}$', y_range=(-10, 10),
+                          grid_style='-', show_zero_lines=False)
+        add_line(chart, x, y, label=f'$y = \\frac{{{numerator_str}}}{{{denominator_str}}}$')
         
         for x_a in asymptotes_x:
-            ax.axvline(x=x_a, color='r', linestyle='--', label=f'점근선 x={x_a}' if x_a == asymptotes_x[0] else None)
+            add_vline(chart, x_a, color='r', label=f'점근선 x={x_a}' if x_a == asymptotes_x[0] else None)
         
-        ax.set_title(f'유리함수 그래프: $y = \\frac{{{numerator_str}}}{{{denominator_str}}}$')
-        ax.set_xlabel('x')
-        ax.set_ylabel('y')
-        ax.grid(True)
-        ax.set_ylim(-10, 10) 
-        ax.legend()
-        st.pyplot(fig)
+        draw_chart(chart)
         
         if asymptotes_x:
             st.info(f"**수직 점근선**: $x = {', '.join(map(str, asymptotes_x))}$ (분모가 0이 되는 값)")
+        if holes_x:
+            st.info(f"**구멍 (제거 가능한 불연속점)**: $x = {', '.join(map(str, holes_x))}$ (분자와 분모가 함께 0이 되는 값)")
         
     except Exception as e:
         st.error(f"❌ 그래프를 그리는 데 오류가 발생했습니다. 다음 사항을 확인해 주세요:")
@@ -167,6 +183,7 @@ def check_answer(user_answer, current_q):
 # --- 3. 앱 본문 레이아웃 ---
 
 st.set_page_config(page_title="유리함수 그래프 및 퀴즈", layout="wide")
+backend_selector()
 initialize_session_state()
 
 st.title("📚 유리함수 그래프 교과서")
@@ -204,6 +221,7 @@ st.markdown("---")
 ## ✍️ 2. 직접 그래프 그려보기
 st.subheader("2. 함수 식을 넣어 그래프 그려보기")
 st.markdown("분자와 분모에 $x$에 대한 식을 입력하고 **Graph Plot** 버튼을 누르세요. **(예: 분자 `3`, 분모 `x-2` 또는 분자 `2*x-5`, 분모 `x-3`)**")
+st.caption("`sin`, `cos`, `tan`, `exp`, `log`, `sqrt`, `abs`를 쓴 식(예: 분모 `sin(x)`)도 그려 볼 수 있습니다.")
 
 with st.form("rational_function_form"):
     col_num, col_den = st.columns(2)
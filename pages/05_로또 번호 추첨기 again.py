@@ -1,13 +1,17 @@
+import tempfile
+
 import streamlit as st
-import random
 
-def generate_lotto_numbers():
-    """1부터 45 중 중복 없이 6개의 로또 번호를 생성하고 정렬합니다."""
-    # random.sample(범위, 개수)를 사용하여 중복 없는 6개의 숫자를 추출
-    numbers = random.sample(range(1, 46), 6)
-    # 번호를 오름차순으로 정렬
-    numbers.sort()
-    return numbers
+from lotto_engine import generate_tickets
+from lotto_export import EXPORT_FORMATS, export_tickets
+from lotto_table import tickets_frame
+from metrics import set_page, span
+from warmup import start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+# 단계별 시간 측정에 쓸 페이지 이름 (pages/07 관리자 페이지에서 확인)
+set_page(__file__)
 
 ## 메인 애플리케이션 ##
 
@@ -29,13 +33,45 @@ st.write(f"선택된 게임 수: **{game_count}**")
 if st.button("✨ 로또 번호 생성"):
     st.subheader("🎉 이번 주 로또 추천 번호!")
     
-    # 3. 입력된 게임 수만큼 번호 생성 및 출력
-    for i in range(game_count):
-        # 로또 번호 생성 함수 호출
-        lotto_set = generate_lotto_numbers()
-        
-        # 번호를 쉼표로 구분된 문자열로 변환하여 출력
-        # f-string과 markdown을 사용해 결과를 보기 좋게 표시
-        st.markdown(f"**게임 {i+1}:** `{' '.join(map(str, lotto_set))}`")
+    # 3. 입력된 게임 수만큼 번호를 한 번에 생성 ((게임 수, 6) 배열, 각 행은 오름차순) 후 출력
+    with span("evaluate", detail=f"{game_count}게임"):
+        tickets = generate_tickets(game_count)
+    # 모든 게임을 표 하나로 출력 (게임마다 요소를 따로 보내지 않음)
+    st.dataframe(tickets_frame(tickets, label="게임"), hide_index=True)
     
     st.balloons() # 번호 생성 시 축하 풍선 효과
+
+# 4. 대량 생성 (화면에 표시하지 않고 묶음 단위로 파일에 바로 써서 내려받기)
+st.divider()
+st.subheader("📦 대량 생성 후 파일로 받기")
+bulk_count = st.number_input(
+    "생성할 게임 수:",
+    min_value=1_000,
+    max_value=5_000_000,
+    value=100_000,
+    step=100_000,
+    help="번호는 화면에 표시하지 않고 10만 게임씩 파일에 이어 쓰므로 게임 수가 많아도 메모리 사용량이 늘지 않습니다."
+)
+export_format = st.radio("파일 형식", list(EXPORT_FORMATS), horizontal=True)
+
+if st.button("📝 파일 만들기"):
+    extension, mime = EXPORT_FORMATS[export_format]
+    progress = st.progress(0.0)
+
+    def show_progress(done, elapsed):
+        speed = done / elapsed if elapsed else 0
+        progress.progress(done / bulk_count, text=f"{done:,} / {bulk_count:,}게임 ({speed:,.0f}게임/초)")
+
+    # 임시 파일(디스크)에 묶음 단위로 쓴 뒤 내려받기 버튼에 넘김 (download_button은 버퍼 없는 파일 객체를 받음)
+    with tempfile.TemporaryFile(buffering=0) as file, span("evaluate", detail=f"{export_format} {bulk_count:,}게임"):
+        export_tickets(file, bulk_count, export_format, on_progress=show_progress)
+        size_mb = file.tell() / 2**20
+        file.seek(0)
+        st.download_button(
+            f"⬇️ {export_format} 내려받기 ({size_mb:.1f} MB)",
+            data=file,
+            file_name=f"lotto_{bulk_count}.{extension}",
+            mime=mime,
+            # 내려받을 때 페이지를 다시 실행하지 않아 버튼이 사라지지 않음
+            on_click="ignore",
+        )
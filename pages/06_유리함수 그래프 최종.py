@@ -1,7 +1,18 @@
 import streamlit as st
-import sympy as sp
-import numpy as np
-import matplotlib.pyplot as plt
+
+from chart_backend import add_hline, add_line, add_vline, backend_selector, draw_chart, new_chart, pixel_width
+from metrics import set_page, span
+from plot_sampling import lod_sample
+from polynomial import evaluate, latex as polynomial_latex
+from rational_analysis import analyze_rational_function
+from rational_function import number_latex
+from rational_parser import ParseError
+from warmup import start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+# 단계별 시간 측정에 쓸 페이지 이름 (pages/07 관리자 페이지에서 확인)
+set_page(__file__)
 
 # Streamlit 페이지 설정
 st.set_page_config(
@@ -18,123 +29,103 @@ func_str = st.sidebar.text_input(
     "유리함수 $\\frac{ax+b}{cx+d}$ 를 입력하세요 (예: (2*x + 1)/(x - 3))",
     value="(2*x + 1)/(x - 3)"
 )
+cross_check = st.sidebar.checkbox("SymPy로 분석 결과 검산 (느림)", value=False)
 
 st.sidebar.header("그래프 범위")
 x_min = st.sidebar.number_input("x 축 최소값", value=-20.0, step=1.0)
 x_max = st.sidebar.number_input("x 축 최대값", value=20.0, step=1.0)
 y_min = st.sidebar.number_input("y 축 최소값", value=-50.0, step=1.0)
 y_max = st.sidebar.number_input("y 축 최대값", value=50.0, step=1.0)
+backend_selector()
 # --- 사이드바 입력 끝 ---
 
 try:
-    # 1. SymPy를 사용하여 함수 분석
-    x = sp.Symbol('x')
-    f_sym = sp.simplify(func_str)
-    
-    # --- ⭐ 핵심 수정 부분: sp.fraction() 결과를 직접 언팩킹합니다. ---
-    # SymPy 튜플 언팩킹 오류를 피하기 위해 sp.fraction()을 호출하여 분자와 분모를 안전하게 추출
-    # sp.fraction()은 (분자, 분모) 튜플을 반환합니다.
-    numer, denom = sp.fraction(f_sym) 
-    
-    # 분모가 상수 0인 경우 처리
-    if denom.is_constant() and denom == 0:
-        st.error("입력하신 함수는 분모가 0이므로 수학적으로 정의할 수 없습니다.")
-        st.stop()
-    # ----------------------------------------------------------------
+    # 1~3. 함수 분석 (점근선, 정의역/치역, LaTeX, 수치 함수)
+    # 같은 식이면 모든 세션이 공유하는 캐시에서 바로 가져오므로 축 범위만 바꾼 재실행은 거의 비용이 없음
+    analysis = analyze_rational_function(func_str)
+    f_latex = analysis["latex"]
+    vertical_asymptotes = analysis["vertical_asymptotes"]
+    holes = analysis["holes"]
+    ha_val = analysis["horizontal_asymptote"]
+    oblique = analysis["oblique_asymptote"]
+    domain_latex = analysis["domain_latex"]
+    range_latex = analysis["range_latex"]
 
-    # 2. 점근선 계산
-    
-    # 수직 점근선
-    vertical_asymptote = sp.solve(denom, x)
-    
-    # 수평 점근선
-    horizontal_asymptote = sp.limit(f_sym, x, sp.oo)
-    
-    # 3. 정의역 및 치역 계산 및 그래프에 사용할 실수 값 준비
-    
-    # 정의역 LaTeX 문자열 생성
-    if vertical_asymptote:
-        va_val = vertical_asymptote[0].evalf(3) 
-        domain_latex = f"$\\{{x \\mid x \\neq {va_val}\}}$"
-        va_float = float(va_val)
-    else:
-        domain_latex = "모든 실수 $\\mathbb{R}$"
-        va_float = None
-
-    # 치역 LaTeX 문자열 생성
-    if horizontal_asymptote.is_real and horizontal_asymptote != sp.oo:
-        ha_val = horizontal_asymptote.evalf(3)
-        range_latex = f"$\\{{y \\mid y \\neq {ha_val}\}}$"
-        ha_float = float(ha_val)
-    else:
-        range_latex = "모든 실수 $\\mathbb{R}$"
-        ha_float = None
-    
     # 4. 분석 결과 출력
     col1, col2 = st.columns(2)
 
     with col1:
         st.header("🔍 분석 결과")
-        st.latex(f"f(x) = {sp.latex(f_sym)}")
+        st.latex(f"f(x) = {f_latex}")
+        if analysis["standard_form_latex"] is not None:
+            st.latex(f"f(x) = {analysis['standard_form_latex']}")
         
         st.subheader("⭐ 점근선")
-        if va_float is not None:
-            st.write(f"**수직 점근선 (VA)**: $x = {va_val}$")
+        if vertical_asymptotes:
+            va_list = ", ".join(f"x = {va['latex']}" for va in vertical_asymptotes)
+            st.write(f"**수직 점근선 (VA)**: ${va_list}$")
         else:
             st.write("**수직 점근선 (VA)**: 없음")
             
-        if ha_float is not None:
-            st.write(f"**수평 점근선 (HA)**: $y = {ha_val}$")
+        if ha_val is not None:
+            st.write(f"**수평 점근선 (HA)**: $y = {number_latex(ha_val)}$")
+        elif oblique is not None:
+            st.write(f"**수평 점근선 (HA)**: 없음 (**비스듬한 점근선**: $y = {polynomial_latex(oblique)}$)")
         else:
             st.write("**수평 점근선 (HA)**: 없음")
 
+        if holes:
+            hole_list = ", ".join(f"({hole['x']['latex']}, {number_latex(hole['y'])})" for hole in holes)
+            st.write(f"**구멍 (제거 가능한 불연속점)**: ${hole_list}$")
+
         st.subheader("📖 정의역 및 치역")
         st.markdown(f"**정의역**: {domain_latex}")
         st.markdown(f"**치역**: {range_latex}")
+
+        if cross_check:
+            with span("sympy", detail=func_str):
+                problems = analysis["function"].cross_check()
+            if problems:
+                st.warning("SymPy 결과와 다른 항목: " + "; ".join(problems))
+            else:
+                st.success("SymPy 검산 결과와 일치합니다.")
         
     # 5. 그래프 그리기
     with col2:
         st.header("📈 유리함수 그래프")
         
-        # 수치 함수 변환
-        f_np = sp.lambdify(x, f_sym, 'numpy')
+        # 수치 함수 (캐시에 저장된 것을 재사용)
+        f_np = analysis["f_np"]
         
-        # 그래프 데이터 생성
-        x_vals = np.linspace(x_min, x_max, 500)
-        y_vals = f_np(x_vals)
-
-        # 수직 점근선 근처의 발산 처리
-        if va_float is not None:
-            y_vals[np.abs(x_vals - va_float) < 0.05] = np.nan 
+        # 그래프 그리기 (브라우저 렌더링 또는 Matplotlib 이미지)
+        chart = new_chart(f"Graph of $f(x) = {f_latex}$", x_range=(x_min, x_max), y_range=(y_min, y_max))
 
-        # 그래프 그리기
-        fig, ax = plt.subplots(figsize=(8, 6))
-        ax.plot(x_vals, y_vals, label=f"${sp.latex(f_sym)}$", color='blue')
+        # 그래프 데이터 생성 (점 개수는 축 범위가 아니라 그래프 폭(픽셀)에 맞춤, 극 근처만 더 촘촘하게,
+        # 수직 점근선 등 불연속점에서는 NaN으로 선을 끊음)
+        # 같은 식의 계산 결과는 타일로 공유하므로 축을 옮기거나 확대/축소하면 새로 보이는 구간만 계산
+        x_vals, y_vals = lod_sample(f_np, f_latex, x_min, x_max, y_min, y_max, pixel_width=pixel_width(chart))
+        add_line(chart, x_vals, y_vals, label=f"${f_latex}$", color='blue')
         
-        # 점근선 표시
-        if va_float is not None:
-            ax.axvline(x=va_float, color='red', linestyle='--', label=f'VA: $x={va_val}$')
+        # 점근선 표시 (수직 점근선은 모두)
+        for va in vertical_asymptotes:
+            add_vline(chart, va["value"], label=f'VA: $x={va["latex"]}$', color='red')
         
-        if ha_float is not None:
-            ax.axhline(y=ha_float, color='green', linestyle='--', label=f'HA: $y={ha_val}$')
-
-        # 축 설정 및 레이블
-        ax.set_title(f"Graph of $f(x) = {sp.latex(f_sym)}$")
-        ax.set_xlabel('x')
-        ax.set_ylabel('y')
-        ax.set_xlim(x_min, x_max)
-        ax.set_ylim(y_min, y_max)
-        ax.grid(True, linestyle=':', alpha=0.6)
-        ax.legend()
-        ax.axhline(0, color='gray', linewidth=0.5) 
-        ax.axvline(0, color='gray', linewidth=0.5) 
-
-        # Streamlit에 그래프 표시
-        st.pyplot(fig)
+        if ha_val is not None:
+            add_hline(chart, float(ha_val), label=f'HA: $y={number_latex(ha_val)}$', color='green')
+        elif oblique is not None:
+            add_line(chart, [x_min, x_max], [float(evaluate(oblique, x_min)), float(evaluate(oblique, x_max))],
+                     label=f'OA: $y={polynomial_latex(oblique)}$', color='green')
+
+        draw_chart(chart)
 
+except ParseError as e:
+    st.error(f"❌ 입력한 식을 읽을 수 없습니다 ({e})")
+    st.code(e.pointer(), language=None)
+except ZeroDivisionError as e:
+    st.error(str(e))
 except Exception as e:
     st.error("❌ **함수 입력 또는 계산에 치명적인 오류가 발생했습니다.**")
-    st.info("입력을 확인하거나, 분모가 0인 상수 함수 등 특수한 경우가 아닌지 확인해 주세요. 특히 **곱셈 기호(\*)**를 생략하지 않았는지 확인해 주세요.")
+    st.info("입력을 확인하거나, 분모가 0인 상수 함수 등 특수한 경우가 아닌지 확인해 주세요.")
     
     st.subheader("🚨 디버깅 정보 (Traceback Error)")
     st.code(f"Error Type and Message: {type(e).__name__}: {e}")
@@ -0,0 +1,101 @@
+import sys
+
+import streamlit as st
+
+import metrics
+from app_cache import LRUCache
+from figure_pool import FIGURE_POOL, live_figure_count
+from warmup import WARM_UP_REPORT, start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+
+st.set_page_config(page_title="관리자 지표", layout="wide")
+st.title("🛠️ 관리자 지표")
+st.caption("이 서버 프로세스가 시작된 뒤 모든 세션에서 모은 값입니다. 분위수는 (페이지, 단계)별 최근 "
+           f"{metrics.WINDOW}번의 측정값으로 계산합니다. 파싱/분석/렌더링의 시간은 캐시 실패만 잰 값이고, "
+           "캐시 적중은 적중 횟수와 적중률로 따로 보여 줍니다.")
+
+if st.button("측정값 초기화"):
+    metrics.reset()
+
+# --- 1. 페이지별 단계 시간 ---
+st.header("⏱️ 페이지별 단계 시간")
+rows = metrics.snapshot()
+if not rows:
+    st.info("아직 측정값이 없습니다. 다른 페이지를 사용하면 여기에 표시됩니다.")
+else:
+    st.dataframe(
+        [
+            {
+                "페이지": row["page"],
+                "단계": metrics.PHASES.get(row["phase"], row["phase"]),
+                "횟수": row["count"],
+                "캐시 적중": row["hits"],
+                "적중률": f"{row['hit_rate']:.0%}" if row["hits"] else "",
+                "평균 (ms)": round(row["mean_ms"], 2),
+                "p50 (ms)": round(row["p50_ms"], 2),
+                "p95 (ms)": round(row["p95_ms"], 2),
+                "p99 (ms)": round(row["p99_ms"], 2),
+                "최대 (ms)": round(row["max_ms"], 2),
+            }
+            for row in rows
+        ],
+        hide_index=True,
+    )
+
+    # --- 2. 단계 하나 자세히 보기 ---
+    st.subheader("🔎 단계별 분포와 느린 입력")
+    keys = metrics.keys()
+    page, phase = st.selectbox(
+        "페이지 / 단계",
+        keys,
+        format_func=lambda key: f"{key[0]} / {metrics.PHASES.get(key[1], key[1])}",
+    )
+    stats = metrics.phase_stats(page, phase)
+    edges, counts = stats.histogram()
+
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.markdown("**최근 측정값 히스토그램** (가로: 구간 시작 ms, 로그 간격)")
+        st.bar_chart({f"{edge:.3g}": int(count) for edge, count in zip(edges[:-1], counts)})
+    with col2:
+        st.markdown("**가장 느렸던 입력**")
+        slowest = stats.slowest_inputs()
+        if slowest:
+            st.table([{"시간 (ms)": round(ms, 2), "입력": detail} for ms, detail in slowest])
+        else:
+            st.caption("입력 정보가 기록되지 않은 단계입니다.")
+
+# --- 3. 캐시 ---
+st.header("🗄️ 공유 캐시")
+# 이미 import된 저장소 모듈의 LRUCache만 보여 줌 (이 페이지 때문에 무거운 모듈을 불러오지 않음)
+cache_rows = []
+for module_name, module in sorted(sys.modules.items()):
+    if not str(getattr(module, "__file__", None) or "").startswith(str(metrics.ROOT)):
+        continue
+    for name, value in list(vars(module).items()):
+        if isinstance(value, LRUCache):
+            cache_rows.append({"캐시": f"{module_name}.{name}", **value.stats()})
+if cache_rows:
+    st.dataframe(cache_rows, hide_index=True)
+else:
+    st.caption("아직 만들어진 캐시가 없습니다.")
+
+# --- 4. Matplotlib Figure 풀 ---
+st.header("🖼️ Matplotlib Figure 풀")
+pool_stats = FIGURE_POOL.stats()
+cols = st.columns(len(pool_stats) + 1)
+for col, (name, value) in zip(cols, pool_stats.items()):
+    col.metric(name, value)
+cols[-1].metric("live_figure_count()", live_figure_count())
+
+# --- 5. 서버 예열 ---
+st.header("🔥 서버 예열 결과")
+if WARM_UP_REPORT:
+    st.table([
+        {"단계": name, "결과": f"{value:.2f}초" if isinstance(value, float) else value}
+        for name, value in WARM_UP_REPORT.items()
+    ])
+else:
+    st.caption("예열이 아직 진행 중입니다.")
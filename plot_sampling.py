@@ -0,0 +1,155 @@
+import math
+
+import numpy as np
+
+from app_cache import LRUCache
+from metrics import span
+
+# 기본 점 개수 예산 (함수 평가 횟수의 상한)
+DEFAULT_MAX_POINTS = 500
+
+# 직선 보간과의 허용 오차 (화면 y 범위에 대한 비율, 약 1픽셀)
+PIXEL_TOLERANCE = 0.002
+
+
+def evaluate(f, x_vals):
+    """수치 함수를 x 배열에서 계산 (0으로 나누기 경고 무시, 상수 함수/복소수 결과 처리)"""
+    with np.errstate(all='ignore'):
+        y_vals = np.asarray(f(x_vals))
+    if np.iscomplexobj(y_vals):
+        y_vals = np.where(np.abs(y_vals.imag) < 1e-12, y_vals.real, np.nan)
+    # lambdify로 만든 상수 함수는 스칼라를 반환하므로 x와 같은 길이로 맞춤
+    return np.broadcast_to(y_vals.astype(float), x_vals.shape).copy()
+
+
+def _intervals_to_refine(x_vals, y_vals, y_min, y_max, min_width):
+    """더 잘게 나눠야 하는 구간 [x_i, x_i+1]의 시작 인덱스 배열"""
+    height = y_max - y_min
+    # 화면 밖의 큰 값이 오차 계산을 지배하지 않도록 화면 위아래 한 칸까지만 남기고 자름
+    y_clip = np.clip(y_vals, y_min - height, y_max + height)
+    finite = np.isfinite(y_vals)
+    width = np.diff(x_vals)
+
+    # (1) 곡률: 가운데 점이 양옆 점을 잇는 직선에서 벗어난 정도
+    t = (x_vals[1:-1] - x_vals[:-2]) / (x_vals[2:] - x_vals[:-2])
+    chord = y_clip[:-2] + t * (y_clip[2:] - y_clip[:-2])
+    bent = np.abs(y_clip[1:-1] - chord) > height * PIXEL_TOLERANCE
+    bent &= finite[:-2] & finite[1:-1] & finite[2:]
+    flags = np.zeros(width.size, dtype=bool)
+    flags[:-1] |= bent
+    flags[1:] |= bent
+
+    # (2) 극(pole): 화면 위쪽 밖에서 아래쪽 밖으로 (또는 반대로) 건너뛰는 구간
+    above = y_vals > y_max
+    below = y_vals < y_min
+    flags |= (above[:-1] & below[1:]) | (below[:-1] & above[1:])
+
+    # (3) 한쪽 끝에서만 값이 정의되지 않는 구간 (극 또는 구멍 근처)
+    flags |= (finite[:-1] != finite[1:]) & (width > (x_vals[-1] - x_vals[0]) / DEFAULT_MAX_POINTS)
+
+    flags &= width > min_width
+    return np.flatnonzero(flags)
+
+
+def break_at_poles(x_vals, y_vals, y_min, y_max):
+    """화면 위쪽 밖과 아래쪽 밖을 바로 잇는 구간(불연속점) 사이에 NaN을 넣어 선을 끊음"""
+    above = y_vals > y_max
+    below = y_vals < y_min
+    jumps = np.flatnonzero((above[:-1] & below[1:]) | (below[:-1] & above[1:]))
+    if jumps.size == 0:
+        return x_vals, y_vals
+    x_break = (x_vals[jumps] + x_vals[jumps + 1]) / 2
+    return np.insert(x_vals, jumps + 1, x_break), np.insert(y_vals, jumps + 1, np.nan)
+
+
+def _refine(f, x_vals, y_vals, y_min, y_max, max_points, max_rounds):
+    """휘어지거나 극이 있는 구간을 반복해서 이등분 (전체 점 개수가 max_points를 넘지 않음)"""
+    min_width = (x_vals[-1] - x_vals[0]) * 1e-12
+    for _ in range(max_rounds):
+        budget = max_points - x_vals.size
+        if budget <= 0:
+            break
+        idx = _intervals_to_refine(x_vals, y_vals, y_min, y_max, min_width)
+        if idx.size == 0:
+            break
+        if idx.size > budget:
+            # 예산이 부족하면 넓은 구간부터 나눔
+            widest = np.argsort(x_vals[idx] - x_vals[idx + 1])[:budget]
+            idx = np.sort(idx[widest])
+
+        x_new = (x_vals[idx] + x_vals[idx + 1]) / 2
+        y_new = evaluate(f, x_new)
+        x_vals = np.insert(x_vals, idx + 1, x_new)
+        y_vals = np.insert(y_vals, idx + 1, y_new)
+    return x_vals, y_vals
+
+
+def adaptive_sample(f, x_min, x_max, y_min, y_max, max_points=DEFAULT_MAX_POINTS, initial_points=65, max_rounds=30):
+    """곡률이 크거나 값이 발산하는 곳에 점을 집중시키는 적응형 샘플링
+
+    평평한 구간은 처음의 성긴 격자만 쓰고, 휘어지거나 극이 있는 구간만 반복해서 이등분합니다.
+    함수 평가 횟수는 max_points를 넘지 않으며, 불연속점에서는 NaN으로 선을 끊어 반환합니다.
+    """
+    with span("evaluate", detail=f"x∈[{x_min:g}, {x_max:g}], 최대 {max_points}점"):
+        x_vals = np.linspace(x_min, x_max, min(initial_points, max_points))
+        y_vals = evaluate(f, x_vals)
+        x_vals, y_vals = _refine(f, x_vals, y_vals, y_min, y_max, max_points, max_rounds)
+        return break_at_poles(x_vals, y_vals, y_min, y_max)
+
+
+# --- 화면 폭에 맞춘 샘플링 (타일 캐시) ---
+# 같은 함수를 같은 간격(2의 거듭제곱)의 격자에서 TILE_SIZE개씩 계산해 둔 타일 (모든 세션 공유)
+# 키: (함수 키, 간격 단계, 타일 번호), 값: 타일의 y 값 배열
+TILE_CACHE = LRUCache(max_entries=2048)
+TILE_SIZE = 256
+
+# 기본 그래프 폭(픽셀)과 픽셀당 최소 점 개수
+DEFAULT_PIXEL_WIDTH = 768
+SAMPLES_PER_PIXEL = 1
+
+
+def grid_level(x_min, x_max, pixel_width=DEFAULT_PIXEL_WIDTH):
+    """픽셀당 SAMPLES_PER_PIXEL개 이상(2배 미만)의 점이 나오는 격자 간격 2**level의 level
+
+    간격을 2의 거듭제곱으로 맞추므로 축 범위를 2배 안쪽으로 확대/축소하거나 옮겨도 같은 격자(같은 타일)를 씁니다.
+    """
+    return math.floor(math.log2((x_max - x_min) / (pixel_width * SAMPLES_PER_PIXEL)))
+
+
+def _tile(f, key, level, index):
+    def compute():
+        # 한 단계 촘촘한 타일 두 개가 이미 있으면 (축소한 경우) 한 점 건너 하나씩 가져옴
+        # (없는 타일을 찾느라 캐시 실패 횟수가 늘지 않도록 먼저 들어 있는지 확인)
+        finer_keys = [(key, level - 1, 2 * index + half) for half in (0, 1)]
+        if all(finer_key in TILE_CACHE for finer_key in finer_keys):
+            finer = [TILE_CACHE.get(finer_key) for finer_key in finer_keys]
+            if finer[0] is not None and finer[1] is not None:
+                return np.concatenate(finer)[::2]
+        return evaluate(f, (index * TILE_SIZE + np.arange(TILE_SIZE)) * 2.0 ** level)
+
+    return TILE_CACHE.get_or_create((key, level, index), compute)
+
+
+def tiled_grid(f, key, x_min, x_max, pixel_width=DEFAULT_PIXEL_WIDTH):
+    """[x_min, x_max]를 덮는 격자 점과 함수 값 (이미 계산한 타일은 재사용하고 새로 보이는 타일만 계산)"""
+    level = grid_level(x_min, x_max, pixel_width)
+    step = 2.0 ** level
+    first, last = math.floor(x_min / step), math.ceil(x_max / step)
+    first_tile, last_tile = first // TILE_SIZE, last // TILE_SIZE
+    y_vals = np.concatenate([_tile(f, key, level, index) for index in range(first_tile, last_tile + 1)])
+    offset = first_tile * TILE_SIZE
+    return np.arange(first, last + 1) * step, y_vals[first - offset:last - offset + 1]
+
+
+def lod_sample(f, key, x_min, x_max, y_min, y_max, pixel_width=DEFAULT_PIXEL_WIDTH, max_rounds=30):
+    """점 개수를 축 범위가 아니라 그래프 폭(픽셀)에 맞춘 샘플링 (key: 함수를 구별하는 값, 예: 정리된 LaTeX 식)
+
+    타일 격자(픽셀당 1~2점) 위에서 극과 급하게 휘는 곳만 그래프 폭의 1/4개까지 더 나누고,
+    불연속점에서는 NaN으로 선을 끊어 반환합니다. 축 범위가 잘못되면(x_min >= x_max) adaptive_sample을 씁니다.
+    """
+    if not x_max > x_min:
+        return adaptive_sample(f, x_min, x_max, y_min, y_max)
+    with span("evaluate", detail=f"x∈[{x_min:g}, {x_max:g}], {pixel_width}px"):
+        x_vals, y_vals = tiled_grid(f, key, x_min, x_max, pixel_width)
+        x_vals, y_vals = _refine(f, x_vals, y_vals, y_min, y_max, x_vals.size + pixel_width // 4, max_rounds)
+        return break_at_poles(x_vals, y_vals, y_min, y_max)
@@ -0,0 +1,300 @@
+"""정확한 유리수(Fraction) 계수 다항식 연산
+
+다항식은 낮은 차수부터 적은 계수 튜플로 나타냅니다.
+    3x^2 - 1  ->  (Fraction(-1), Fraction(0), Fraction(3))
+영다항식은 빈 튜플 () 입니다.
+"""
+import math
+from fractions import Fraction
+
+# 유리근 후보를 만들 때 약수를 구할 상수항/최고차항 계수의 최대 크기 (넘으면 수치 계산으로 근을 구함)
+MAX_DIVISOR_SEARCH = 10**6
+
+ZERO = ()
+ONE = (Fraction(1),)
+X = (Fraction(0), Fraction(1))
+
+
+# --- 1. 기본 연산 ---
+def trim(p):
+    """최고차항 쪽의 0 계수를 제거하여 튜플로 반환"""
+    p = list(p)
+    while p and p[-1] == 0:
+        p.pop()
+    return tuple(p)
+
+
+def constant(c):
+    return trim((Fraction(c),))
+
+
+def degree(p):
+    """차수 (영다항식은 -1)"""
+    return len(p) - 1
+
+
+def is_constant(p):
+    return len(p) <= 1
+
+
+def add(p, q):
+    if len(p) < len(q):
+        p, q = q, p
+    return trim(tuple(a + b for a, b in zip(p, q)) + p[len(q):])
+
+
+def neg(p):
+    return tuple(-a for a in p)
+
+
+def sub(p, q):
+    return add(p, neg(q))
+
+
+def scale(p, c):
+    return trim(tuple(a * c for a in p))
+
+
+def mul(p, q):
+    if not p or not q:
+        return ZERO
+    # 분모가 1인 경우가 대부분이므로 1을 곱할 때는 바로 반환
+    if p == ONE:
+        return q
+    if q == ONE:
+        return p
+    result = [Fraction(0)] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a == 0:
+            continue
+        for j, b in enumerate(q):
+            result[i + j] += a * b
+    return trim(result)
+
+
+def power(p, n):
+    """p^n (n >= 0), 제곱을 반복하는 방식"""
+    result = ONE
+    while n:
+        if n & 1:
+            result = mul(result, p)
+        n >>= 1
+        # 마지막 비트 뒤에는 제곱하지 않음 (p^n 계산에 쓰이지 않는 p^(2^k)를 만들지 않음)
+        if n:
+            p = mul(p, p)
+    return result
+
+
+def leading(p):
+    return p[-1] if p else Fraction(0)
+
+
+def monic(p):
+    """최고차항 계수를 1로 맞춤"""
+    return scale(p, 1 / p[-1]) if p else ZERO
+
+
+def derivative(p):
+    return trim(tuple(i * a for i, a in enumerate(p))[1:])
+
+
+def divmod_(p, q):
+    """다항식 나눗셈: p = q * 몫 + 나머지 (조립제법과 같은 긴 나눗셈)"""
+    if not q:
+        raise ZeroDivisionError("영다항식으로 나눌 수 없습니다")
+    remainder = list(p)
+    quotient = [Fraction(0)] * max(len(p) - len(q) + 1, 0)
+    lead = q[-1]
+    for i in range(len(quotient) - 1, -1, -1):
+        c = remainder[i + len(q) - 1] / lead
+        quotient[i] = c
+        if c:
+            for j, b in enumerate(q):
+                remainder[i + j] -= c * b
+    return trim(quotient), trim(remainder[:len(q) - 1])
+
+
+def divide(p, q):
+    """나누어떨어지는 나눗셈의 몫"""
+    return divmod_(p, q)[0]
+
+
+def gcd(p, q):
+    """최대공약수 (유클리드 호제법, 최고차항 계수 1)"""
+    while q:
+        p, q = q, divmod_(p, q)[1]
+    return monic(p)
+
+
+# --- 2. 값 계산 ---
+def evaluate(p, x_val):
+    """Horner 방법으로 p(x_val) 계산 (Fraction을 넣으면 정확한 값)"""
+    result = 0
+    for a in reversed(p):
+        result = result * x_val + a
+    return result
+
+
+def numpy_evaluator(p):
+    """x 배열을 받는 NumPy 함수로 변환 (그래프용 부동소수점 계산)"""
+    import numpy as np
+
+    coefficients = np.array([float(a) for a in p] or [0.0])
+    return lambda x_vals: np.polynomial.polynomial.polyval(x_vals, coefficients)
+
+
+def numpy_rational_evaluator(num, den):
+    """분자/분모 계수로 x 배열을 받는 NumPy 유리함수를 만듦"""
+    num_f, den_f = numpy_evaluator(num), numpy_evaluator(den)
+    return lambda x_vals: num_f(x_vals) / den_f(x_vals)
+
+
+# --- 3. 실근 ---
+def _divisors(n):
+    small = [d for d in range(1, math.isqrt(n) + 1) if n % d == 0]
+    return sorted(set(small + [n // d for d in small]))
+
+
+def integer_coefficients(p):
+    """같은 근을 갖는 정수 계수 다항식 (분모의 최소공배수를 곱하고 공약수로 나눔)"""
+    if not p:
+        return ZERO
+    lcm = math.lcm(*(a.denominator for a in p))
+    ints = [int(a * lcm) for a in p]
+    g = math.gcd(*ints)
+    return tuple(Fraction(a // g) for a in ints)
+
+
+def rational_roots(p):
+    """유리근 정리로 유리수 근을 모두 찾음 -> (근 목록(중근은 한 번), 유리근을 나눈 나머지 다항식)"""
+    p = integer_coefficients(trim(p))
+    roots = []
+    if p and p[0] == 0:
+        roots.append(Fraction(0))
+        while p and p[0] == 0:
+            p = p[1:]
+    if len(p) <= 1:
+        return roots, p
+    a0, an = abs(int(p[0])), abs(int(p[-1]))
+    if max(a0, an) > MAX_DIVISOR_SEARCH:
+        return roots, p
+    for q in _divisors(an):
+        for s in _divisors(a0):
+            for candidate in (Fraction(s, q), Fraction(-s, q)):
+                if candidate.denominator != q or len(p) <= 1:
+                    continue
+                found = False
+                while len(p) > 1 and evaluate(p, candidate) == 0:
+                    p = divide(p, (-candidate, Fraction(1)))
+                    found = True
+                if found:
+                    roots.append(candidate)
+    return roots, p
+
+
+def _square_free_part(n):
+    """n = s^2 * r 로 나누어 (s, r) 반환 (r은 제곱 인수가 없는 수)"""
+    s, r, d = 1, n, 2
+    while d * d <= r:
+        while r % (d * d) == 0:
+            r //= d * d
+            s *= d
+        d += 1
+    return s, r
+
+
+def real_roots(p):
+    """서로 다른 실근을 작은 것부터 반환
+
+    각 근은 {"value": 실수값, "exact": Fraction 또는 None, "latex": LaTeX 문자열} 딕셔너리입니다.
+    유리근은 정확히, 남은 이차식의 근은 제곱근 꼴로, 그보다 높은 차수는 수치 계산으로 구합니다.
+    """
+    exact, rest = rational_roots(p)
+    roots = [{"value": float(r), "exact": r, "latex": fraction_latex(r)} for r in exact]
+
+    if degree(rest) == 2:
+        c, b, a = rest
+        disc = b * b - 4 * a * c
+        if disc > 0:
+            # 근 = center ± coef * sqrt(radicand)
+            s, radicand = _square_free_part(disc.numerator * disc.denominator)
+            center = -b / (2 * a)
+            coef = abs(Fraction(s, disc.denominator) / (2 * a))
+            for sign in (-1, 1):
+                value = float(center) + sign * float(coef) * math.sqrt(radicand)
+                roots.append({"value": value, "exact": None, "latex": _surd_latex(center, sign * coef, radicand)})
+    elif degree(rest) > 2:
+        import numpy as np
+
+        coefficients = [float(a) for a in reversed(rest)]
+        for z in np.roots(coefficients):
+            if abs(z.imag) <= 1e-9 * max(1.0, abs(z)):
+                value = _newton(rest, float(z.real))
+                roots.append({"value": value, "exact": None, "latex": f"{value:.6g}"})
+
+    roots.sort(key=lambda r: r["value"])
+    # 수치 계산에서 중근이 두 번 나온 경우 하나만 남김
+    distinct = []
+    for r in roots:
+        if not distinct or abs(r["value"] - distinct[-1]["value"]) > 1e-9 * max(1.0, abs(r["value"])):
+            distinct.append(r)
+    return distinct
+
+
+def _newton(p, x_val, steps=3):
+    """np.roots 결과를 뉴턴법으로 조금 더 정밀하게"""
+    dp = derivative(p)
+    coefficients, d_coefficients = [float(a) for a in p], [float(a) for a in dp]
+    for _ in range(steps):
+        slope = evaluate(d_coefficients, x_val)
+        if slope == 0:
+            break
+        x_val -= evaluate(coefficients, x_val) / slope
+    return x_val
+
+
+# --- 4. LaTeX ---
+def fraction_latex(value):
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    sign = "-" if value < 0 else ""
+    return f"{sign}\\frac{{{abs(value.numerator)}}}{{{value.denominator}}}"
+
+
+def _surd_latex(center, coef, radicand):
+    sqrt = f"\\sqrt{{{radicand}}}"
+    term = sqrt if abs(coef) == 1 else (f"{fraction_latex(abs(coef))}{sqrt}")
+    sign = "-" if coef < 0 else "+"
+    if center == 0:
+        return f"{'-' if coef < 0 else ''}{term}"
+    return f"{fraction_latex(center)} {sign} {term}"
+
+
+def latex(p, var='x'):
+    """다항식을 높은 차수부터 LaTeX로 (예: 2x^{2} - 3x + 1)"""
+    if not p:
+        return "0"
+    terms = []
+    for i in range(len(p) - 1, -1, -1):
+        a = p[i]
+        if a == 0:
+            continue
+        body = var if i == 1 else (f"{var}^{{{i}}}" if i > 1 else "")
+        magnitude = abs(a)
+        if body and magnitude == 1:
+            text = body
+        else:
+            text = fraction_latex(magnitude) + body
+        if not terms:
+            terms.append(f"-{text}" if a < 0 else text)
+        else:
+            terms.append(f"- {text}" if a < 0 else f"+ {text}")
+    return " ".join(terms)
+
+
+def to_sympy(p, symbol=None):
+    import sympy as sp
+
+    symbol = symbol or sp.Symbol('x')
+    return sp.Add(*[sp.Rational(a.numerator, a.denominator) * symbol**i for i, a in enumerate(p)])
@@ -0,0 +1,225 @@
+"""유리함수 점근선 퀴즈용 문제 은행
+
+미리 만들어 둔 문제 은행 파일(data/problem_bank.npy)을 메모리 매핑으로 열고,
+세션마다 그중 일부를 뽑아 퀴즈 문제로 사용합니다.
+다른 난이도의 문제는 generate_problem_params가 NumPy 배열 연산으로 한꺼번에 만듭니다.
+
+문제 은행 다시 만들기 (오프라인 빌드 단계):
+    python problem_bank.py --coef-range 5
+"""
+import argparse
+import functools
+from fractions import Fraction
+from math import gcd
+from pathlib import Path
+
+import numpy as np
+
+from app_cache import LRUCache
+
+BANK_PATH = Path(__file__).resolve().parent / "data" / "problem_bank.npy"
+
+# 한 문제 = (a, b, c, d) 정수 4개 -> f(x) = (ax + b) / (cx + d)
+PARAM_DTYPE = np.int16
+
+
+# --- 1. 문제 은행 만들기 (오프라인) ---
+def canonical_params(a, b, c, d):
+    """같은 함수를 나타내는 계수를 하나로 통일 (최대공약수로 나누고 c > 0 으로 맞춤)"""
+    g = gcd(gcd(a, b), gcd(c, d))
+    if c < 0:
+        g = -g
+    return a // g, b // g, c // g, d // g
+
+
+def canonical_params_array(params):
+    """canonical_params의 배열 버전: (N, 4) 정수 배열의 각 행을 한꺼번에 통일"""
+    params = np.asarray(params, dtype=np.int64)
+    g = np.gcd.reduce(params, axis=1)
+    g = np.where(params[:, 2] < 0, -g, g)
+    return params // g[:, None]
+
+
+def _unique_rows(params):
+    """처음 나온 순서를 유지하면서 중복된 행을 제거 (각 행을 int64 하나로 묶어 비교)"""
+    offset = np.iinfo(PARAM_DTYPE).max + 1
+    keys = np.zeros(len(params), dtype=np.int64)
+    for column in params.T:
+        keys = (keys << 16) | (column + offset)
+    _, first = np.unique(keys, return_index=True)
+    return params[np.sort(first)]
+
+
+def build_problem_bank(coef_range=5, seed=0):
+    """(ax+b)/(cx+d) 꼴의 모든 문제를 만들고 중복을 제거한 뒤 섞어서 (N, 4) 배열로 반환
+
+    계수 분포는 기존 generate_rational_function_problems와 같습니다.
+    (a, c는 0이 아니고, 수직 점근선 -d/c가 정수가 되도록 d는 c의 배수)
+    """
+    nonzero = [i for i in range(-coef_range, coef_range) if i != 0]
+    full = range(-coef_range, coef_range + 1)
+    # a, c, b, k 순서의 모든 조합 (반복문 순서와 같음)
+    a, c, b, k = (axis.ravel() for axis in np.meshgrid(nonzero, nonzero, full, full, indexing='ij'))
+    params = np.stack([a, b, c, c * k], axis=1)
+    # ad = bc 이면 분자와 분모가 약분되어 상수함수가 되므로 제외
+    params = params[params[:, 0] * params[:, 3] != params[:, 1] * params[:, 2]]
+
+    bank = _unique_rows(canonical_params_array(params)).astype(PARAM_DTYPE)
+    np.random.default_rng(seed).shuffle(bank)
+    return bank
+
+
+def save_problem_bank(bank, path=BANK_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, bank)
+
+
+# --- 2. 난이도별 대량 생성 ---
+# coef_range: 계수 범위, integer_va / integer_ha: 수직/수평 점근선을 정수로 제한할지 여부
+DIFFICULTY_LEVELS = {
+    "쉬움": {"coef_range": 3, "integer_va": True, "integer_ha": True},
+    "보통": {"coef_range": 5, "integer_va": True, "integer_ha": False},
+    "어려움": {"coef_range": 9, "integer_va": False, "integer_ha": False},
+}
+DEFAULT_DIFFICULTY = "보통"
+
+
+def _nonzero(rng, coef_range, size):
+    return rng.integers(1, coef_range + 1, size) * rng.choice([-1, 1], size)
+
+
+def _draw_params(rng, level, size):
+    """난이도 설정에 맞게 (a, b, c, d) 후보 size개를 한꺼번에 뽑음"""
+    r = level["coef_range"]
+    c = _nonzero(rng, r, size)
+    # 점근선을 정수로 만들려면 d = -c*(수직 점근선), a = c*(수평 점근선)
+    d = c * rng.integers(-r, r + 1, size) if level["integer_va"] else rng.integers(-r, r + 1, size)
+    a = c * _nonzero(rng, r, size) if level["integer_ha"] else _nonzero(rng, r, size)
+    b = rng.integers(-r, r + 1, size)
+    return np.stack([a, b, c, d], axis=1)
+
+
+def generate_problem_params(num_problems, difficulty=DEFAULT_DIFFICULTY, rng=None, max_rounds=20):
+    """난이도에 맞는 서로 다른 문제 num_problems개를 (N, 4) 배열로 한꺼번에 생성
+
+    점근선은 닫힌 식(수직 -d/c, 수평 a/c)으로 정해지므로 SymPy 없이 NumPy 배열 연산만 사용합니다.
+    ad = bc 인 경우(상수함수)는 버리고, 약분하면 같아지는 문제는 하나만 남깁니다.
+    해당 난이도에서 만들 수 있는 문제 수보다 많이 요청하면 만들 수 있는 만큼만 반환합니다.
+    """
+    level = DIFFICULTY_LEVELS[difficulty]
+    rng = rng or np.random.default_rng()
+    params = np.empty((0, 4), dtype=np.int64)
+    for _ in range(max_rounds):
+        # 버려지는 후보(상수함수, 중복)를 감안해 조금 넉넉하게 뽑음
+        candidates = _draw_params(rng, level, int((num_problems - len(params)) * 1.25) + 16)
+        candidates = candidates[candidates[:, 0] * candidates[:, 3] != candidates[:, 1] * candidates[:, 2]]
+        before = len(params)
+        params = _unique_rows(np.concatenate([params, canonical_params_array(candidates)]))
+        # 새 문제가 하나도 나오지 않으면 이 난이도의 문제를 거의 다 뽑은 것
+        if len(params) >= num_problems or len(params) == before:
+            break
+    return params[:num_problems].astype(PARAM_DTYPE)
+
+
+def closed_form_answers(params):
+    """(N, 4) 계수 배열의 수직/수평 점근선을 기약분수 (분자, 분모) 배열로 계산
+
+    반환: {"va": (분자 배열, 분모 배열), "ha": (분자 배열, 분모 배열)}, 분모는 항상 양수
+    """
+    a, _, c, d = np.asarray(params, dtype=np.int64).T
+
+    def reduce(num, den):
+        g = np.gcd(num, den) * np.sign(den)
+        return num // g, den // g
+
+    return {"va": reduce(-d, c), "ha": reduce(a, c)}
+
+
+# --- 3. 문제 은행 불러오기 (앱 실행 시) ---
+@functools.lru_cache(maxsize=None)
+def load_problem_bank(path=BANK_PATH):
+    """문제 은행 파일을 메모리 매핑으로 한 번만 열어 모든 세션이 공유
+
+    파일이 없으면 메모리에서 바로 만들어 사용합니다.
+    """
+    path = Path(path)
+    if path.exists():
+        return np.load(path, mmap_mode='r')
+    return build_problem_bank()
+
+
+def sample_problem_params(num_problems=30, rng=None, difficulty=DEFAULT_DIFFICULTY):
+    """중복 없이 num_problems개의 (a, b, c, d)를 뽑음
+
+    기본 난이도는 문제 은행에서 뽑고, 다른 난이도는 그 자리에서 generate_problem_params로 만듭니다.
+    """
+    rng = rng or np.random.default_rng()
+    if difficulty != DEFAULT_DIFFICULTY:
+        return [tuple(int(v) for v in row) for row in generate_problem_params(num_problems, difficulty, rng)]
+    bank = load_problem_bank()
+    indices = rng.choice(len(bank), size=min(num_problems, len(bank)), replace=False)
+    return [tuple(int(v) for v in bank[i]) for i in indices]
+
+
+# --- 4. 계수로부터 문제 정보 만들기 ---
+def linear_latex(p, q):
+    """px + q 를 LaTeX 문자열로 표현 (예: 2x - 3, -x + 1)"""
+    if p == 1:
+        text = "x"
+    elif p == -1:
+        text = "-x"
+    else:
+        text = f"{p}x"
+    if q > 0:
+        text += f" + {q}"
+    elif q < 0:
+        text += f" - {-q}"
+    return text
+
+
+# 계수 튜플 -> 정답/식/풀이 (모든 세션 공유, 세션 상태에는 계수 튜플만 저장)
+PROBLEM_CACHE = LRUCache(max_entries=4096)
+
+
+def _problem_info(params):
+    a, b, c, d = params
+    va, ha = Fraction(-d, c), Fraction(a, c)
+    solution_va, solution_ha = f"$x = {va}$", f"$y = {ha}$"
+    return {
+        'va': va,  # 채점용 정확한 값
+        'ha': ha,  # 채점용 정확한 값
+        'function_str': f"({linear_latex(a, b)})/({linear_latex(c, d)})",
+        'va_ans': solution_va,
+        'ha_ans': solution_ha,
+        'explanation': f"""
+        **1. 수직 점근선 ($\\mathbf{{x}}$)**
+        - 분모가 0이 되는 $x$ 값을 찾습니다. ${linear_latex(c, d)} = 0$
+        - $x = {va}$ 입니다. (정답: $\\mathbf{{{solution_va}}}$)
+
+        **2. 수평 점근선 ($\\mathbf{{y}}$)**
+        - 분자와 분모의 차수가 같으므로, 최고차항 계수의 비 $\\frac{{{a}}}{{{c}}}$를 구합니다.
+        - $y = {ha}$ 입니다. (정답: $\\mathbf{{{solution_ha}}}$)
+        """,
+    }
+
+
+def problem_info(params):
+    """계수 (a, b, c, d)로 문제 정보를 만듦 (SymPy 단순화/방정식 풀이 없이 닫힌 식 사용, 캐시 사용)
+
+    반환 딕셔너리: va, ha (정확한 분수), function_str, va_ans, ha_ans, explanation (LaTeX/마크다운 문자열)
+    """
+    params = tuple(int(v) for v in params)
+    return PROBLEM_CACHE.get_or_create(params, lambda: _problem_info(params))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="유리함수 점근선 퀴즈 문제 은행 만들기")
+    parser.add_argument("--coef-range", type=int, default=5, help="계수 범위 (-R 이상 R 이하)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=BANK_PATH)
+    args = parser.parse_args()
+
+    bank = build_problem_bank(args.coef_range, args.seed)
+    save_problem_bank(bank, args.out)
+    print(f"{len(bank)}개 문제를 {args.out}에 저장했습니다. ({bank.nbytes / 1024:.1f} KB)")
@@ -0,0 +1,52 @@
+import functools
+
+import numpy as np
+
+from chart_backend import BACKENDS, RENDER_CACHE, add_line, draw_cached_chart, new_chart, render_chart
+
+# 슬라이더 범위: a = -5.0 ~ 5.0, 0.1 간격 (101개)
+A_MIN = -5.0
+A_MAX = 5.0
+A_STEP = 0.1
+A_VALUES = np.round(np.linspace(A_MIN, A_MAX, 101), 1)
+
+# -5부터 5까지 400개의 x값
+X_VALUES = np.linspace(-5, 5, 400)
+
+
+@functools.lru_cache(maxsize=None)
+def curve_family():
+    """모든 a 값에 대한 y = ax^2 곡선을 한 번에 계산한 (101, 400) 배열 (프로세스당 한 번, 모든 세션 공유)"""
+    family = np.outer(A_VALUES, X_VALUES**2)
+    family.setflags(write=False)
+    return family
+
+
+def a_index(a):
+    """슬라이더 값 a를 A_VALUES의 인덱스로 변환 (0.1 간격 부동소수점 오차 보정)"""
+    return int(round((a - A_MIN) / A_STEP))
+
+
+def quadratic_chart(index):
+    a = A_VALUES[index]
+    chart = new_chart('이차함수 $y=ax^2$ 그래프', x_range=(-5, 5), y_range=(-15, 15), x_label='$x$', y_label='$y$',
+                      figsize=(6.4, 4.8), zero_line_style='--', aspect_equal=True)  # x, y 축 스케일 동일하게 설정
+    add_line(chart, X_VALUES, curve_family()[index], label=f'$y = {a}x^2$', color='blue')
+    return chart
+
+
+def draw_quadratic(a, backend=None):
+    """a 값에 해당하는 그래프를 출력 (같은 a 값은 렌더링 캐시에서 바로 가져옴)"""
+    index = a_index(a)
+    draw_cached_chart(("quadratic", index), lambda: quadratic_chart(index), backend)
+
+
+def warm_render_cache(backends=BACKENDS, indices=None):
+    """서버 시작 시 a 값들의 렌더링 결과를 미리 만들어 둠 (indices가 None이면 101개 전부)"""
+    if indices is None:
+        indices = range(len(A_VALUES))
+    for backend in backends:
+        for index in indices:
+            RENDER_CACHE.get_or_create(
+                (("quadratic", index), backend), lambda: render_chart(quadratic_chart(index), backend)
+            )
@@ -0,0 +1,57 @@
+from app_cache import LRUCache
+from metrics import record_hit, span
+from rational_function import RationalFunction
+from rational_parser import parse_rational
+
+# 모든 세션이 공유하는 분석 결과 캐시 (같은 교과서 예제를 여러 학생이 입력해도 한 번만 계산)
+ANALYSIS_CACHE = LRUCache(max_entries=256)
+
+
+def normalize_input(func_str):
+    """공백 제거 (가장 가벼운 1차 키)"""
+    return func_str.replace(' ', '')
+
+
+def _analyze(function):
+    """점근선, 구멍, 표준형, 정의역/치역을 실제로 계산하는 부분 (캐시 실패 시에만 호출)"""
+    return {
+        "function": function,
+        "latex": function.latex(),
+        # 근 딕셔너리 {"value", "exact", "latex"} 목록 (모든 수직 점근선)
+        "vertical_asymptotes": function.vertical_asymptotes,
+        "holes": function.holes,
+        "horizontal_asymptote": function.horizontal_asymptote,
+        "oblique_asymptote": function.oblique_asymptote,
+        "standard_form_latex": function.standard_form_latex(),
+        "domain_latex": function.domain_latex(),
+        "range_latex": function.range_latex(),
+        # 수치 함수도 한 번만 만듦
+        "f_np": function.numpy_function(),
+    }
+
+
+def analyze_rational_function(func_str):
+    """유리함수 문자열을 분석하여 점근선, 정의역/치역, LaTeX, 수치 함수를 반환 (캐시 사용)
+
+    잘못된 입력이면 rational_parser.ParseError(위치 포함)를 발생시킵니다.
+    """
+    text_key = normalize_input(func_str)
+    # 입력 그대로의 키는 먼저 들어 있는지 확인 (처음 보는 식이 아래 계수 키까지 실패 두 번으로 세어지지 않도록)
+    if text_key in ANALYSIS_CACHE:
+        result = ANALYSIS_CACHE.get(text_key)
+        if result is not None:
+            record_hit("analysis")
+            return result
+
+    # 표기만 다른 같은 식((1+2*x)/(x-3) 등)은 파싱한 계수로 한 번 더 찾음
+    key = parse_rational(func_str)
+    result = ANALYSIS_CACHE.get(key)
+    if result is not None:
+        # 캐시 적중은 횟수만 셈 (시간은 실제로 분석할 때만 잼)
+        record_hit("analysis")
+    else:
+        with span("analysis", detail=func_str):
+            result = _analyze(RationalFunction(*key))
+        ANALYSIS_CACHE.put(key, result)
+    ANALYSIS_CACHE.put(text_key, result)
+    return result
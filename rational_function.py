@@ -0,0 +1,337 @@
+"""분수 계수 유리함수 (SymPy 없이 점근선, 구멍, 표준형, 정의역/치역 계산)
+
+    f = RationalFunction.parse("(2x^2 - 2)/(x^2 - x)")
+    f.vertical_asymptotes   # x = 0
+    f.holes                 # x = 1 (y = 4)
+    f.horizontal_asymptote  # y = 2
+
+모든 계산은 Fraction 계수 다항식 연산(약분은 최대공약수, 점근선은 긴 나눗셈)으로 하며,
+SymPy는 결과를 검산하는 cross_check()에서만 사용합니다.
+"""
+import functools
+import math
+from fractions import Fraction
+
+import polynomial as poly
+from rational_parser import parse_rational
+
+# 치역 계산에서 두 실수를 같은 값으로 볼 상대 허용 오차
+TOLERANCE = 1e-9
+
+
+def _close(a, b):
+    if math.isinf(a) or math.isinf(b):
+        return a == b
+    return abs(a - b) <= TOLERANCE * max(1.0, abs(a), abs(b))
+
+
+def number_latex(value):
+    """정확한 분수는 그대로, 수치 계산 값은 유효숫자 4자리로"""
+    if isinstance(value, Fraction):
+        return poly.fraction_latex(value)
+    return f"{value:.4g}"
+
+
+class RationalFunction:
+    """f(x) = 분자(x) / 분모(x)
+
+    numerator, denominator: 입력한 그대로의 계수 (정의역, 그래프에 사용)
+    reduced: 공통인수로 약분하고 분모의 최고차항 계수를 1로 맞춘 (분자, 분모) (점근선, 치역에 사용)
+    """
+
+    def __init__(self, numerator, denominator=poly.ONE):
+        numerator, denominator = poly.trim(numerator), poly.trim(denominator)
+        if not denominator:
+            raise ZeroDivisionError("입력하신 함수는 분모가 0이므로 수학적으로 정의할 수 없습니다.")
+        self.numerator = numerator
+        self.denominator = denominator
+
+        self.common_factor = poly.gcd(numerator, denominator)
+        num = poly.divide(numerator, self.common_factor)
+        den = poly.divide(denominator, self.common_factor)
+        self.reduced = (poly.scale(num, 1 / den[-1]), poly.monic(den))
+
+    @classmethod
+    def parse(cls, text):
+        """학생 입력 문자열로 만듦 (잘못된 입력이면 rational_parser.ParseError)"""
+        return cls(*parse_rational(text))
+
+    def __repr__(self):
+        return f"RationalFunction({self.latex()!r})"
+
+    # --- 1. 값과 표기 ---
+    def __call__(self, x_val):
+        """f(x_val) (Fraction을 넣으면 정확한 값, 정의되지 않는 점이면 ZeroDivisionError)"""
+        return poly.evaluate(self.numerator, x_val) / poly.evaluate(self.denominator, x_val)
+
+    def _reduced_value(self, root):
+        """약분한 식으로 계산한 값 (구멍의 y좌표 등), 정확한 근이면 Fraction"""
+        num, den = self.reduced
+        x_val = root["exact"] if root["exact"] is not None else root["value"]
+        return poly.evaluate(num, x_val) / poly.evaluate(den, x_val)
+
+    def numpy_function(self):
+        """그래프용 NumPy 함수 (입력한 식 그대로 계산)"""
+        return poly.numpy_rational_evaluator(self.numerator, self.denominator)
+
+    def latex(self):
+        num = poly.latex(self.numerator)
+        if self.denominator == poly.ONE:
+            return num
+        return f"\\frac{{{num}}}{{{poly.latex(self.denominator)}}}"
+
+    @property
+    def is_polynomial(self):
+        return poly.is_constant(self.reduced[1])
+
+    # --- 2. 점근선과 구멍 ---
+    @functools.cached_property
+    def vertical_asymptotes(self):
+        """약분한 뒤에도 분모에 남는 실근 전부 (근 딕셔너리 목록, 작은 것부터)"""
+        return poly.real_roots(self.reduced[1])
+
+    @functools.cached_property
+    def holes(self):
+        """약분되어 사라진 실근 (x/x^2의 x=0처럼 약분 후에도 분모에 남으면 구멍이 아니라 점근선)
+
+        [{"x": 근 딕셔너리, "y": 그 점에서 약분한 식의 값}] 목록
+        """
+        factor = self.common_factor
+        while True:
+            shared = poly.gcd(factor, self.reduced[1])
+            if poly.is_constant(shared):
+                break
+            factor = poly.divide(factor, shared)
+        return [{"x": root, "y": self._reduced_value(root)} for root in poly.real_roots(factor)]
+
+    @functools.cached_property
+    def horizontal_asymptote(self):
+        """분자 차수 < 분모 차수이면 y=0, 같으면 최고차항 계수의 비, 그 외에는 None"""
+        num, den = self.reduced
+        if self.is_polynomial or poly.degree(num) > poly.degree(den):
+            return None
+        if poly.degree(num) < poly.degree(den):
+            return Fraction(0)
+        return num[-1]
+
+    @functools.cached_property
+    def oblique_asymptote(self):
+        """분자 차수 = 분모 차수 + 1 이면 긴 나눗셈의 몫(일차식), 그 외에는 None"""
+        num, den = self.reduced
+        if self.is_polynomial or poly.degree(num) != poly.degree(den) + 1:
+            return None
+        return poly.divmod_(num, den)[0]
+
+    @functools.cached_property
+    def standard_form(self):
+        """f(x) = k/(x-p) + q 꼴로 나타낼 수 있으면 {"k", "p", "q"}, 아니면 None"""
+        num, den = self.reduced
+        if poly.degree(den) != 1 or poly.degree(num) > 1:
+            return None
+        p = -den[0]
+        # 분자 = q(x-p) + k 이므로 q는 x의 계수, k는 분자에 x=p를 넣은 값
+        q = num[1] if len(num) == 2 else Fraction(0)
+        k = poly.evaluate(num, p)
+        return {"k": k, "p": p, "q": q}
+
+    def standard_form_latex(self):
+        form = self.standard_form
+        if form is None:
+            return None
+        k, p, q = form["k"], form["p"], form["q"]
+        shift = poly.latex((-p, Fraction(1)))
+        sign = "-" if k < 0 else ""
+        text = f"{sign}\\frac{{{abs(k.numerator)}}}{{{shift}}}" if k.denominator == 1 else (
+            f"{sign}\\frac{{{abs(k.numerator)}}}{{{k.denominator}({shift})}}"
+        )
+        if q > 0:
+            text += f" + {number_latex(q)}"
+        elif q < 0:
+            text += f" - {number_latex(-q)}"
+        return text
+
+    # --- 3. 정의역과 치역 ---
+    @functools.cached_property
+    def excluded_x(self):
+        """정의역에서 빠지는 x (입력한 식의 분모의 실근 = 수직 점근선 + 구멍)"""
+        return poly.real_roots(self.denominator)
+
+    def domain_latex(self):
+        if not self.excluded_x:
+            return "모든 실수 $\\mathbb{R}$"
+        conditions = ", ".join(f"x \\neq {root['latex']}" for root in self.excluded_x)
+        return f"$\\{{x \\mid {conditions}\\}}$"
+
+    def _limit(self, x_val, side):
+        """x가 x_val(±inf 또는 수직 점근선)에 다가갈 때의 극한 (side: +1 오른쪽에서, -1 왼쪽에서)"""
+        num, den = self.reduced
+        if math.isinf(x_val):
+            difference = poly.degree(num) - poly.degree(den)
+            if difference < 0:
+                return Fraction(0)
+            if difference == 0:
+                return num[-1]
+            sign = 1 if num[-1] > 0 else -1
+            if x_val < 0 and difference % 2:
+                sign = -sign
+            return sign * math.inf
+        # 수직 점근선 바로 옆에서의 부호로 +inf / -inf 결정
+        delta = 1e-7 * max(1.0, abs(x_val))
+        near = x_val + side * delta
+        value = poly.evaluate(num, near) / poly.evaluate(den, near)
+        return math.copysign(math.inf, value)
+
+    def _attains(self, y_val):
+        """구멍이 아닌 점에서 f(x) = y_val 이 되는 x가 있는지 (구멍의 y값이 치역에 남는지 판단)"""
+        num, den = self.reduced
+        if isinstance(y_val, Fraction):
+            equation = poly.sub(num, poly.scale(den, y_val))
+            if not equation:
+                return True
+            roots = [root["value"] for root in poly.real_roots(equation)]
+        else:
+            import numpy as np
+
+            coefficients = [float(a) - y_val * float(b) for a, b in zip(num + (0,) * len(den), den + (0,) * len(num))]
+            roots = [z.real for z in np.roots(coefficients[::-1]) if abs(z.imag) <= 1e-9 * max(1.0, abs(z))]
+        hole_xs = [hole["x"]["value"] for hole in self.holes]
+        return any(not any(_close(x_val, hole_x) for hole_x in hole_xs) for x_val in roots)
+
+    @functools.cached_property
+    def range_intervals(self):
+        """치역 = 구간 (하한, 상한, 하한 포함 여부, 상한 포함 여부) 목록에서 excluded의 y값을 뺀 집합
+
+        수직 점근선으로 나뉜 각 구간에서 양 끝의 극한과 극값(f'=0인 점의 값) 중 최솟값~최댓값이 상이 됩니다.
+        반환값: {"intervals": [...], "excluded": [...]}
+        """
+        num, den = self.reduced
+        if self.is_polynomial and poly.degree(num) <= 0:
+            c = num[0] if num else Fraction(0)
+            intervals = [(c, c, True, True)]
+        else:
+            critical_polynomial = poly.sub(
+                poly.mul(poly.derivative(num), den), poly.mul(num, poly.derivative(den))
+            )
+            poles = [root["value"] for root in self.vertical_asymptotes]
+            # 분모의 중근(1/x^2의 x=0)은 f'=0 식의 근이기도 하므로 제외
+            critical = [
+                (root["value"], self._reduced_value(root)) for root in poly.real_roots(critical_polynomial)
+                if not any(_close(root["value"], pole) for pole in poles)
+            ]
+            edges = [-math.inf] + poles + [math.inf]
+            intervals = []
+            for lo_x, hi_x in zip(edges[:-1], edges[1:]):
+                # (값, 실제로 그 값을 갖는지) - 극한값은 갖지 않고, 극값은 가짐
+                candidates = [(self._limit(lo_x, 1), False), (self._limit(hi_x, -1), False)]
+                candidates += [(y_val, True) for x_val, y_val in critical if lo_x < x_val < hi_x]
+                low = min(value for value, _ in candidates)
+                high = max(value for value, _ in candidates)
+                low_closed = any(attained and _close(value, low) for value, attained in candidates)
+                high_closed = any(attained and _close(value, high) for value, attained in candidates)
+                intervals.append((low, high, low_closed, high_closed))
+            intervals = _merge_intervals(intervals)
+
+        excluded = []
+        for hole in self.holes:
+            y_val = hole["y"]
+            if _in_intervals(y_val, intervals) and not self._attains(y_val) and y_val not in excluded:
+                excluded.append(y_val)
+        return {"intervals": intervals, "excluded": sorted(excluded)}
+
+    def range_latex(self):
+        intervals = list(self.range_intervals["intervals"])
+        excluded = list(self.range_intervals["excluded"])
+        if len(intervals) == 1 and intervals[0][0] == intervals[0][1]:
+            return f"$\\{{{number_latex(intervals[0][0])}\\}}$"
+
+        # (a, c) ∪ (c, b) 처럼 한 점만 빠진 경우는 y ≠ c 로 표시
+        joined = [intervals[0]]
+        for lo, hi, lo_closed, hi_closed in intervals[1:]:
+            prev_lo, prev_hi, prev_lo_closed, _ = joined[-1]
+            if _close(prev_hi, lo):
+                excluded.append(lo)
+                joined[-1] = (prev_lo, hi, prev_lo_closed, hi_closed)
+            else:
+                joined.append((lo, hi, lo_closed, hi_closed))
+
+        conditions = [_interval_condition(*interval) for interval in joined]
+        conditions = [c for c in conditions if c]
+        text = " \\text{ 또는 } ".join(conditions)
+        points = ", ".join(f"y \\neq {number_latex(y_val)}" for y_val in sorted(excluded))
+        if not text and not points:
+            return "모든 실수 $\\mathbb{R}$"
+        if text and points:
+            text = f"{text}, {points}"
+        return f"$\\{{y \\mid {text or points}\\}}$"
+
+    # --- 4. SymPy 검산 (선택) ---
+    def cross_check(self):
+        """같은 결과를 SymPy로 다시 구해 비교 (느리므로 확인용), 일치하지 않는 항목의 설명 목록을 반환"""
+        import sympy as sp
+
+        x = sp.Symbol('x')
+        f = poly.to_sympy(self.numerator, x) / poly.to_sympy(self.denominator, x)
+        problems = []
+
+        def real_roots(expr):
+            if not expr.has(x):
+                return []
+            return sorted({float(r) for r in sp.real_roots(sp.Poly(expr, x))})
+
+        def compare(name, ours, theirs):
+            if len(ours) != len(theirs) or not all(_close(a, b) for a, b in zip(ours, theirs)):
+                problems.append(f"{name}: {ours} (SymPy: {theirs})")
+
+        # SymPy는 (x-1)/(x-1)을 자동으로 약분하므로 입력한 분모를 직접 사용
+        compare("정의역에서 빠지는 x", [r["value"] for r in self.excluded_x], real_roots(poly.to_sympy(self.denominator, x)))
+        compare("수직 점근선", [r["value"] for r in self.vertical_asymptotes], real_roots(sp.denom(sp.cancel(f))))
+
+        if not self.is_polynomial:
+            limit = sp.limit(f, x, sp.oo)
+            ours = self.horizontal_asymptote
+            theirs = float(limit) if limit.is_finite else None
+            if (ours is None) != (theirs is None) or (ours is not None and not _close(float(ours), theirs)):
+                problems.append(f"수평 점근선: {ours} (SymPy: {limit})")
+        return problems
+
+
+# --- 5. 구간 도우미 ---
+def _merge_intervals(intervals):
+    """겹치거나 (한쪽이라도 닫힌 채로) 맞닿은 구간을 합침"""
+    intervals = sorted(intervals, key=lambda interval: (interval[0], not interval[2]))
+    merged = [intervals[0]]
+    for lo, hi, lo_closed, hi_closed in intervals[1:]:
+        prev_lo, prev_hi, prev_lo_closed, prev_hi_closed = merged[-1]
+        touching = _close(lo, prev_hi) and (lo_closed or prev_hi_closed)
+        overlapping = lo < prev_hi and not _close(lo, prev_hi)
+        if overlapping or touching:
+            if hi > prev_hi or (_close(hi, prev_hi) and hi_closed):
+                merged[-1] = (prev_lo, hi, prev_lo_closed, hi_closed)
+        else:
+            merged.append((lo, hi, lo_closed, hi_closed))
+    return merged
+
+
+def _in_intervals(y_val, intervals):
+    for lo, hi, lo_closed, hi_closed in intervals:
+        above = y_val > lo or (lo_closed and _close(y_val, lo))
+        below = y_val < hi or (hi_closed and _close(y_val, hi))
+        if above and below:
+            return True
+    return False
+
+
+def _interval_condition(lo, hi, lo_closed, hi_closed):
+    """구간 하나를 y에 대한 조건 LaTeX로 (모든 실수면 빈 문자열)"""
+    lower = "\\leq" if lo_closed else "<"
+    upper = "\\leq" if hi_closed else "<"
+    if math.isinf(lo) and math.isinf(hi):
+        return ""
+    if math.isinf(lo):
+        return f"y {upper} {number_latex(hi)}"
+    if math.isinf(hi):
+        at_least = "\\geq" if lo_closed else ">"
+        return f"y {at_least} {number_latex(lo)}"
+    if lo == hi:
+        return f"y = {number_latex(lo)}"
+    return f"{number_latex(lo)} {lower} y {upper} {number_latex(hi)}"
@@ -0,0 +1,260 @@
+"""학생이 입력한 유리식 전용 파서
+
+허용하는 문법만 직접 읽기 때문에 SymPy의 범용 파서보다 훨씬 빠르고(수십 마이크로초),
+잘못된 입력은 몇 번째 글자에서 문제가 생겼는지 알려 줍니다.
+
+    식     := 항 (('+' | '-') 항)*
+    항     := 부호식 (('*' | '/' | 생략된 곱셈) 부호식)*
+    부호식 := ('+' | '-') 부호식 | 거듭제곱
+    거듭제곱 := 기본식 (('^' | '**') 부호식)?
+    기본식 := 숫자 | 'x' | '(' 식 ')'
+
+결과는 분자와 분모 다항식의 계수 튜플(낮은 차수부터, Fraction)입니다. 약분은 하지 않습니다.
+"""
+import re
+from fractions import Fraction
+
+import polynomial as poly
+from app_cache import LRUCache
+from metrics import record_hit, span
+
+# 입력 문자열 -> (분자, 분모) 캐시 (모든 세션 공유)
+PARSE_CACHE = LRUCache(max_entries=1024)
+
+# x^1000000, ((x+1)^64)^64 같은 입력으로 서버가 멈추지 않도록 지수, 결과 차수(분자+분모), 계수 크기(비트) 제한
+MAX_EXPONENT = 64
+MAX_DEGREE = 64
+MAX_COEFFICIENT_BITS = 4096
+# 숫자 하나의 최대 자릿수 (소수점 제외, 파이썬의 정수 변환 한도 4300자리보다 훨씬 작게)
+MAX_DIGITS = 300
+
+_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|(\*\*|[-+*/^()])|([A-Za-z_]\w*)|(\S))")
+
+
+class ParseError(ValueError):
+    """입력 오류 (position: 문제가 생긴 글자의 0부터 센 위치)"""
+
+    def __init__(self, message, text, position):
+        super().__init__(f"{position + 1}번째 글자: {message}")
+        self.message = message
+        self.text = text
+        self.position = position
+
+    def pointer(self):
+        """입력 아래에 ^ 표시를 붙인 두 줄 문자열 (st.code 등으로 표시)"""
+        return f"{self.text}\n{' ' * self.position}^"
+
+
+# --- 1. 토큰 나누기 ---
+def _tokenize(text):
+    """(종류, 값, 위치) 목록; 종류는 'num', 'x', 연산자/괄호 문자, 'end'"""
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match.end() == position or not match.group(0).strip():
+            break
+        start = match.start(match.lastindex)
+        number, operator, name, other = match.groups()
+        if number is not None:
+            if len(number) - number.count(".") > MAX_DIGITS:
+                raise ParseError(f"숫자가 너무 깁니다 (최대 {MAX_DIGITS}자리)", text, start)
+            tokens.append(("num", Fraction(number), start))
+        elif operator is not None:
+            tokens.append((operator, operator, start))
+        elif name is not None:
+            if set(name) != {'x'}:
+                raise ParseError(f"'{name}'은(는) 사용할 수 없습니다 (변수는 x만 사용)", text, start)
+            # xx는 x*x로 읽음
+            tokens.extend(("x", 'x', start + i) for i in range(len(name)))
+        else:
+            raise ParseError(f"'{other}'은(는) 사용할 수 없는 기호입니다", text, start)
+        position = match.end()
+    tokens.append(("end", None, len(text)))
+    return tokens
+
+
+# --- 2. 유리식 값 (분자, 분모) 연산 ---
+def _normalize(num, den):
+    """분모가 상수이면 분자로 나눠 넣어 분모를 1로 만듦"""
+    if den == poly.ONE:
+        return num, den
+    if poly.is_constant(den):
+        return poly.scale(num, 1 / den[0]), poly.ONE
+    return num, den
+
+
+def _add(left, right):
+    (a, b), (c, d) = left, right
+    if b == d:
+        return _normalize(poly.add(a, c), b)
+    return _normalize(poly.add(poly.mul(a, d), poly.mul(c, b)), poly.mul(b, d))
+
+
+def _mul(left, right):
+    (a, b), (c, d) = left, right
+    return _normalize(poly.mul(a, c), poly.mul(b, d))
+
+
+def _invert(value):
+    num, den = value
+    return _normalize(den, num)
+
+
+def _degree(value):
+    """분자 차수 + 분모 차수"""
+    num, den = value
+    return max(len(num) - 1, 0) + max(len(den) - 1, 0)
+
+
+def _bits(value):
+    """가장 큰 계수의 비트 수 (분자 + 분모)"""
+    return max((c.numerator.bit_length() + c.denominator.bit_length() for p in value for c in p), default=0)
+
+
+# --- 3. 재귀 하강 파서 ---
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.index = 0
+        # 거듭제곱을 계산한 적이 있는지 (없으면 계수 크기는 입력 길이에 비례하므로 비트 수를 세지 않음)
+        self.powered = False
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def take(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def error(self, message, position):
+        raise ParseError(message, self.text, position)
+
+    def check_size(self, value, position):
+        """곱셈/덧셈 결과가 너무 커지면(분모끼리 곱해지는 긴 합, 거듭제곱끼리의 곱 등) 중단"""
+        if _degree(value) > MAX_DEGREE:
+            self.error(f"식의 차수가 너무 큽니다 (분자와 분모 합쳐 최대 {MAX_DEGREE}차)", position)
+        if self.powered and _bits(value) > MAX_COEFFICIENT_BITS:
+            self.error("식의 계수가 너무 큽니다", position)
+        return value
+
+    def parse(self):
+        if self.peek()[0] == "end":
+            self.error("식이 비어 있습니다", 0)
+        value = self.expression()
+        kind, _, position = self.peek()
+        if kind == ")":
+            self.error("여는 괄호 '('가 없는 ')'입니다", position)
+        if kind != "end":
+            self.error("여기서 식이 끝나야 합니다", position)
+        return value
+
+    def expression(self):
+        value = self.term()
+        while self.peek()[0] in ("+", "-"):
+            kind, _, position = self.take()
+            right = self.term()
+            if kind == "-":
+                right = (poly.neg(right[0]), right[1])
+            value = self.check_size(_add(value, right), position)
+        return value
+
+    def term(self):
+        value = self.signed()
+        while True:
+            kind, _, position = self.peek()
+            if kind == "*":
+                self.take()
+                value = _mul(value, self.signed())
+            elif kind == "/":
+                self.take()
+                divisor = self.signed()
+                if not divisor[0]:
+                    self.error("0으로 나눌 수 없습니다", position)
+                value = _mul(value, _invert(divisor))
+            elif kind in ("num", "x", "("):
+                # 2x, 3(x+1), (x+1)(x-1) 처럼 곱셈 기호를 생략한 경우
+                value = _mul(value, self.signed())
+            else:
+                return value
+            self.check_size(value, position)
+
+    def signed(self):
+        kind = self.peek()[0]
+        if kind in ("+", "-"):
+            self.take()
+            num, den = self.signed()
+            return (poly.neg(num), den) if kind == "-" else (num, den)
+        return self.power()
+
+    def power(self):
+        base = self.primary()
+        kind, _, position = self.peek()
+        if kind not in ("^", "**"):
+            return base
+        self.take()
+        exponent_position = self.peek()[2]
+        num, den = self.signed()
+        if not poly.is_constant(num) or (num and num[0].denominator != 1):
+            self.error("지수는 정수여야 합니다", exponent_position)
+        exponent = int(num[0]) if num else 0
+        if abs(exponent) > MAX_EXPONENT:
+            self.error(f"지수가 너무 큽니다 (최대 {MAX_EXPONENT})", exponent_position)
+        # 지수마다 제한해도 ((x+1)^64)^64 처럼 겹치면 결과가 커지므로 계산하기 전에 결과 크기를 어림함
+        # (계수 비트 수는 거듭제곱하면 지수 x (비트 수 + 차수) 정도까지 커짐)
+        degree = _degree(base)
+        if degree * abs(exponent) > MAX_DEGREE:
+            self.error(f"식의 차수가 너무 큽니다 (분자와 분모 합쳐 최대 {MAX_DEGREE}차)", exponent_position)
+        if (_bits(base) + degree) * abs(exponent) > MAX_COEFFICIENT_BITS:
+            self.error("식의 계수가 너무 큽니다", exponent_position)
+        self.powered = True
+        if exponent < 0:
+            if not base[0]:
+                self.error("0의 음수 거듭제곱은 정의되지 않습니다", position)
+            base, exponent = _invert(base), -exponent
+        return poly.power(base[0], exponent), poly.power(base[1], exponent)
+
+    def primary(self):
+        kind, value, position = self.take()
+        if kind == "num":
+            return poly.constant(value), poly.ONE
+        if kind == "x":
+            return poly.X, poly.ONE
+        if kind == "(":
+            inner = self.expression()
+            if self.peek()[0] != ")":
+                self.error("'('에 맞는 닫는 괄호 ')'가 없습니다", position)
+            self.take()
+            return inner
+        if kind == "end":
+            self.error("식이 끝나지 않았습니다", position)
+        self.error(f"'{value}' 자리에는 숫자, x 또는 '('가 와야 합니다", position)
+
+
+def parse_rational(text):
+    """유리식 문자열을 (분자 계수, 분모 계수) 튜플 쌍으로 변환 (캐시 사용)
+
+    잘못된 입력이면 ParseError(위치 포함)를 발생시킵니다.
+    """
+    result = PARSE_CACHE.get(text)
+    if result is not None:
+        # 캐시 적중은 횟수만 셈 (시간은 실제로 파싱할 때만 잼)
+        record_hit("parse")
+    else:
+        with span("parse", detail=text):
+            try:
+                result = _Parser(text).parse()
+            except RecursionError:
+                raise ParseError("괄호나 부호가 너무 깊게 겹쳐 있습니다", text, 0) from None
+        PARSE_CACHE.put(text, result)
+    return result
+
+
+def parse_constant(text):
+    """x가 없는 수(분수, 소수 포함)를 Fraction으로 변환 (x가 남으면 ParseError)"""
+    num, den = parse_rational(text)
+    if not (poly.is_constant(num) and poly.is_constant(den)):
+        raise ParseError("x가 없는 수를 입력해야 합니다", text, 0)
+    return num[0] / den[0] if num else Fraction(0)
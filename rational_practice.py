@@ -0,0 +1,69 @@
+"""유리식 계산 연습 문제 (교과서 유리식.py의 '문제 풀기' 탭)
+
+한 문제는 정수 7개로 이루어진 튜플입니다.
+    (sign, a, b, pA, qA, pB, qB)  ->  (pA x + qA)/(x + a)  ±  (pB x + qB)/(x + b)
+세션 상태에는 이 튜플만 저장하고, 문제 LaTeX와 약분된 모범 답안은 PRACTICE_CACHE에서 한 번만 계산합니다.
+"""
+import random
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import polynomial as poly
+from app_cache import LRUCache
+
+# 문제 튜플 -> 문제/모범 답안 (모든 세션 공유)
+PRACTICE_CACHE = LRUCache(max_entries=1024)
+
+# 다음 문제를 미리 계산해 두는 백그라운드 작업자 (프로세스당 하나)
+_prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="practice-prefetch")
+
+
+# --- 1. 문제 뽑기 ---
+def draw_problem(rng=random):
+    """기존 generate_problem과 같은 분포로 문제 튜플을 뽑음"""
+    sign = rng.choice([1, -1])
+    a, b = rng.sample(range(1, 5), 2)
+    return (sign, a, b, rng.randint(1, 5), rng.randint(0, 5), rng.randint(1, 5), rng.randint(0, 5))
+
+
+# --- 2. 문제와 모범 답안 계산 ---
+def _linear(p, q):
+    return poly.trim((Fraction(q), Fraction(p)))
+
+
+def _fraction_latex(num, den):
+    if den == poly.ONE:
+        return poly.latex(num)
+    return f"\\frac{{{poly.latex(num)}}}{{{poly.latex(den)}}}"
+
+
+def _solve(params):
+    sign, a, b, p_a, q_a, p_b, q_b = params
+    num_a, den_a = _linear(p_a, q_a), _linear(1, a)
+    num_b, den_b = _linear(p_b, q_b), _linear(1, b)
+
+    # 통분한 뒤 분자와 분모의 최대공약수로 약분 (최고차항 계수 1인 정수 다항식으로 나누므로 계수는 정수로 남음)
+    num = poly.add(poly.mul(num_a, den_b), poly.scale(poly.mul(num_b, den_a), sign))
+    den = poly.mul(den_a, den_b)
+    common = poly.gcd(num, den)
+    num, den = poly.divide(num, common), poly.divide(den, common)
+
+    operator = "+" if sign > 0 else "-"
+    return {
+        "problem_latex": f"{_fraction_latex(num_a, den_a)} {operator} {_fraction_latex(num_b, den_b)}",
+        # 채점용 (분자, 분모) 계수 쌍 (rational_parser 결과와 같은 형태)
+        "solution": (num, den),
+        "solution_latex": _fraction_latex(num, den),
+    }
+
+
+def solve_problem(params):
+    """문제 LaTeX와 약분된 모범 답안을 반환 (캐시 사용)"""
+    return PRACTICE_CACHE.get_or_create(params, lambda: _solve(params))
+
+
+def prefetch_problem(rng=random):
+    """다음 문제를 뽑고 모범 답안 계산은 백그라운드에서 시작한 뒤 문제 튜플을 바로 반환"""
+    params = draw_problem(rng)
+    _prefetch_pool.submit(solve_problem, params)
+    return params
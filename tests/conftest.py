@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 저장소 최상위의 모듈(rational_parser 등)을 불러오기 위한 경로 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
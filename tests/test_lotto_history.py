@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from lotto_engine import LOTTO_MAX, PICK_COUNT, rank_matrix, tickets_to_masks
+from lotto_history import (
+    available_rounds, build_history, get_draw, load_history, read_draws_csv, save_history, score_against_history
+)
+
+DRAWS = [
+    (1, [10, 23, 29, 33, 37, 40], 16),
+    (2, [9, 13, 21, 25, 32, 42], 2),
+    (4, [14, 27, 30, 31, 40, 42], 2),
+]
+
+
+def _saved_history(tmp_path, draws=DRAWS):
+    path = tmp_path / "lotto_history.npy"
+    save_history(build_history(draws), path)
+    return path
+
+
+def test_round_trip_shape_ranges_and_unique_rows(tmp_path):
+    history = load_history(_saved_history(tmp_path))
+    # 3회처럼 넣지 않은 회차는 빠짐
+    assert history["rounds"].tolist() == [1, 2, 4]
+    assert history["numbers"].shape == (3, PICK_COUNT)
+    assert history["bonus"].shape == (3,)
+    assert ((history["numbers"] >= 1) & (history["numbers"] <= LOTTO_MAX)).all()
+    assert ((history["bonus"] >= 1) & (history["bonus"] <= LOTTO_MAX)).all()
+    for numbers, bonus in zip(history["numbers"].tolist(), history["bonus"].tolist()):
+        assert numbers == sorted(set(numbers))
+        assert bonus not in numbers
+
+
+def test_rounds_and_single_draw(tmp_path):
+    path = _saved_history(tmp_path)
+    assert available_rounds(path) == [4, 2, 1]
+    assert get_draw(2, path) == ([9, 13, 21, 25, 32, 42], 2)
+    with pytest.raises(KeyError):
+        get_draw(3, path)
+
+
+def test_reads_official_csv_columns(tmp_path):
+    csv_path = tmp_path / "draws.csv"
+    csv_path.write_text("\ufeff회차,번호1,번호2,번호3,번호4,번호5,번호6,보너스\n1,10,23,29,33,37,40,16\n", encoding="utf-8")
+    assert read_draws_csv(csv_path) == [DRAWS[0]]
+
+
+@pytest.mark.parametrize("draw", [
+    (1, [1, 2, 3, 4, 5, 5], 6),
+    (1, [0, 2, 3, 4, 5, 6], 7),
+    (1, [1, 2, 3, 4, 5, 46], 7),
+    (1, [1, 2, 3, 4, 5, 6], 6),
+    (0, [1, 2, 3, 4, 5, 6], 7),
+])
+def test_rejects_invalid_draws(draw):
+    with pytest.raises(ValueError):
+        build_history([draw])
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_history(tmp_path / "missing.npy")
+
+
+def test_five_matches_plus_bonus_is_second_prize(tmp_path):
+    path = _saved_history(tmp_path)
+    tickets = np.array([
+        [10, 23, 29, 33, 37, 40],  # 1회 1등
+        [10, 23, 29, 33, 37, 16],  # 1회 5개 + 보너스 = 2등
+        [10, 23, 29, 33, 37, 1],   # 1회 5개 = 3등
+        [1, 2, 3, 4, 5, 6],
+    ], dtype=np.uint8)
+    ranks = score_against_history(tickets_to_masks(tickets), path)
+    assert ranks.shape == (4, 3)
+    assert ranks[:, 0].tolist() == [1, 2, 3, 0]
+
+
+def test_unknown_bonus_never_gives_second_prize():
+    masks = tickets_to_masks(np.array([[10, 23, 29, 33, 37, 16]], dtype=np.uint8))
+    winning = tickets_to_masks(np.array([[10, 23, 29, 33, 37, 40]], dtype=np.uint8))
+    assert rank_matrix(masks, winning, np.zeros(1, dtype=np.uint64)).tolist() == [[3]]
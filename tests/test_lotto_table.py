@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from lotto_table import HIGHLIGHT_MAX_ROWS, NUMBER_COLUMNS, highlight_winning, results_frame
+
+WINNING_NUMBERS = {3, 15, 27, 33, 34, 36}
+TICKETS = np.array([[3, 9, 15, 20, 40, 45], [1, 2, 4, 5, 6, 7]], dtype=np.uint8)
+
+
+def test_number_columns_stay_numeric():
+    frame = results_frame(TICKETS, [2, 0], [0, 0])
+    styled = highlight_winning(frame, WINNING_NUMBERS)
+    assert all(pd.api.types.is_integer_dtype(styled.data[column]) for column in NUMBER_COLUMNS)
+    assert styled.data[NUMBER_COLUMNS].to_numpy().tolist() == TICKETS.tolist()
+
+
+def test_only_winning_number_cells_are_styled():
+    styled = highlight_winning(results_frame(TICKETS, [2, 0], [0, 0]), WINNING_NUMBERS)
+    styled._compute()
+    cells = {(row, col) for (row, col), props in styled.ctx.items() if props}
+    columns = [styled.data.columns.get_loc(column) for column in ("번호1", "번호3")]
+    assert cells == {(0, col) for col in columns}
+
+
+def test_large_tables_skip_the_styler():
+    tickets = np.tile(TICKETS, (HIGHLIGHT_MAX_ROWS, 1))
+    frame = results_frame(tickets, np.zeros(len(tickets), dtype=np.int64), np.zeros(len(tickets), dtype=np.int8))
+    assert highlight_winning(frame, WINNING_NUMBERS) is frame
@@ -0,0 +1,13 @@
+import metrics
+from rational_parser import PARSE_CACHE, parse_rational
+
+
+def test_cache_hits_are_counted_next_to_timed_misses():
+    metrics.reset()
+    PARSE_CACHE.clear()
+    for _ in range(3):
+        parse_rational("(x+1)/(x-2)")
+    row = next(row for row in metrics.snapshot() if row["phase"] == "parse")
+    assert row["count"] == 1
+    assert row["hits"] == 2
+    assert row["hit_rate"] == 2 / 3
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from asymptotes import find_vertical_asymptotes
+from numeric_eval import ExpressionError, get_evaluator
+
+
+def test_evaluates_allowed_functions():
+    x = np.array([0.5, 1.0])
+    np.testing.assert_allclose(get_evaluator("sin(x)/x")(x), np.sin(x) / x)
+    np.testing.assert_allclose(get_evaluator("2")(x), [2.0, 2.0])
+
+
+@pytest.mark.parametrize("text", ["__import__('os')", "x.__class__", "open('f')", "(lambda: 1)()"])
+def test_rejects_arbitrary_python(text):
+    with pytest.raises(ExpressionError):
+        get_evaluator(text)
+
+
+def test_integer_constants_do_not_use_python_integer_power():
+    f = get_evaluator("9**9**9")
+    with pytest.raises(OverflowError):
+        f(np.zeros(3))
+
+
+def test_non_rational_denominator_poles():
+    poles = find_vertical_asymptotes(get_evaluator("1"), get_evaluator("sin(x)"), -4, 4)["poles"]
+    np.testing.assert_allclose(poles, [-np.pi, 0.0, np.pi], atol=1e-9)
@@ -0,0 +1,11 @@
+from rational_analysis import ANALYSIS_CACHE, analyze_rational_function
+
+
+def test_cold_analysis_counts_one_cache_miss():
+    ANALYSIS_CACHE.clear()
+    analyze_rational_function("(3x+1)/(x-4)")
+    analyze_rational_function("(3x+1)/(x-4)")
+    # 표기만 다른 같은 식은 계수 키로 적중
+    analyze_rational_function("(1+3x)/(x-4)")
+    stats = ANALYSIS_CACHE.stats()
+    assert (stats["misses"], stats["hits"]) == (1, 2)
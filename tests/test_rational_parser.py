@@ -0,0 +1,53 @@
+import time
+from fractions import Fraction
+
+import pytest
+
+from rational_parser import MAX_DEGREE, MAX_DIGITS, ParseError, parse_rational
+
+
+def test_parses_rational_function():
+    num, den = parse_rational("(2x+1)/(x-3)")
+    assert num == (Fraction(1), Fraction(2))
+    assert den == (Fraction(-3), Fraction(1))
+
+
+def test_allows_power_up_to_max_degree():
+    num, den = parse_rational(f"(x+1)^{MAX_DEGREE}")
+    assert len(num) - 1 == MAX_DEGREE
+    assert num[0] == num[-1] == 1
+
+
+@pytest.mark.parametrize("text", [
+    "((x+1)^64)^16",
+    "((x+1)^64)^32",
+    "((x+1)^8)^-16",
+    "(x+1)^32*(x+1)^32*(x+1)",
+    "(x+1)^40/(x-1)^40",
+    "(((9^64)^64)^64)^64",
+])
+def test_rejects_nested_or_chained_powers_quickly(text):
+    start = time.perf_counter()
+    with pytest.raises(ParseError):
+        parse_rational(text)
+    assert time.perf_counter() - start < 1.0
+
+
+@pytest.mark.parametrize("text", [
+    "(" * 1000 + "x" + ")" * 1000,
+    "-" * 5000 + "x",
+])
+def test_deep_nesting_raises_parse_error(text):
+    with pytest.raises(ParseError, match="깊게"):
+        parse_rational(text)
+
+
+@pytest.mark.parametrize("text", ["1" * 5000, "x+0." + "1" * 5000])
+def test_long_number_raises_parse_error(text):
+    with pytest.raises(ParseError, match="숫자가 너무 깁니다"):
+        parse_rational(text)
+
+
+def test_allows_number_up_to_max_digits():
+    num, den = parse_rational("9" * MAX_DIGITS)
+    assert num == (Fraction(10 ** MAX_DIGITS - 1),)
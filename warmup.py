@@ -0,0 +1,193 @@
+"""서버 예열(warm-up)과 페이지별 import 시간 보고
+
+start_warm_up()은 프로세스당 한 번 백그라운드 스레드에서 무거운 모듈(SymPy, Matplotlib)을 미리
+import하고, 각 페이지의 기본 입력으로 분석/렌더링 캐시를 채워 첫 방문자의 대기 시간을 줄입니다.
+
+    python warmup.py            # 예열 단계별 소요 시간 출력
+    python warmup.py --imports  # 페이지별 import 시간 보고
+"""
+import argparse
+import ast
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# 각 페이지의 기본 입력 (페이지 코드의 value= 와 같게 유지)
+DEFAULT_RATIONAL_FUNCTION = "(2*x + 1)/(x - 3)"
+DEFAULT_NUMERATOR = "3"
+DEFAULT_DENOMINATOR = "x-2"
+DEFAULT_QUADRATIC_A = 1.0
+
+# 예열 단계별 소요 시간(초), 단계가 끝날 때마다 채워짐
+WARM_UP_REPORT = {}
+
+_warm_up_thread = None
+_warm_up_lock = threading.Lock()
+
+
+# --- 1. 예열 단계 ---
+def _import_sympy():
+    import sympy  # noqa: F401
+
+
+def _import_matplotlib():
+    # import뿐 아니라 글꼴 캐시 로드까지 끝내기 위해 작은 그림을 한 번 그려 봄
+    import io
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(1, 1))
+    fig.add_subplot().plot([0, 1], [0, 1], label='$x$')
+    fig.savefig(io.BytesIO(), format='png')
+
+
+def _prime_analysis_cache():
+    from rational_analysis import analyze_rational_function
+
+    analyze_rational_function(DEFAULT_RATIONAL_FUNCTION)
+
+
+def _prime_parse_cache():
+    from rational_parser import parse_rational
+
+    parse_rational(DEFAULT_NUMERATOR)
+    parse_rational(DEFAULT_DENOMINATOR)
+
+
+def _prime_render_cache():
+    from quadratic_family import a_index, warm_render_cache
+
+    warm_render_cache(indices=[a_index(DEFAULT_QUADRATIC_A)])
+
+
+def _load_problem_bank():
+    from problem_bank import load_problem_bank
+
+    load_problem_bank()
+
+
+WARM_UP_STEPS = [
+    ("SymPy import", _import_sympy),
+    ("Matplotlib import", _import_matplotlib),
+    ("분석 캐시 (유리함수 기본 입력)", _prime_analysis_cache),
+    ("파서 캐시 (분자/분모 기본 입력)", _prime_parse_cache),
+    ("렌더링 캐시 (a = 1.0)", _prime_render_cache),
+    ("문제 은행 로드", _load_problem_bank),
+]
+
+
+def warm_up():
+    """예열 단계를 순서대로 실행하고 단계별 소요 시간을 WARM_UP_REPORT에 기록
+
+    한 단계가 실패해도 나머지 단계는 계속 진행합니다 (실패한 단계는 페이지에서 평소처럼 처리됨).
+    """
+    for name, step in WARM_UP_STEPS:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            WARM_UP_REPORT[name] = f"실패: {e}"
+            continue
+        WARM_UP_REPORT[name] = time.perf_counter() - start
+    return WARM_UP_REPORT
+
+
+def start_warm_up():
+    """프로세스당 한 번만 백그라운드 스레드로 예열을 시작 (여러 번 호출해도 안전)
+
+    페이지 스크립트는 이 함수를 import 직후 호출하며, 예열이 끝날 때까지 기다리지 않습니다.
+    """
+    global _warm_up_thread
+    with _warm_up_lock:
+        if _warm_up_thread is None:
+            _warm_up_thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+            _warm_up_thread.start()
+    return _warm_up_thread
+
+
+# --- 2. 페이지별 import 시간 보고 ---
+def page_files():
+    """main.py, pages/, 교과서 폴더의 페이지 스크립트 목록"""
+    return [ROOT / "main.py"] + sorted((ROOT / "pages").glob("*.py")) + sorted((ROOT / "유리함수 교과서").glob("*.py"))
+
+
+def page_imports(path):
+    """페이지 최상위의 import 문만 뽑아 소스 문자열 목록과 import한 최상위 패키지 이름을 반환"""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    packages = set()
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            packages.update(alias.name.split(".")[0] for alias in node.names)
+        else:
+            packages.add(node.module.split(".")[0])
+    return [ast.unparse(node) for node in nodes], packages
+
+
+def _heaviest_modules(importtime_log, packages, top):
+    """python -X importtime 로그에서 페이지가 import한 패키지 중 누적 시간이 큰 것을 고름"""
+    totals = {}
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.rstrip()
+        # 들여쓰기가 없는 항목 = 페이지가 직접 import한 모듈
+        if name.startswith("  "):
+            continue
+        package = name.strip().split(".")[0]
+        if package not in packages:
+            continue
+        totals[package] = max(totals.get(package, 0), int(cumulative) / 1e6)
+    return sorted(totals.items(), key=lambda item: -item[1])[:top]
+
+
+def measure_page_imports(path, top=3):
+    """새 파이썬 프로세스에서 페이지의 import 문만 실행하여 걸린 시간(초)과 무거운 모듈을 잼
+
+    페이지 본문(st.* 호출)은 실행하지 않으므로 Streamlit 서버 없이도 측정할 수 있습니다.
+    """
+    imports, packages = page_imports(path)
+    code = "\n".join([
+        "import sys, time",
+        f"sys.path.insert(0, {str(ROOT)!r})",
+        "start = time.perf_counter()",
+        *imports,
+        "print(time.perf_counter() - start)",
+    ])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=ROOT, check=True,
+    )
+    return {
+        "page": str(path.relative_to(ROOT)),
+        "seconds": float(result.stdout.strip().splitlines()[-1]),
+        "heaviest": _heaviest_modules(result.stderr, packages, top),
+    }
+
+
+def import_report():
+    return [measure_page_imports(path) for path in page_files()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 예열 및 페이지별 import 시간 보고")
+    parser.add_argument("--imports", action="store_true", help="페이지별 import 시간만 측정")
+    args = parser.parse_args()
+
+    if args.imports:
+        for row in import_report():
+            heaviest = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in row["heaviest"])
+            print(f"{row['seconds']:6.2f}s  {row['page']}  ({heaviest})")
+        return
+
+    for name, seconds in warm_up().items():
+        print(f"{name}: {seconds:.2f}s" if isinstance(seconds, float) else f"{name}: {seconds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,119 +1,56 @@
 import streamlit as st
-import sympy as sp
-import numpy as np
-import matplotlib.pyplot as plt
 import random
+import sys
+from pathlib import Path
+
+# 저장소 최상위의 공용 모듈을 불러오기 위한 경로 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from chart_backend import add_hline, add_line, add_vline, backend_selector, draw_chart, new_chart
+from grading import is_equivalent
+from metrics import set_page, span
+from plot_sampling import adaptive_sample
+from problem_bank import DEFAULT_DIFFICULTY, DIFFICULTY_LEVELS, problem_info, sample_problem_params
+from rational_analysis import analyze_rational_function
+from rational_function import number_latex
+from rational_parser import ParseError, parse_rational
+from warmup import start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
+# 단계별 시간 측정에 쓸 페이지 이름 (pages/07 관리자 페이지에서 확인)
+set_page(__file__)
 
 # --- 유틸리티 함수: 문제 데이터베이스 생성 ---
-def generate_rational_function_problems(num_problems=30):
-    """30개의 유리함수 문제 데이터베이스를 생성합니다."""
-    problems = []
-    COEF_RANGE = (-5, 5)
-    x = sp.Symbol('x')
-
-    while len(problems) < num_problems:
-        a = random.choice([i for i in range(*COEF_RANGE) if i != 0])
-        b = random.randint(*COEF_RANGE)
-        c = random.choice([i for i in range(*COEF_RANGE) if i != 0])
-        d = random.randint(*COEF_RANGE)
-
-        # 수직 점근선이 정수 또는 간단한 분수가 되도록 조정
-        if c != 0 and d % c != 0:
-             d = c * random.choice([i for i in range(-5, 5) if i != 0])
-        
-        # 분모가 0이 아닌지 확인
-        if c == 0 and d == 0: continue
-        
-        numer = a * x + b
-        denom = c * x + d
-        f_sym = sp.simplify(numer / denom)
-        
-        # 수직/수평 점근선 계산
-        try:
-            va_sol = sp.solve(denom, x)
-            if not va_sol: continue
-            
-            va = va_sol[0]
-            # SymPy 객체의 문자열 표현을 사용 (불필요한 .00 방지)
-            va_val_str_raw = str(va.evalf(3).p if va.is_real else va)
-            va_float = float(va.evalf())
-            
-            ha_sympy = sp.limit(f_sym, x, sp.oo)
-            ha_val_str_raw = str(ha_sympy.evalf(3).p if ha_sympy.is_real else ha_sympy)
-            ha_float = float(ha_sympy.evalf())
-            
-        except Exception:
-            continue
+def generate_rational_function_problems(num_problems=30, difficulty=DEFAULT_DIFFICULTY):
+    """난이도에 맞는 num_problems개의 유리함수 문제를 뽑습니다.
 
-        # LaTeX 출력 포맷 (불필요한 .00 제거된 문자열 사용)
-        solution_va = f"$x = {va_val_str_raw}$"
-        solution_ha = f"$y = {ha_val_str_raw}$"
-        
-        explanation = f"""
-        **1. 수직 점근선 ($\mathbf{{x}}$)**
-        - 분모가 0이 되는 $x$ 값을 찾습니다. ${sp.latex(denom)} = 0$
-        - $x = {va_val_str_raw}$ 입니다. (정답: $\mathbf{{{solution_va}}}$)
-        
-        **2. 수평 점근선 ($\mathbf{{y}}$)**
-        - 분자와 분모의 차수가 같으므로, 최고차항 계수의 비 $\\frac{{{a}}}{{{c}}}$를 구합니다.
-        - $y = {ha_val_str_raw}$ 입니다. (정답: $\mathbf{{{solution_ha}}}$)
-        """
-
-        problems.append({
-            'id': len(problems) + 1,
-            'function': f_sym,
-            'function_str': f"({sp.latex(numer)})/({sp.latex(denom)})",
-            'va_ans': solution_va,
-            'ha_ans': solution_ha,
-            'explanation': explanation,
-            'va_val': va_float,  # 그래프용 실수
-            'ha_val': ha_float,  # 그래프용 실수
-            'va_exact': va,      # 채점용 SymPy 객체
-            'ha_exact': ha_sympy, # 채점용 SymPy 객체
-        })
-        
-    return problems
+    세션 상태에는 문제마다 계수 튜플 (a, b, c, d)만 저장하고, 정답/식/풀이는 problem_info로 그때그때 얻습니다.
+    """
+    return sample_problem_params(num_problems, difficulty=difficulty)
 
 # --- 유틸리티 함수: 그래프 그리기 ---
-def plot_rational_function(f_sym, va_float, ha_float, va_val_str, ha_val_str, x_min, x_max, y_min, y_max):
-    """Matplotlib을 사용하여 유리함수 그래프를 그립니다."""
+def plot_rational_function(analysis, x_min, x_max, y_min, y_max):
+    """유리함수 그래프를 그립니다. (브라우저 렌더링 또는 Matplotlib 이미지)"""
     try:
-        x = sp.Symbol('x')
-        f_np = sp.lambdify(x, f_sym, 'numpy')
-        
-        x_vals = np.linspace(x_min, x_max, 500)
+        # 같은 식이면 캐시에 저장된 분석 결과의 NumPy 함수를 재사용
+        f_np = analysis["f_np"]
+        f_latex = analysis["latex"]
         
-        if va_float is not None and x_min < va_float < x_max:
-            x_vals_1 = np.linspace(x_min, va_float - 0.01, 250)
-            x_vals_2 = np.linspace(va_float + 0.01, x_max, 250)
-            x_vals = np.concatenate([x_vals_1, x_vals_2])
-        
-        y_vals = f_np(x_vals)
-        
-        y_vals[y_vals > y_max * 1.5] = np.nan
-        y_vals[y_vals < y_min * 1.5] = np.nan
+        # 적응형 샘플링: 곡률이 크거나 발산하는 곳에 점을 집중하고, 수직 점근선에서는 선을 끊음
+        x_vals, y_vals = adaptive_sample(f_np, x_min, x_max, y_min, y_max, max_points=500)
 
-        fig, ax = plt.subplots(figsize=(8, 6))
-        ax.plot(x_vals, y_vals, label=f"${sp.latex(f_sym)}$", color='blue', linewidth=2)
+        chart = new_chart(f"함수 그래프: $f(x) = {f_latex}$", x_range=(x_min, x_max), y_range=(y_min, y_max))
+        add_line(chart, x_vals, y_vals, label=f"${f_latex}$", color='blue', width=2)
         
-        # 점근선 표시
-        if va_float is not None:
-            ax.axvline(x=va_float, color='red', linestyle='--', label=f'VA: $x={va_val_str}$')
+        # 점근선 표시 (수직 점근선은 모두)
+        for va in analysis["vertical_asymptotes"]:
+            add_vline(chart, va["value"], label=f'VA: $x={va["latex"]}$', color='red')
         
-        if ha_float is not None:
-            ax.axhline(y=ha_float, color='green', linestyle='--', label=f'HA: $y={ha_val_str}$')
-
-        ax.set_title(f"함수 그래프: $f(x) = {sp.latex(f_sym)}$")
-        ax.set_xlabel('x')
-        ax.set_ylabel('y')
-        ax.set_xlim(x_min, x_max)
-        ax.set_ylim(y_min, y_max)
-        ax.grid(True, linestyle=':', alpha=0.6)
-        ax.legend()
-        ax.axhline(0, color='gray', linewidth=0.5) 
-        ax.axvline(0, color='gray', linewidth=0.5) 
+        ha_val = analysis["horizontal_asymptote"]
+        if ha_val is not None:
+            add_hline(chart, float(ha_val), label=f'HA: $y={number_latex(ha_val)}$', color='green')
 
-        st.pyplot(fig)
+        draw_chart(chart)
 
     except Exception as e:
         st.error("📉 **그래프를 그리는 중 오류가 발생했습니다.**")
@@ -141,59 +78,57 @@ def graph_analyzer_tab():
 
     if func_str:
         try:
-            x = sp.Symbol('x')
-            f_sym = sp.simplify(func_str)
-            numer, denom = sp.fraction(f_sym)
-
-            va_sol = sp.solve(denom, x)
-            ha_sympy = sp.limit(f_sym, x, sp.oo)
-            
-            # ⭐ 정의역/치역 포맷 개선 적용
-            va_val = va_sol[0] if va_sol else None
-            va_str = str(va_val.p) if va_val is not None and va_val.is_real else "없음"
-            va_float = float(va_val.evalf()) if va_val is not None else None
+            # 분수 계수 다항식으로 점근선(모두), 구멍, 정의역/치역 계산 (같은 식이면 공유 캐시 사용)
+            analysis = analyze_rational_function(func_str)
             
-            ha_val = ha_sympy if ha_sympy.is_real and ha_sympy != sp.oo else None
-            ha_str = str(ha_val.p) if ha_val is not None else "없음"
-            ha_float = float(ha_val.evalf()) if ha_val is not None else None
-
+            va_str = ", ".join(va["latex"] for va in analysis["vertical_asymptotes"]) or "없음"
+            ha_val = analysis["horizontal_asymptote"]
+            ha_str = number_latex(ha_val) if ha_val is not None else "없음"
 
             col1, col2 = st.columns(2)
 
             with col1:
                 st.subheader("🔍 분석 결과")
-                st.latex(f"f(x) = {sp.latex(f_sym)}")
+                st.latex(f"f(x) = {analysis['latex']}")
+                if analysis["standard_form_latex"] is not None:
+                    st.latex(f"f(x) = {analysis['standard_form_latex']}")
                 
                 st.markdown("#### ⭐ 점근선")
                 st.write(f"**수직 점근선 (VA)**: $x = {va_str}$")
                 st.write(f"**수평 점근선 (HA)**: $y = {ha_str}$")
+                if analysis["holes"]:
+                    hole_list = ", ".join(f"({hole['x']['latex']}, {number_latex(hole['y'])})" for hole in analysis["holes"])
+                    st.write(f"**구멍**: ${hole_list}$")
                 
                 st.markdown("#### 📖 정의역 및 치역")
-                
-                # ⭐ SyntaxError 수정 및 포맷 개선 적용
-                domain_latex = f"$\\{{x \\mid x \\neq {va_str}\}}\\$" if va_val is not None else "모든 실수 $\\mathbb{R}$"
-                range_latex = f"$\\{{y \\mid y \\neq {ha_str}\}}\\$" if ha_val is not None and ha_val != sp.oo else "모든 실수 $\\mathbb{R}$"
-                
-                st.markdown(f"**정의역**: {domain_latex}")
-                st.markdown(f"**치역**: {range_latex}")
+                st.markdown(f"**정의역**: {analysis['domain_latex']}")
+                st.markdown(f"**치역**: {analysis['range_latex']}")
                 
             with col2:
                 st.subheader("📈 그래프 시각화")
-                plot_rational_function(f_sym, va_float, ha_float, va_str, ha_str, x_min, x_max, y_min, y_max)
+                plot_rational_function(analysis, x_min, x_max, y_min, y_max)
                 
+        except ParseError as e:
+            st.error(f"❌ **입력한 식을 읽을 수 없습니다.** ({e})")
+            st.code(e.pointer(), language=None)
+
         except Exception as e:
             st.error("❌ **유리식 분석에 실패했습니다.**")
             st.warning("입력 형식이 잘못되었거나, 수식에 $x$가 포함되어 있지 않을 수 있습니다.")
-            st.info("💡 팁: 곱셈은 `*`를 사용하고, 거듭제곱은 `**`를 사용하세요.")
+            st.info("💡 팁: 곱셈 기호는 생략할 수 있고(`2x`), 거듭제곱은 `^` 또는 `**`를 사용하세요.")
 
 
 # --- 탭 2: 유리함수 문제 풀이 ---
 def quiz_tab():
     st.header("📝 유리함수 점근선 퀴즈")
     
-    # 세션 상태 초기화 및 문제 로드
-    if 'problems' not in st.session_state:
-        st.session_state.problems = generate_rational_function_problems(30)
+    difficulty = st.radio("난이도", list(DIFFICULTY_LEVELS), index=list(DIFFICULTY_LEVELS).index(DEFAULT_DIFFICULTY),
+                          horizontal=True, key="quiz_difficulty")
+
+    # 세션 상태 초기화 및 문제 로드 (난이도를 바꾸면 새 문제 세트)
+    if 'problems' not in st.session_state or st.session_state.get('problems_difficulty') != difficulty:
+        st.session_state.problems = generate_rational_function_problems(30, difficulty)
+        st.session_state.problems_difficulty = difficulty
         st.session_state.current_index = 0
         st.session_state.attempts = [0] * 30 
         st.session_state.show_solution = [False] * 30 
@@ -201,13 +136,15 @@ def quiz_tab():
 
     total_problems = len(st.session_state.problems)
     current_index = st.session_state.current_index
-    current_problem = st.session_state.problems[current_index]
+    # 정답/식/풀이는 모든 세션이 공유하는 캐시에서 가져옴
+    current_problem = problem_info(st.session_state.problems[current_index])
     
     st.subheader(f"문제 {current_index + 1} / {total_problems}")
 
     # --- 문제 출제 ---
     st.markdown("다음 유리함수의 **수직 점근선**과 **수평 점근선**을 구하고 입력하세요.")
-    st.latex(f"f(x) = {current_problem['function_str']}")
+    function_str = current_problem['function_str']
+    st.latex(f"f(x) = {function_str}")
     
     # --- 문제 새로고침 및 이동 버튼 (생략) ---
     col_nav_1, col_nav_2, col_nav_3, col_nav_4 = st.columns([1, 1, 1, 3])
@@ -249,24 +186,25 @@ def quiz_tab():
         
         is_all_correct = False
         
-        # ⭐ 채점 로직 강화: SymPy를 이용해 분수/소수/정수 입력 모두 허용
+        # ⭐ 채점 로직 강화: 분수/소수/정수 입력 모두 허용
         try:
             # 1. 사용자 입력에서 'x='와 'y=' 제거 후 값만 추출
             va_value_str = user_va.lower().replace(" ", "").replace("x=", "")
             ha_value_str = user_ha.lower().replace(" ", "").replace("y=", "")
 
-            # 2. SymPy로 사용자 입력 값을 파싱 (분수, 정수, 소수 모두 SymPy 객체로 변환)
-            user_va_sym = sp.parse_expr(va_value_str)
-            user_ha_sym = sp.parse_expr(ha_value_str)
+            # 2. 전용 파서로 사용자 입력 값을 파싱 (분수, 정수, 소수 모두 정확한 분수 계수로 변환)
+            user_va_sym = parse_rational(va_value_str)
+            user_ha_sym = parse_rational(ha_value_str)
             
-            # 3. SymPy 객체 간의 정확한 비교 (소수점 자릿수 무시하고 수학적으로 동등한지 확인)
-            is_correct_va = user_va_sym == current_problem['va_exact']
-            is_correct_ha = user_ha_sym == current_problem['ha_exact']
+            # 3. 정확한 값 비교 (0.5와 1/2처럼 표기만 다른 답도 정답으로 인정)
+            with span("grade", detail=f"{user_va} / {user_ha}"):
+                is_correct_va = is_equivalent(user_va_sym, current_problem['va'])
+                is_correct_ha = is_equivalent(user_ha_sym, current_problem['ha'])
             is_all_correct = is_correct_va and is_correct_ha
             
-        except (sp.SympifyError, ValueError, IndexError):
-            # 입력 형식 자체가 잘못된 경우 (예: "adf" 입력)
-            st.session_state.feedback_message = "❌ **입력 형식이 잘못되었습니다.** 'x=값' 또는 'y=값' 형태로 입력해 주세요. (예: x=1/2)"
+        except ParseError as e:
+            # 입력 형식 자체가 잘못된 경우 (예: "adf" 입력) -> 'x=', 'y=' 뒤 값에서 잘못된 위치까지 알려줌
+            st.session_state.feedback_message = f"❌ **입력 형식이 잘못되었습니다.** (`{e.text}`의 {e}) 'x=값' 또는 'y=값' 형태로 입력해 주세요. (예: x=1/2)"
             st.rerun()
 
         # 1. 시도 횟수 업데이트
@@ -308,7 +246,8 @@ def quiz_tab():
     # --- 정답 및 풀이 섹션 ---
     if st.session_state.show_solution[current_index] or st.session_state.attempts[current_index] >= 2:
         st.subheader("💡 정답 및 풀이")
-        st.markdown(f"**정답: 수직 점근선**은 {current_problem['va_ans']}, **수평 점근선**은 {current_problem['ha_ans']} 입니다.")
+        va_ans, ha_ans = current_problem['va_ans'], current_problem['ha_ans']
+        st.markdown(f"**정답: 수직 점근선**은 {va_ans}, **수평 점근선**은 {ha_ans} 입니다.")
         st.markdown("---")
         st.markdown("**상세 풀이:**")
         st.markdown(current_problem['explanation'])
@@ -318,11 +257,7 @@ def quiz_tab():
     st.subheader("📈 문제의 유리함수 그래프")
     
     plot_rational_function(
-        current_problem['function'], 
-        current_problem['va_val'], 
-        current_problem['ha_val'], 
-        current_problem['va_ans'].strip('$').replace("x = ", ""), 
-        current_problem['ha_ans'].strip('$').replace("y = ", ""),
+        analyze_rational_function(function_str),
         st.session_state.g_xmin_quiz, st.session_state.g_xmax_quiz, st.session_state.g_ymin_quiz, st.session_state.g_ymax_quiz
     )
 
@@ -345,6 +280,8 @@ def main():
         st.session_state.input_va_quiz = ""
         st.session_state.input_ha_quiz = ""
 
+    backend_selector()
+
     tab1, tab2 = st.tabs(["📊 그래프 분석기", "📝 유리함수 문제 풀이"])
     
     with tab1:
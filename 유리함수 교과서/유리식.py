@@ -1,11 +1,17 @@
 import streamlit as st
-# numer와 denom을 명시적으로 import
-from sympy import symbols, simplify, numer, denom
-from sympy.parsing.mathematica import parse_mathematica
-import random
+import sys
+from pathlib import Path
 
-# 변수 정의
-x = symbols('x')
+# 저장소 최상위의 공용 모듈을 불러오기 위한 경로 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from grading import is_equivalent
+from metrics import set_page, span
+from rational_parser import ParseError, parse_rational
+from rational_practice import prefetch_problem, solve_problem
+from warmup import start_warm_up
+
+# 서버 예열 (프로세스당 한 번, 백그라운드)
+start_warm_up()
 
 ## --- 1. 개념 설명 함수 ---
 def display_concept():
@@ -33,53 +39,32 @@ def display_concept():
 # ---
 
 ## --- 2. 문제 생성 및 풀이 함수 ---
-def generate_problem():
-    st.header("🔢 유리식의 계산 문제")
-
-    # 문제 유형 선택 (간단한 덧셈/뺄셈)
-    op = random.choice(['+', '-'])
-
-    # 난이도 조절을 위한 계수 설정
-    a, b, c, d = random.sample(range(1, 5), 4)
-    
-    # 분모 생성 (x에 대한 1차식)
-    denominator_A_expr = (x + a)
-    denominator_B_expr = (x + b)
+def next_problem():
+    """미리 뽑아 둔 다음 문제로 바꾸고, 그다음 문제를 다시 미리 계산해 둠 ('새 문제 생성' 버튼 콜백)"""
+    st.session_state.practice_problem = st.session_state.practice_next
+    st.session_state.practice_next = prefetch_problem()
+    st.session_state.answer_input = ""
 
-    # 분자 생성
-    numerator_A_coeffs = [random.randint(1, 5), random.randint(0, 5)]
-    numerator_B_coeffs = [random.randint(1, 5), random.randint(0, 5)]
 
-    numerator_A = numerator_A_coeffs[0] * x + numerator_A_coeffs[1]
-    numerator_B = numerator_B_coeffs[0] * x + numerator_B_coeffs[1]
+def generate_problem():
+    st.header("🔢 유리식의 계산 문제")
 
-    # 문제 식 구성
-    problem_expr_A = numerator_A / denominator_A_expr
-    problem_expr_B = numerator_B / denominator_B_expr
+    # 현재 문제는 정수 튜플로 세션에 고정 (다시 실행되어도 같은 문제로 채점)
+    if 'practice_problem' not in st.session_state:
+        st.session_state.practice_problem = prefetch_problem()
+        st.session_state.practice_next = prefetch_problem()
 
-    if op == '+':
-        problem_latex = f"\\frac{{{numerator_A}}}{{{denominator_A_expr}}} + \\frac{{{numerator_B}}}{{{denominator_B_expr}}}"
-        solution_expr = problem_expr_A + problem_expr_B
-    else:
-        problem_latex = f"\\frac{{{numerator_A}}}{{{denominator_A_expr}}} - \\frac{{{numerator_B}}}{{{denominator_B_expr}}}"
-        solution_expr = problem_expr_A - problem_expr_B
+    # 문제 LaTeX와 약분된 모범 답안은 문제마다 한 번만 계산 (모든 세션 공유 캐시)
+    problem = solve_problem(st.session_state.practice_problem)
 
     # 문제 표시
     st.subheader("다음 유리식을 계산하고, 결과를 기약분수 형태로 나타내시오.")
-    st.latex(problem_latex)
+    st.latex(problem["problem_latex"])
     
     # 사용자 입력
     st.info("입력 형식 예시: (2*x+1)/(x+3) (괄호를 사용하여 분자/분모를 명확히 구분해주세요)")
     user_answer = st.text_input("계산 결과를 입력하세요", key="answer_input")
 
-    # 정답 계산 (sympy 사용)
-    simplified_solution = simplify(solution_expr)
-    
-    # 분자와 분모를 안전하게 분리 (Poly 대신 numer/denom 사용)
-    # 이 부분이 이전의 'PolynomialError'를 해결합니다.
-    final_num = numer(simplified_solution)
-    final_den = denom(simplified_solution)
-
     # 정답 확인 버튼
     if st.button("정답 확인"):
         if not user_answer:
@@ -87,14 +72,13 @@ def generate_problem():
             return
 
         try:
-            # 사용자의 입력 식을 sympy 객체로 변환 및 단순화
-            user_expr_raw = parse_mathematica(user_answer)
-            user_simplified = simplify(user_expr_raw)
-
-            # 정답과 사용자 답의 차이가 0인지 확인 (수학적으로 동등한지 확인)
-            difference = simplify(user_simplified - simplified_solution)
+            # 사용자의 입력 식을 분자/분모 계수로 변환 (잘못된 곳은 ParseError로 위치를 알려줌)
+            user_expr_raw = parse_rational(user_answer)
 
-            if difference == 0:
+            # 정답과 수학적으로 동등한지 확인 (두 계수 쌍의 교차곱으로 정확히 비교)
+            with span("grade", detail=user_answer):
+                is_correct = is_equivalent(user_expr_raw, problem["solution"])
+            if is_correct:
                 st.balloons()
                 st.success("🎉 **정답입니다!**")
             else:
@@ -102,20 +86,24 @@ def generate_problem():
             
             st.markdown("---")
             st.subheader("모범 답안")
-            st.latex(f"\\frac{{{final_num}}}{{{final_den}}}")
+            st.latex(problem["solution_latex"])
             st.caption(f"($x$가 분모를 0으로 만들지 않는다는 가정 하에)")
 
+        except ParseError as e:
+            st.error(f"입력 형식이 올바르지 않습니다 ({e})")
+            st.code(e.pointer(), language=None)
+
         except Exception as e:
             st.error(f"입력 형식이 올바르지 않거나 파싱 중 오류가 발생했습니다. 입력 형식을 확인해주세요. (에러: {e})")
 
-    # 새 문제 버튼
-    if st.button("새 문제 생성"):
-        st.experimental_rerun()
+    # 새 문제 버튼 (미리 계산해 둔 문제로 바로 교체)
+    st.button("새 문제 생성", on_click=next_problem)
 
 # ---
 
 ## --- 3. Streamlit 메인 함수 ---
 def main():
+    set_page(__file__)
     st.set_page_config(layout="wide", page_title="유리식 학습 앱")
     st.title("📚 유리식 개념 및 연산 학습 앱")
     st.caption("고등학교 수학 (하) 과정")